@@ -0,0 +1,113 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Time the buff generation pass against one call per generation category.
+
+Builds a synthetic fight of 50 players each reporting 120 buffs in the six
+squad/group/self generation categories and times recording them into the
+fact store both ways.
+
+Usage:
+	python benchmarks/bench_buff_generation.py [players] [buffs] [repeats]
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser_functions
+from parser_functions import fact_store, get_buff_generation, get_buffs_data
+
+
+CATEGORIES = ('squadBuffs', 'groupBuffs', 'selfBuffs', 'squadBuffsActive', 'groupBuffsActive', 'selfBuffsActive')
+
+
+def build_fight(players: int, buffs: int) -> list:
+	rng = random.Random(5)
+	buff_map = {f"b{1000 + i}": {'name': f"Buff {i}", 'stacking': i % 3 == 0} for i in range(buffs)}
+	get_buffs_data(buff_map)
+	fight = []
+	for _ in range(players):
+		player = {}
+		for category in CATEGORIES:
+			player[category] = [
+				{'id': 1000 + i, 'buffData': [{'generation': rng.random() * 50, 'wasted': rng.random() * 5}]}
+				for i in range(buffs)
+			]
+		fight.append(player)
+	return fight
+
+
+def legacy_buff_generation(fight_num, player, stat_category, player_id, duration, buff_data, squad_count, group_count):
+	"""The per category collector this pass replaced."""
+	for buff in player.get(stat_category, []):
+		buff_id = 'b'+str(buff['id'])
+		buff_stacking = buff_data[buff_id].get('stacking', False)
+		buff_generation = buff['buffData'][0].get('generation', 0)
+		buff_wasted = buff['buffData'][0].get('wasted', 0)
+		if buff_stacking:
+			if stat_category == 'squadBuffs':
+				buff_generation *= duration * (squad_count - 1)
+				buff_wasted *= duration * (squad_count - 1)
+			elif stat_category == 'groupBuffs':
+				buff_generation *= duration * (group_count - 1)
+				buff_wasted *= duration * (group_count - 1)
+			elif stat_category == 'selfBuffs':
+				buff_generation *= duration
+				buff_wasted *= duration
+		else:
+			if stat_category == 'squadBuffs':
+				buff_generation = (buff_generation / 100) * duration * (squad_count-1)
+				buff_wasted = (buff_wasted / 100) * duration * (squad_count-1)
+			elif stat_category == 'groupBuffs':
+				buff_generation = (buff_generation / 100) * duration * (group_count-1)
+				buff_wasted = (buff_wasted / 100) * duration * (group_count-1)
+			elif stat_category == 'selfBuffs':
+				buff_generation = (buff_generation / 100) * duration
+				buff_wasted = (buff_wasted / 100) * duration
+		fact_store.add(fight_num, player_id, stat_category, buff_id, (('generation', buff_generation), ('wasted', buff_wasted)))
+
+
+def run_legacy(fight: list) -> None:
+	for player_id, player in enumerate(fight):
+		for category in CATEGORIES:
+			duration = 180000 if category in ('squadBuffs', 'groupBuffs', 'selfBuffs') else 150000
+			legacy_buff_generation(1, player, category, player_id, duration, parser_functions.buff_data, 50, 5)
+	fact_store.clear()
+
+
+def run_batched(fight: list) -> None:
+	for player_id, player in enumerate(fight):
+		get_buff_generation(1, player, player_id, 180000, 150000, 50, 5)
+	fact_store.clear()
+
+
+if __name__ == '__main__':
+	players = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+	buffs = int(sys.argv[2]) if len(sys.argv) > 2 else 120
+	repeats = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+	fight = build_fight(players, buffs)
+	legacy = min(timeit.repeat(lambda: run_legacy(fight), number=1, repeat=repeats))
+	batched = min(timeit.repeat(lambda: run_batched(fight), number=1, repeat=repeats))
+
+	print(f"{players} players, {buffs} buffs in {len(CATEGORIES)} categories")
+	print(f"per category: {legacy * 1000:.1f} ms per fight")
+	print(f"batched:      {batched * 1000:.1f} ms per fight ({legacy / batched:.2f}x)")
@@ -0,0 +1,203 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+"""Measure the drag and drop json size of the charts with shared dataset tiddlers.
+
+Builds a large synthetic night and renders the detailed category reports,
+whose per stat charts share one dataset tiddler, and the fight line charts,
+whose series are written to a dataset tiddler. The same charts are also
+rendered with the data inline in every chart, as they were before the
+dataset tiddlers, and both are sized as written by TiddlerJsonWriter. The
+fight line charts are sized again with their series downsampled.
+
+Usage:
+	python benchmarks/bench_chart_datasets.py [players] [fights]
+"""
+
+import contextlib
+import io
+import json
+import os
+import random
+import re
+import sys
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config_output
+from bench_tid_tables import build_night
+from output_functions import build_category_summary_report, build_fight_line_chart
+
+
+FIGHT_SECONDS = 300
+FIGHT_PLAYERS = 50
+CHART_BLOCK = re.compile(r'<\$echarts \$text=(```|""")[\s\S]*?\1')
+TOGGLES = ["Total", "Stat/1s", "Stat/60s"]
+
+
+def build_fights(top_stats: dict, fights: int) -> dict:
+	"""Return the fight_data of `fights` fights, each with FIGHT_PLAYERS players of the night."""
+	rng = random.Random(7)
+	players = list(top_stats["player"].values())
+	fight_data = {}
+	for fight_num in range(1, fights + 1):
+		fight = {
+			"damage1S": array('q', (rng.randint(0, 10 ** 6) for _ in range(FIGHT_SECONDS))),
+			"damageTaken1S": array('q', (rng.randint(0, 10 ** 6) for _ in range(FIGHT_SECONDS))),
+			"players": {},
+		}
+		for player in rng.sample(players, min(FIGHT_PLAYERS, len(players))):
+			chart_key = f"{player['account']}-{player['profession']}-{player['name']}"
+			fight["players"][chart_key] = {"damage1S": array('q', (rng.randint(0, 10 ** 5) for _ in range(FIGHT_SECONDS)))}
+		fight_data[fight_num] = fight
+	return fight_data
+
+
+def legacy_category_chart(format_stat: str, caption: str, sorted_chart: list) -> str:
+	"""A per stat chart of build_category_summary_report(layout="detailed") before the dataset tiddlers."""
+	json_chart = json.dumps(sorted_chart)
+	return f"""<$echarts $text=```
+option = {{
+  title: {{ text: '{format_stat}', subtext: '{caption}' }},
+  tooltip: {{ trigger: 'axis' }},
+  legend: {{ selected: {{ "Stat/1s": false, "Total": true, "Stat/60s":false }}, top:'10%' }},
+  dataset: {{
+    dimensions: ["Party", "Name", "Profession", "Total", "Stat/1s", "Stat/60s"],
+    source: {json_chart}
+  }},
+  xAxis: {{}},
+  yAxis: {{ type: 'category', inverse: true }},
+  grid: {{ top: '15%', containLabel: true }},
+  series: [
+    {{ type: 'bar', name: 'Total', encode: {{ x: 'Total', y: 'Name' }} }},
+    {{ type: 'bar', name: 'Stat/1s', encode: {{ x: 'Stat/1s', y: 'Name' }} }},
+    {{ type: 'bar', name: 'Stat/60s', encode: {{ x: 'Stat/60s', y: 'Name' }} }}
+  ],
+  dataZoom: [
+    {{ type: 'slider', yAxisIndex: 0, start: 0, end: 50 }},
+    {{ type: 'inside', yAxisIndex: 0 }}
+  ]
+}};
+```"""
+
+
+def legacy_category_charts(dataset: dict, table: dict, caption: str, sort_mode: str) -> list:
+	"""The per stat charts with their rows inline, sorted as before."""
+	dimensions = dataset["dimensions"]
+	charts = []
+	for stat in table:
+		columns = [dimensions.index(f"{stat} {toggle}") for toggle in TOGGLES]
+		chart_data = [
+			{"Party": row[0], "Name": row[1], "Prof": row[2], "FightTime": row[3], **{toggle: row[column] for toggle, column in zip(TOGGLES, columns)}}
+			for row in dataset["source"]
+		]
+		chart_data.sort(key=lambda x: x.get(sort_mode, 0), reverse=True)
+		charts.append(legacy_category_chart(stat[0].upper() + stat[1:], caption, chart_data))
+	return charts
+
+
+def legacy_fight_chart(fight: dict, chart_title: str) -> str:
+	"""The line chart of build_fight_line_chart before the dataset tiddlers, series inline."""
+	outgoing_damage_data = fight["damage1S"].tolist()
+	series = [("Outgoing Damage", outgoing_damage_data, "dodgerblue"), ("Incoming Damage", fight["damageTaken1S"].tolist(), "khaki")]
+	text = f"""<$echarts $text=\"\"\"
+		option = {{
+		title: {{ text: '{chart_title}', left: 'center' }},
+		xAxis: {{ type: 'category', name: 'Fight Time', data: {list(range(len(outgoing_damage_data)))} }},
+		yAxis: {{ type: 'value', name: 'Damage' }},
+		series: ["""
+	for name, data, color in series:
+		text += f"\n\t\t{{ name: '{name}', data: {data}, type: 'line', smooth: true, itemStyle: {{ color: '{color}' }}, emphasis: {{ focus: 'series' }} }},"
+	for player, player_data in fight["players"].items():
+		player_name = player.split("-")[1][:3]+" - "+player.split("-")[2]
+		text += f"\n\t\t{{ name: '{player_name}', data: {player_data['damage1S'].tolist()}, type: 'line', smooth: true, emphasis: {{ focus: 'series' }} }},"
+	return text + '\n    ]\n    };\n\n"""'
+
+
+def written_size(tiddlers: list) -> int:
+	"""Bytes the tiddlers take in the drag and drop json, as TiddlerJsonWriter writes them."""
+	size = 0
+	for tiddler in tiddlers:
+		text = json.dumps(tiddler, indent=4, sort_keys=True)
+		# Every line indented under the list, and the ",\n" separator
+		size += len(text) + 4 * (text.count("\n") + 1) + 2
+	return size
+
+
+def inline(tiddler: dict, charts: list) -> dict:
+	"""Return a copy of a chart tiddler with its chart blocks replaced by inline charts."""
+	charts = iter(charts)
+	text = CHART_BLOCK.sub(lambda match: next(charts), tiddler["text"])
+	return dict(tiddler, text=text)
+
+
+def main() -> None:
+	players = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+	fights = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+	top_stats = build_night(players)[0]
+	fight_data = build_fights(top_stats, fights)
+
+	tid_list = []
+	tables = (("Defenses", config_output.defenses_table), ("Support", config_output.support_table), ("Offensive", config_output.offensive_table))
+	with contextlib.redirect_stdout(io.StringIO()):
+		for caption, table in tables:
+			build_category_summary_report(top_stats, table, False, caption, "bench", tid_list, layout="detailed", sort_mode="Total")
+		build_fight_line_chart(fight_data, "bench", tid_list)
+	tiddlers = {tiddler["title"]: tiddler for tiddler in tid_list}
+	data = {title: json.loads(tiddler["text"]) for title, tiddler in tiddlers.items() if tiddler.get("type") == "application/json"}
+
+	results = []
+	for caption, table in tables:
+		chart = tiddlers[f"bench-{caption}-Detailed"]
+		dataset = data[f"bench-{caption}-Detailed-Data"]
+		assert len(dataset["source"]) == players and len(dataset["dimensions"]) == 4 + 3 * len(table), caption
+		shared = [chart, tiddlers[f"bench-{caption}-Detailed-Data"]]
+		legacy = [inline(chart, legacy_category_charts(dataset, table, caption, "Total"))]
+		results.append((f"{caption} - Detailed", shared, legacy))
+
+	shared, legacy = [], []
+	for fight_num, fight in fight_data.items():
+		title = f"bench_Fight_{str(fight_num).zfill(2)}_Damage_Output_Review"
+		dataset = data[f"{title}_Data"]
+		assert dataset["source"][0] == ["Outgoing Damage", fight["damage1S"].tolist()] and len(dataset["source"]) == 2 + len(fight["players"]), title
+		shared += [tiddlers[title], tiddlers[f"{title}_Data"]]
+		legacy.append(inline(tiddlers[title], [legacy_fight_chart(fight, f"Fight-{str(fight_num).zfill(2)}: Damage Output Review")]))
+	results.append((f"Fight line charts ({fights})", shared, legacy))
+
+	print(f"{players} players, {fights} fights of {FIGHT_SECONDS}s")
+	total_shared = total_legacy = 0
+	for name, shared, legacy in results:
+		shared_size, legacy_size = written_size(shared), written_size(legacy)
+		total_shared += shared_size
+		total_legacy += legacy_size
+		print(f"{name:28} inline {legacy_size / 1e6:6.2f} MB, shared datasets {shared_size / 1e6:6.2f} MB ({1 - shared_size / legacy_size:.0%} smaller)")
+	print(f"{'Total':28} inline {total_legacy / 1e6:6.2f} MB, shared datasets {total_shared / 1e6:6.2f} MB ({1 - total_shared / total_legacy:.0%} smaller)")
+
+	# The fight line charts again, with the series downsampled
+	full_size = written_size(results[-1][1])
+	for points in (FIGHT_SECONDS // 2, FIGHT_SECONDS // 5):
+		downsampled = []
+		with contextlib.redirect_stdout(io.StringIO()):
+			build_fight_line_chart(fight_data, "bench", downsampled, max_points=points)
+		size = written_size(downsampled)
+		print(f"{'Fight charts, ' + str(points) + ' points':28} every second {full_size / 1e6:6.2f} MB, downsampled {size / 1e6:6.2f} MB ({1 - size / full_size:.0%} smaller)")
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,101 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+"""Time the numeric helpers against the loops they replaced.
+
+Builds a random cumulative damage series of one player and times the
+per tick deltas, the moving average and the 1 to 20 second burst maxima
+with the old loops, the pure Python helpers and, when it is installed,
+NumPy.
+
+Usage:
+	python benchmarks/bench_numeric.py [ticks] [repeats]
+"""
+
+import os
+import random
+import sys
+import timeit
+from itertools import accumulate
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numeric
+
+
+WINDOWS = range(1, 21)
+
+
+def legacy_diff(cumulative: list) -> list:
+	per_tick = [cumulative[0]]
+	for tick in range(len(cumulative) - 1):
+		per_tick.append(cumulative[tick + 1] - cumulative[tick])
+	return per_tick
+
+
+def legacy_moving_average(data: list, window_size: int) -> list:
+	ma = []
+	for i in range(len(data)):
+		start_index = max(0, i - window_size)
+		end_index = min(len(data), i + window_size)
+		sub_data = data[start_index:end_index + 1]
+		ma.append(sum(sub_data) / len(sub_data))
+	return ma
+
+
+def legacy_windowed_maxes(cumulative: list, windows) -> list:
+	maxes = []
+	for window in windows:
+		best = None
+		for tick in range(window, len(cumulative)):
+			dmg = cumulative[tick] - cumulative[tick - window]
+			best = dmg if best is None else max(dmg, best)
+		maxes.append(best)
+	return maxes
+
+
+def main() -> None:
+	ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 900
+	repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+	rng = random.Random(7)
+	per_tick = [rng.randint(0, 20000) if rng.random() < 0.6 else 0 for _ in range(ticks)]
+	cumulative = list(accumulate(per_tick))
+
+	cases = [
+		("diff", lambda: legacy_diff(cumulative), lambda: numeric.diff(cumulative), None),
+		("moving average (w=1)", lambda: legacy_moving_average(per_tick, 1), lambda: numeric._py_moving_average(per_tick, 1), lambda: numeric._np_moving_average(per_tick, 1)),
+		("moving average (w=10)", lambda: legacy_moving_average(per_tick, 10), lambda: numeric._py_moving_average(per_tick, 10), lambda: numeric._np_moving_average(per_tick, 10)),
+		("burst maxes 1-20s", lambda: legacy_windowed_maxes(cumulative, WINDOWS), lambda: numeric._py_windowed_maxes(cumulative, WINDOWS), lambda: numeric._np_windowed_maxes(cumulative, WINDOWS)),
+	]
+
+	print(f"{ticks} ticks, {repeats} repeats, numpy {'available' if numeric.HAVE_NUMPY else 'not installed'}")
+	for name, legacy, python, vectorized in cases:
+		expected = legacy()
+		assert python() == expected, name
+		legacy_time = timeit.timeit(legacy, number=repeats)
+		python_time = timeit.timeit(python, number=repeats)
+		line = f"{name:24} loop {legacy_time * 1000:8.1f} ms  python {python_time * 1000:8.1f} ms ({legacy_time / python_time:5.1f}x)"
+		if numeric.HAVE_NUMPY and vectorized is not None:
+			assert vectorized() == expected, name
+			numpy_time = timeit.timeit(vectorized, number=repeats)
+			line += f"  numpy {numpy_time * 1000:8.1f} ms ({legacy_time / numpy_time:5.1f}x)"
+		print(line)
+
+
+if __name__ == '__main__':
+	main()
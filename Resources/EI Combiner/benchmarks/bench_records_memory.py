@@ -0,0 +1,98 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Compare the memory held by per-player accumulators as dicts and as slotted records.
+
+Builds DPSStats, stacking uptime, death on tag and damage mitigation entries
+for a number of player/profession combos in both representations and reports
+the traced allocation of each.
+
+Usage:
+	python benchmarks/bench_records_memory.py [players] [skills_per_player]
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from records import DamageMitigationRecord, DeathOnTagRecord, DPSRecord, StackingUptimeRecord, to_plain
+
+
+CHUNK_DAMAGE_SECONDS = 21
+BOONS = ("Might", "Fury", "Quickness", "Alacrity", "Protection", "Regeneration", "Vigor", "Aegis", "Stability", "Swiftness", "Resistance", "Resolution")
+MITIGATION_FIELDS = DamageMitigationRecord.__slots__
+
+
+def build_dicts(players: int, skills: int) -> list:
+	dps, uptime, deaths, mitigation = {}, {}, {}, {}
+	for i in range(players):
+		account, name, prof = f"Player.{i:04d}", f"Name {i}", "Firebrand"
+		dps[i] = {
+			"account": account, "name": name, "profession": prof,
+			"duration": 0, "combatTime": 0, "coordinationDamage": 0,
+			"chunkDamage": [0] * CHUNK_DAMAGE_SECONDS, "chunkDamageTotal": [0] * CHUNK_DAMAGE_SECONDS,
+			"carrionDamage": 0, "carrionDamageTotal": 0, "damageTotal": 0, "squadDamageTotal": 0,
+			"burstDamage": [0] * CHUNK_DAMAGE_SECONDS, "ch5CaBurstDamage": [0] * CHUNK_DAMAGE_SECONDS,
+			"downs": 0, "kills": 0,
+		}
+		entry = {
+			"account": account, "name": name, "profession": prof,
+			"duration_Might": 0, "duration_Stability": 0, "Might": [0] * 26, "Stability": [0] * 26,
+		}
+		for boon in BOONS:
+			entry["damage_with_"+boon] = [0] * 26 if boon == "Might" else [0] * 2
+		uptime[i] = entry
+		deaths[i] = {
+			"name": name, "profession": prof, "account": account, "distToTag": [],
+			"On_Tag": 0, "Off_Tag": 0, "Run_Back": 0, "After_Tag_Death": 0, "Total": 0, "Ranges": [],
+		}
+		mitigation[i] = {f"Skill {s}": {field: 0 for field in MITIGATION_FIELDS} for s in range(skills)}
+	return [dps, uptime, deaths, mitigation]
+
+
+def build_records(players: int, skills: int) -> list:
+	dps, uptime, deaths, mitigation = {}, {}, {}, {}
+	for i in range(players):
+		account, name, prof = f"Player.{i:04d}", f"Name {i}", "Firebrand"
+		dps[i] = DPSRecord(account, name, prof, CHUNK_DAMAGE_SECONDS)
+		uptime[i] = StackingUptimeRecord(account, name, prof, BOONS)
+		deaths[i] = DeathOnTagRecord(name, prof, account)
+		mitigation[i] = {f"Skill {s}": DamageMitigationRecord() for s in range(skills)}
+	return [dps, uptime, deaths, mitigation]
+
+
+def traced_size(build, players: int, skills: int) -> tuple:
+	tracemalloc.start()
+	data = build(players, skills)
+	current, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return current, data
+
+
+if __name__ == '__main__':
+	players = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+	skills = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+
+	dict_bytes, dict_data = traced_size(build_dicts, players, skills)
+	record_bytes, record_data = traced_size(build_records, players, skills)
+	assert [to_plain(records) for records in record_data] == dict_data, "records do not convert back to the dict layout"
+
+	print(f"{players} players, {skills} mitigation skills each")
+	print(f"dicts:   {dict_bytes / 1024:,.0f} KiB")
+	print(f"records: {record_bytes / 1024:,.0f} KiB ({record_bytes / dict_bytes:.0%} of dicts)")
@@ -0,0 +1,162 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+"""Time TID generation of the table builders on a large synthetic night.
+
+Builds the top_stats of a night with many players and times the category
+summaries, uptime, healing and DPS stats tiddlers, which render their rows
+through tw_table. The DPS stats rows are also rendered with the f-string
+loop they replaced, to compare the two on the same data.
+
+Usage:
+	python benchmarks/bench_tid_tables.py [players] [repeats]
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config_output
+import output_functions
+from output_functions import (
+	build_category_summary_report, build_dps_stats_tids, build_healing_summary, build_uptime_summary,
+)
+
+
+PROFESSIONS = ["Firebrand", "Scourge", "Chronomancer", "Herald", "Mirage", "Tempest", "Spellbreaker", "Vindicator"]
+HEAL_STATS = ("healing", "downed_healing", "barrier")
+HEAL_PREFIXES = ("", "squad_", "group_", "self_", "off_squad_")
+DPS_TABS = {"Ch-Total": "chunkDamage", "Ch-DPS": "chunkDamage", "Bur-Total": "burstDamage", "Bur-DPS": "burstDamage", "Ch5Ca-Total": "ch5CaBurstDamage", "Ch5Ca-DPS": "ch5CaBurstDamage"}
+
+
+def build_night(players: int) -> tuple:
+	"""Return (top_stats, buff_data, DPSStats) for a night of `players` players."""
+	rng = random.Random(11)
+	tables = (config_output.defenses_table, config_output.support_table, config_output.offensive_table)
+	categories = {category for table in tables for category in table.values()}
+	stats = {stat for table in tables for stat in table}
+	boons = config_output.boons
+	buff_data = {boon_id: {"name": name, "icon": f"{name}.png", "stacking": False} for boon_id, name in boons.items()}
+
+	top_stats = {"player": {}, "players_running_healing_addon": [], "overall": {"active_time": 0, "buffUptimes": {"group": {}}, "group_data": {}}}
+	dps_stats = {}
+	for index in range(players):
+		profession = rng.choice(PROFESSIONS)
+		name, account = f"Player{index}", f"Acct{index}.{1000 + index}"
+		group = rng.randint(1, 10)
+		active_time = rng.randint(60000, 7200000)
+		player = {
+			"name": name, "profession": profession, "account": account, "last_party": group, "active_time": active_time,
+			"buffUptimes": {boon_id: {"uptime_ms": rng.randint(0, active_time), "resist_reduction": 0} for boon_id in boons if rng.random() < 0.8},
+		}
+		for category in categories:
+			player[category] = {stat: rng.randint(1, 100000) for stat in stats}
+		player["extHealingStats"] = {prefix + stat: rng.randint(0, 500000) for prefix in HEAL_PREFIXES for stat in ("healing", "downed_healing")}
+		player["extBarrierStats"] = {prefix + "barrier": rng.randint(0, 200000) for prefix in HEAL_PREFIXES}
+		player["extHealingStats"]["outgoing_healing"] = player["extHealingStats"].pop("healing")
+		player["extBarrierStats"]["outgoing_barrier"] = player["extBarrierStats"].pop("barrier")
+		name_prof = f"{name}|{profession}|{account}"
+		top_stats["player"][name_prof] = player
+		top_stats["players_running_healing_addon"].append(name_prof)
+
+		overall = top_stats["overall"]
+		overall["active_time"] += active_time
+		overall["group_data"].setdefault(group, {"fight_time": 0})["fight_time"] += active_time
+		group_uptimes = overall["buffUptimes"]["group"].setdefault(group, {})
+		for boon_id, uptime in player["buffUptimes"].items():
+			for uptimes in (overall["buffUptimes"], group_uptimes):
+				uptimes.setdefault(boon_id, {"uptime_ms": 0, "resist_reduction": 0})["uptime_ms"] += uptime["uptime_ms"]
+
+		dps_stats[f"{profession} {name} {account}"] = {
+			"name": name, "profession": profession, "account": account, "duration": active_time // 1000,
+			"damageTotal": rng.randint(0, 5000) * (active_time // 1000),
+			"chunkDamage": [rng.randint(0, 10 ** 6) for _ in range(21)],
+			"burstDamage": [rng.randint(0, 10 ** 6) for _ in range(21)],
+			"ch5CaBurstDamage": [rng.randint(0, 10 ** 6) for _ in range(21)],
+		}
+	return top_stats, buff_data, dps_stats
+
+
+def legacy_dps_rows(sorted_players: list, tab: str) -> list:
+	"""The row loop of build_dps_stats_tids before tw_table."""
+	rows = []
+	for stats in sorted_players:
+		player = stats["name"]
+		profession = stats["profession"]
+		account = stats["account"]
+		fightTime = stats['duration']
+		DPS = '<span data-tooltip="'+f"{stats['damageTotal']:,.0f}"+' total damage">'+f"{round(stats['damageTotal'] / fightTime):,.0f}</span>"
+		TOTAL = '<span data-tooltip="'+f"{stats['damageTotal']:,.0f}"+' total damage">'+f"{stats['damageTotal']:,.0f}</span>"
+		row = f"|<span data-tooltip='{account}'>{player}</span> | {{{{{profession}}}}} {profession[:3]}| {fightTime} | {DPS} | {TOTAL}|"
+		for i in range(1, 11):
+			value = stats[DPS_TABS[tab]][i]
+			if tab == "Ch-DPS":
+				row += ' <span data-tooltip="'+f"{value:,.0f}"+f' chunk({i}) damage">'+f"{round(value / fightTime):,.0f}</span>|"
+			elif tab == "Ch-Total":
+				row += ' <span data-tooltip="'+f"{round(value / fightTime):,.0f}"+f' chunk({i}) damage">'+f"{value:,.0f}</span>|"
+			elif tab in ["Bur-Total","Ch5Ca-Total"]:
+				row += ' <span data-tooltip="'+f"{round(value / i):,.0f}"+f' chunk({i}) damage">'+f"{value:,.0f}</span>|"
+			else:
+				row += ' <span data-tooltip="'+f"{value:,.0f}"+f' chunk({i}) damage">'+f"{round(value / i):,.0f}</span>|"
+		rows.append(row)
+	return rows
+
+
+def build_tables(top_stats: dict, buff_data: dict, dps_stats: dict) -> list:
+	"""Run the table builders once and return the tiddlers they made."""
+	tid_list = output_functions.tid_list
+	del tid_list[:]
+	for caption, table in (("Defenses", config_output.defenses_table), ("Support", config_output.support_table), ("Offensive", config_output.offensive_table)):
+		for layout in ("summary", "detailed"):
+			build_category_summary_report(top_stats, table, False, caption, "bench", tid_list, layout=layout, sort_mode="Total")
+	build_uptime_summary(top_stats, config_output.boons, buff_data, "Uptimes", "bench")
+	build_healing_summary(top_stats, "Heal Stats", "bench")
+	build_dps_stats_tids(dps_stats, "bench", tid_list)
+	return list(tid_list)
+
+
+def main() -> None:
+	players = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+	repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+	top_stats, buff_data, dps_stats = build_night(players)
+
+	with contextlib.redirect_stdout(io.StringIO()):
+		tiddlers = build_tables(top_stats, buff_data, dps_stats)
+		total = timeit.timeit(lambda: build_tables(top_stats, buff_data, dps_stats), number=repeats) / repeats
+	size = sum(len(tiddler["text"]) for tiddler in tiddlers)
+	print(f"{players} players: {len(tiddlers)} tiddlers, {size / 1e6:.1f} MB of text in {total * 1000:.0f} ms per run")
+
+	# Rows of the DPS stats tabs through tw_table and through the old f-string loop
+	shown = [stats for stats in dps_stats.values() if stats["damageTotal"] / stats["duration"] >= 500]
+	sorted_players = sorted(shown, key=lambda stats: stats["damageTotal"] / stats["duration"], reverse=True)
+	dps_tids = {tiddler["title"]: tiddler["text"] for tiddler in tiddlers if "-DPS-Stats-" in tiddler["title"]}
+	for tab in DPS_TABS:
+		assert dps_tids[f"bench-DPS-Stats-{tab}"].endswith("\n".join(legacy_dps_rows(sorted_players, tab))), tab
+	with contextlib.redirect_stdout(io.StringIO()):
+		table_time = timeit.timeit(lambda: build_dps_stats_tids(dps_stats, "bench", []), number=repeats) / repeats
+	legacy_time = timeit.timeit(lambda: [legacy_dps_rows(sorted_players, tab) for tab in DPS_TABS], number=repeats) / repeats
+	print(f"DPS stats tabs: f-string rows {legacy_time * 1000:.0f} ms, tw_table tiddlers {table_time * 1000:.0f} ms ({legacy_time / table_time:.1f}x)")
+
+
+if __name__ == '__main__':
+	main()
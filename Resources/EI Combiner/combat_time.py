@@ -0,0 +1,132 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+import math
+
+
+class CombatStartCursor:
+	"""Find the combat starts of a player from its health and power damage series.
+
+	Combat starts at the first health loss, or the first change in power
+	damage, at or after a given time. Both series are walked with cursors
+	that only move forward, so finding every start of a fight (one at the
+	beginning and one after each death) costs a single pass over each series
+	instead of a rescan from index 0 per start.
+
+	Starts must be requested with non decreasing times; an earlier time
+	rewinds the cursors to the beginning.
+
+	Args:
+		player_json (dict): The player's JSON data containing 'healthPercents' and 'powerDamage1S'.
+	"""
+
+	__slots__ = ("player_json", "_health_index", "_damage_index", "_last_time")
+
+	def __init__(self, player_json: dict) -> None:
+		self.player_json = player_json
+		self._health_index = 0
+		self._damage_index = 1
+		self._last_time = 0
+
+	def next_start(self, initial_time: int) -> int:
+		"""
+		Return the start of combat at or after a time.
+
+		Args:
+			initial_time (int): The timestamp to start checking from.
+
+		Returns:
+			int: The timestamp of the combat start, or -1 if no combat is found.
+		"""
+		player_json = self.player_json
+		if 'healthPercents' not in player_json:
+			return -1
+		if initial_time < self._last_time:
+			self._health_index = 0
+			self._damage_index = 1
+		self._last_time = initial_time
+
+		start_combat = -1
+		# A health entry is a loss if it is below the entry before it, or 100 for the first one.
+		# The cursor stops on the loss it finds, so a later call can still return it.
+		health = player_json['healthPercents']
+		index = self._health_index
+		while index < len(health) and health[index][0] < initial_time:
+			index += 1
+		while index < len(health):
+			last_health_percent = health[index - 1][1] if index else 100
+			if health[index][1] - last_health_percent < 0:
+				start_combat = health[index][0]
+				break
+			index += 1
+		self._health_index = index
+
+		power_damage = player_json['powerDamage1S'][0]
+		ticks = len(player_json['damage1S'][0])
+		index = max(self._damage_index, math.ceil(initial_time/1000))
+		while index < ticks:
+			if power_damage[index] != power_damage[index - 1]:
+				if start_combat == -1:
+					start_combat = index*1000
+				else:
+					start_combat = min(start_combat, index*1000)
+				break
+			index += 1
+		self._damage_index = index
+		return start_combat
+
+
+def combat_time_breakpoints(player_json: dict) -> list:
+	"""
+	Calculate the combat windows of a player, split at each death.
+
+	Args:
+		player_json (dict): The player's JSON data.
+
+	Returns:
+		list: A list of [start, end] lists, one per combat window.
+	"""
+	cursor = CombatStartCursor(player_json)
+	start_combat = cursor.next_start(0)
+
+	# Check if 'combatReplayData' is available, use 'activeTimes' if not
+	if 'combatReplayData' not in player_json:
+		print("WARNING: combatReplayData not in json, using activeTimes as time in combat")
+		return [[start_combat, player_json.get('activeTimes', 0)]]
+
+	replay = player_json['combatReplayData']
+
+	# Check if 'dead' data is available in replay, use 'activeTimes' if not
+	if 'dead' not in replay:
+		return [[start_combat, player_json.get('activeTimes', 0)]]
+
+	breakpoints = []
+	# A death counts when it ends a down
+	down_ends = set(dict(replay['down']).values())
+	for death_key, death_value in dict(replay['dead']).items():
+		if death_key in down_ends:
+			if start_combat != -1:
+				breakpoints.append([start_combat, death_key])
+			start_combat = cursor.next_start(death_value + 1000)
+
+	# Determine the end of combat based on damage data
+	end_combat = len(player_json['damage1S'][0]) * 1000
+	if start_combat != -1:
+		breakpoints.append([start_combat, end_combat])
+
+	return breakpoints
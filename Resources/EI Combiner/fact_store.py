@@ -0,0 +1,350 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+from array import array
+
+
+# Rollup levels a fact contributes to
+PLAYER = 1
+FIGHT = 2
+OVERALL = 4
+GROUP = 8
+ALL_LEVELS = PLAYER | FIGHT | OVERALL
+# Levels rolled up on first read through top_stats['overall'] rather than at every flush
+DEFERRED_LEVELS = OVERALL | GROUP
+
+# Interned id used when a category has no per key level, e.g. statsAll
+NO_KEY = -1
+NO_GROUP = -1
+
+
+class FactStore:
+	"""Columnar store of additive stat contributions.
+
+	Collectors record every (fight, player, category, key, stat, value)
+	contribution once into typed arrays instead of updating the player, fight
+	and overall dicts of top_stats three times. `flush()` derives those
+	rollups with a grouped reduction and writes them back into the usual
+	top_stats shape, so the build_* functions keep reading plain dicts.
+
+	Players are recorded by their PlayerRegistry id; categories, keys and
+	stats are interned to small integer ids. Values are held as doubles with
+	a flag recording whether the contribution was an int, so sums keep the
+	same type as before.
+
+	Overall sums are not written at flush time. Every overall contribution
+	is also a fight contribution, so the first read of a category through
+	top_stats['overall'], a RollupDict, sums that category of the fights
+	flushed since the last read. Group contributions, recorded per party,
+	are reduced into running totals per (party, key, stat) at flush and
+	written into the category's 'group' dict on the same read.
+	"""
+
+	def __init__(self) -> None:
+		self._names = []
+		self._ids = {}
+		self.fights = array('i')
+		self.players = array('i')
+		self.groups = array('i')
+		self.categories = array('i')
+		self.keys = array('i')
+		self.stats = array('i')
+		self.values = array('d')
+		self.is_int = array('b')
+		self.levels = array('b')
+		# category id -> fights flushed since its last rollup, in flush order
+		self._pending = {}
+		# category id -> names of the stats recorded at the OVERALL level, the ones summed from the fights
+		self._overall_stats = {}
+		# category ids recorded per key, e.g. per buff
+		self._keyed = set()
+		# category id -> {(group, key, stat): total} of the GROUP level, summed in recorded order
+		self._group_totals = {}
+		# category id -> key of its first group contribution, which the 'group' dict follows in overall
+		self._group_anchor = {}
+		# top_stats['fight'] of the flushed fights
+		self._fight_stats = None
+
+	def __len__(self) -> int:
+		return len(self.values)
+
+	def intern(self, name) -> int:
+		"""Return the integer id of a category, key or stat name."""
+		name_id = self._ids.get(name)
+		if name_id is None:
+			name_id = len(self._names)
+			self._names.append(name)
+			self._ids[name] = name_id
+		return name_id
+
+	def name(self, name_id: int):
+		"""Return the name interned under an id."""
+		return self._names[name_id]
+
+	def add(self, fight_num: int, player_id: int, category: str, key, stats, levels: int = ALL_LEVELS, group: int = NO_GROUP) -> None:
+		"""Record the contributions of one player to a category.
+
+		Args:
+			fight_num (int): The fight number.
+			player_id (int): The player's registry id.
+			category (str): The stat category, e.g. 'statsAll'.
+			key: The per skill or buff key within the category, or None for flat categories.
+			stats: Iterable of (stat, value) pairs.
+			levels (int): Bitmask of the rollup levels the contributions feed.
+			group (int): The player's party, required for the GROUP level.
+		"""
+		intern = self.intern
+		category_id = intern(category)
+		key_id = NO_KEY if key is None else intern(key)
+		for stat, value in stats:
+			self.fights.append(fight_num)
+			self.players.append(player_id)
+			self.groups.append(group)
+			self.categories.append(category_id)
+			self.keys.append(key_id)
+			self.stats.append(intern(stat))
+			self.values.append(value)
+			self.is_int.append(type(value) is not float)
+			self.levels.append(levels)
+
+	def add_rows(self, fight_num: int, player_id: int, category: str, stat_names, rows, levels: int = ALL_LEVELS, group: int = NO_GROUP) -> None:
+		"""Record the same stats for several keys of a category at once.
+
+		Args:
+			fight_num (int): The fight number.
+			player_id (int): The player's registry id.
+			category (str): The stat category, e.g. 'squadBuffs'.
+			stat_names (tuple): The stats recorded for every key.
+			rows: Iterable of (key, values) with values in `stat_names` order.
+			levels (int): Bitmask of the rollup levels the contributions feed.
+			group (int): The player's party, required for the GROUP level.
+		"""
+		intern = self.intern
+		category_id = intern(category)
+		stat_ids = array('i', map(intern, stat_names))
+		keys = array('i')
+		values = array('d')
+		is_int = array('b')
+		for key, key_values in rows:
+			key_id = intern(key)
+			for value in key_values:
+				keys.append(key_id)
+				values.append(value)
+				is_int.append(type(value) is not float)
+		row_count = len(values)
+		if not row_count:
+			return
+		self.fights.extend(array('i', [fight_num]) * row_count)
+		self.players.extend(array('i', [player_id]) * row_count)
+		self.groups.extend(array('i', [group]) * row_count)
+		self.categories.extend(array('i', [category_id]) * row_count)
+		self.keys.extend(keys)
+		self.stats.extend(stat_ids * (row_count // len(stat_ids)))
+		self.values.extend(values)
+		self.is_int.extend(is_int)
+		self.levels.extend(array('b', [levels]) * row_count)
+
+	def clear(self) -> None:
+		"""Drop all recorded contributions, keeping the interned names and pending rollups."""
+		for column in (self.fights, self.players, self.groups, self.categories, self.keys, self.stats, self.values, self.is_int, self.levels):
+			del column[:]
+
+	def has_deferred(self, category) -> bool:
+		"""Return True if a category has overall or group sums awaiting rollup."""
+		category_id = self._ids.get(category)
+		return category_id is not None and category_id in self._pending
+
+	def roll_up(self, overall: dict, category=None) -> None:
+		"""Sum the fights flushed since the last rollup into top_stats['overall'].
+
+		The fight sums of a category are added to the values already in
+		overall, fights in flush order and keys in first seen order. The
+		group totals replace the values of the category's 'group' dict.
+
+		Args:
+			overall (dict): top_stats['overall'].
+			category (str): Only roll up this category. Defaults to all of them.
+		"""
+		if category is None:
+			category_ids = list(self._pending)
+		else:
+			category_id = self._ids.get(category)
+			category_ids = [category_id] if category_id in self._pending else []
+
+		names = self._names
+		for category_id in category_ids:
+			fights = self._pending.pop(category_id)
+			name = names[category_id]
+			stat_names = self._overall_stats[category_id]
+			category_stats = dict.setdefault(overall, name, {})
+			for fight_num in fights:
+				fight_category = self._fight_stats[fight_num].get(name, {})
+				if category_id not in self._keyed:
+					_add_stats(category_stats, fight_category, stat_names)
+					continue
+				for key, key_stats in fight_category.items():
+					container = category_stats.get(key)
+					if container is None:
+						if not any(stat in stat_names for stat in key_stats):
+							continue
+						container = category_stats[key] = {}
+					_add_stats(container, key_stats, stat_names)
+
+			group_totals = self._group_totals.get(category_id)
+			if group_totals:
+				if "group" not in category_stats:
+					_insert_after(category_stats, names[self._group_anchor[category_id]], "group", {})
+				group_stats = category_stats["group"]
+				for (group, key, stat), value in group_totals.items():
+					container = group_stats.setdefault(group, {})
+					if key != NO_KEY:
+						container = container.setdefault(names[key], {})
+					container[names[stat]] = value
+
+	def flush(self, top_stats: dict, player_key) -> None:
+		"""Add the recorded contributions to the player and fight rollups and clear the store.
+
+		Contributions are reduced per (level, owner, category, key, stat) in the
+		order they were recorded, starting from the value already in top_stats,
+		so the sums are identical to updating the dicts one contribution at a
+		time. Nested dicts are created in first seen order. Overall and group
+		contributions are deferred until read, see `roll_up()`.
+
+		Args:
+			top_stats (dict): The top_stats dictionary to update.
+			player_key (callable): Maps a player id to its top_stats['player'] key.
+		"""
+		names = self._names
+		player_stats = top_stats['player']
+		fight_stats = top_stats['fight']
+		self._fight_stats = fight_stats
+		if not isinstance(top_stats['overall'], RollupDict):
+			top_stats['overall'] = RollupDict(self, top_stats['overall'])
+		pending = self._pending
+		group_totals = self._group_totals
+		totals = {}
+
+		def container_for(level, owner, category, key):
+			if level == PLAYER:
+				container = player_stats[player_key(owner)].setdefault(names[category], {})
+			else:
+				container = fight_stats[owner].setdefault(names[category], {})
+			if key != NO_KEY:
+				container = container.setdefault(names[key], {})
+			return container
+
+		columns = zip(self.fights, self.players, self.groups, self.categories, self.keys, self.stats, self.values, self.is_int, self.levels)
+		for fight_num, player, group, category, key, stat, value, is_int, levels in columns:
+			if is_int:
+				value = int(value)
+			if levels & DEFERRED_LEVELS:
+				pending.setdefault(category, {})[fight_num] = None
+				self._overall_stats.setdefault(category, set()).add(names[stat])
+				if key != NO_KEY:
+					self._keyed.add(category)
+				if levels & GROUP:
+					category_groups = group_totals.get(category)
+					if category_groups is None:
+						category_groups = group_totals[category] = {}
+						self._group_anchor[category] = key
+					group_key = (group, key, stat)
+					category_groups[group_key] = category_groups.get(group_key, 0) + value
+			for level, owner in ((PLAYER, player), (FIGHT, fight_num)):
+				if not levels & level:
+					continue
+				group_key = (level, owner, category, key, stat)
+				total = totals.get(group_key)
+				if total is None:
+					container = container_for(level, owner, category, key)
+					stat_name = names[stat]
+					total = totals[group_key] = [container, stat_name, container.get(stat_name, 0)]
+				total[2] += value
+
+		for container, stat_name, value in totals.values():
+			container[stat_name] = value
+		self.clear()
+
+
+def _add_stats(totals: dict, values: dict, stat_names: set) -> None:
+	"""Add the values of the summed stats of a fight to the overall totals."""
+	for stat, value in values.items():
+		if stat in stat_names:
+			totals[stat] = totals.get(stat, 0) + value
+
+
+def _insert_after(stats: dict, anchor, name, value) -> None:
+	"""Insert a key after another, keeping the order an eager update would have given."""
+	items = list(stats.items())
+	position = next((index + 1 for index, (key, _) in enumerate(items) if key == anchor), len(items))
+	items.insert(position, (name, value))
+	stats.clear()
+	stats.update(items)
+
+
+class RollupDict(dict):
+	"""top_stats['overall'], rolling up a category's pending fight sums on first read.
+
+	Reads of a category through ``[]`` or `get()` sum the fights flushed
+	since its last rollup; iterating or listing the dict rolls up every
+	category. Later flushes mark their fights pending again, so reads always
+	see the sums of every parsed fight. `setdefault()` and writes do not roll up.
+	"""
+
+	def __init__(self, store: FactStore, *args) -> None:
+		super().__init__(*args)
+		self._store = store
+
+	def _roll_up(self, key=None) -> None:
+		store = self._store
+		if store._pending and (key is None or store.has_deferred(key)):
+			store.roll_up(self, key)
+
+	def roll_up(self) -> None:
+		"""Roll up every category now, e.g. before several threads read the dict."""
+		self._roll_up()
+
+	def __getitem__(self, key):
+		self._roll_up(key)
+		return super().__getitem__(key)
+
+	def get(self, key, default=None):
+		self._roll_up(key)
+		return super().get(key, default)
+
+	def __contains__(self, key) -> bool:
+		self._roll_up(key)
+		return super().__contains__(key)
+
+	def __iter__(self):
+		self._roll_up()
+		return super().__iter__()
+
+	def __len__(self) -> int:
+		self._roll_up()
+		return super().__len__()
+
+	def keys(self):
+		self._roll_up()
+		return super().keys()
+
+	def values(self):
+		self._roll_up()
+		return super().values()
+
+	def items(self):
+		self._roll_up()
+		return super().items()
@@ -0,0 +1,221 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+"""Helpers for the per second series of a fight.
+
+Series are plain lists, or int64 arrays, of ints. Moving averages and
+windowed maxima use NumPy when it is installed and the series is long
+enough to pay for the conversion; diff and cumsum are always done with
+map()/accumulate(), which beat converting a list to and from NumPy.
+"""
+
+import operator
+from itertools import accumulate
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+
+# Per second series of one fight are a few hundred to a few thousand ticks, and
+# the NumPy versions only pay for their conversions from about this length on.
+NUMPY_MIN_LENGTH = 64
+
+HAVE_NUMPY = numpy is not None
+
+
+def diff(cumulative, first_from_zero: bool = True) -> list:
+	"""
+	Turn a cumulative series into per tick amounts.
+
+	Args:
+		cumulative (sequence): The cumulative series, e.g. a player's damage1S.
+		first_from_zero (bool): Count the first tick from zero; when False it is 0.
+
+	Returns:
+		list: The per tick amounts, as long as the input.
+	"""
+	if not len(cumulative):
+		return []
+	deltas = list(map(operator.sub, cumulative[1:], cumulative))
+	deltas.insert(0, cumulative[0] if first_from_zero else 0)
+	return deltas
+
+
+def cumsum(values) -> list:
+	"""
+	Turn per tick amounts into a cumulative series, the inverse of `diff()`.
+
+	Args:
+		values (sequence): The per tick amounts.
+
+	Returns:
+		list: The running totals, as long as the input.
+	"""
+	return list(accumulate(values))
+
+
+def prefix_sums(values) -> list:
+	"""
+	Return the running totals of a series with a leading 0, for `interval_sum()`.
+
+	Args:
+		values (sequence): The per tick amounts.
+
+	Returns:
+		list: One entry longer than the input; entry i is the sum of the first i values.
+	"""
+	return list(accumulate(values, initial=0))
+
+
+def interval_sum(prefix: list, start: int, end: int):
+	"""
+	Sum the values at ticks start to end - 1 in O(1).
+
+	Args:
+		prefix (list): The result of `prefix_sums()`.
+		start (int): The first tick.
+		end (int): The tick after the last one; an empty range sums to 0.
+
+	Returns:
+		The sum of the values in the range.
+	"""
+	if end <= start:
+		return 0
+	return prefix[end] - prefix[start]
+
+
+def _py_moving_average(data, window_size: int) -> list:
+	prefix = prefix_sums(data)
+	count = len(data)
+	averages = []
+	for i in range(count):
+		start = max(0, i - window_size)
+		end = min(count, i + window_size + 1)
+		averages.append((prefix[end] - prefix[start]) / (end - start))
+	return averages
+
+
+def _np_moving_average(data, window_size: int) -> list:
+	prefix = numpy.concatenate(([0], numpy.cumsum(numpy.asarray(data))))
+	index = numpy.arange(len(data))
+	start = numpy.maximum(index - window_size, 0)
+	end = numpy.minimum(index + window_size + 1, len(data))
+	return ((prefix[end] - prefix[start]) / (end - start)).tolist()
+
+
+def moving_average(data, window_size: int) -> list:
+	"""
+	Average each element with up to window_size neighbours on either side.
+
+	Window sums come from running totals, so this is O(n) whatever the
+	window size. Integer series give exactly the averages of summing each
+	window.
+
+	Args:
+		data (sequence): The numbers to average.
+		window_size (int): The number of neighbours on each side.
+
+	Returns:
+		list: The moving average at each element.
+	"""
+	if HAVE_NUMPY and len(data) >= NUMPY_MIN_LENGTH:
+		return _np_moving_average(data, window_size)
+	return _py_moving_average(data, window_size)
+
+
+def _py_windowed_maxes(cumulative, windows) -> list:
+	return [
+		max(map(operator.sub, cumulative[window:], cumulative)) if 0 < window < len(cumulative) else None
+		for window in windows
+	]
+
+
+def _np_windowed_maxes(cumulative, windows) -> list:
+	values = numpy.asarray(cumulative)
+	return [
+		(values[window:] - values[:-window]).max().item() if 0 < window < len(values) else None
+		for window in windows
+	]
+
+
+def windowed_maxes(cumulative, windows) -> list:
+	"""
+	Return the largest amount added over any run of ticks, for several run lengths.
+
+	Args:
+		cumulative (sequence): The cumulative series.
+		windows (iterable): The run lengths, in ticks.
+
+	Returns:
+		list: For each window, the largest cumulative[t] - cumulative[t - window],
+			or None if the series is not longer than the window.
+	"""
+	if HAVE_NUMPY and len(cumulative) >= NUMPY_MIN_LENGTH:
+		return _np_windowed_maxes(cumulative, windows)
+	return _py_windowed_maxes(cumulative, windows)
+
+
+def lttb(values, threshold: int) -> list:
+	"""
+	Pick the points of a series to keep when downsampling it for a chart.
+
+	Largest-Triangle-Three-Buckets: the first and last points are kept, and
+	the points between them are split into threshold - 2 buckets. Each
+	bucket keeps the point forming the largest triangle with the point kept
+	before it and the average of the next bucket, which keeps the spikes of
+	the series.
+
+	Args:
+		values (sequence): The series, one value per tick.
+		threshold (int): The number of points to keep.
+
+	Returns:
+		list: The ticks of the kept points, ascending. Every tick if the series
+			has no more than threshold points or threshold is below 3.
+	"""
+	count = len(values)
+	if threshold >= count or threshold < 3:
+		return list(range(count))
+
+	bucket_size = (count - 2) / (threshold - 2)
+	kept = [0]
+	previous = 0
+	for bucket in range(threshold - 2):
+		# Average point of the next bucket
+		next_start = int((bucket + 1) * bucket_size) + 1
+		next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+		average_tick = (next_start + next_end - 1) / 2
+		average_value = sum(values[next_start:next_end]) / (next_end - next_start)
+
+		previous_value = values[previous]
+		tick_span = previous - average_tick
+		value_span = average_value - previous_value
+		largest_area = -1
+		chosen = start = int(bucket * bucket_size) + 1
+		for tick in range(start, int((bucket + 1) * bucket_size) + 1):
+			# Twice the triangle's area, the factor being the same for every tick
+			area = abs(tick_span * (values[tick] - previous_value) - (previous - tick) * value_span)
+			if area > largest_area:
+				largest_area = area
+				chosen = tick
+		kept.append(chosen)
+		previous = chosen
+	kept.append(count - 1)
+	return kept
@@ -15,16 +15,28 @@
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import config
 import json
-#import os
+import numeric
+import os
 import requests
 import sqlite3
+import threading
 import xlsxwriter
 from glicko2 import Player as GlickoPlayer
+from report_profile import FULL_PROFILE
+from tw_chart import ChartDataset, sort_transform
+from tw_shard import PlayerShards
+from tw_style import stylesheet_tiddlers
+from tw_table import TABLE_CLASS, Column, TWTable
+from top_k import select_top
 from collections import defaultdict
+from contextlib import contextmanager
+from operator import itemgetter
 from typing import Dict, Any, List, Tuple, Optional
 
 #list of tid files to output
 tid_list = []
+# per thread list capturing the tids of a report builder, see capture_tids()
+_tid_capture = threading.local()
 
 
 def create_new_tid_from_template(
@@ -72,22 +84,123 @@ def create_new_tid_from_template(
 	return temp_tid
 
 def append_tid_for_output(input, output):
+	captured = getattr(_tid_capture, "tiddlers", None)
+	if captured is not None:
+		captured.append(input)
+		return
 	output.append(input)
 	print(input['title']+'.tid has been created.')
 
-def write_tid_list_to_json(tid_list: list, output_filename: str) -> None:
+@contextmanager
+def capture_tids():
+	"""
+	Collect the tids created in this thread into a new list instead of tid_list.
+
+	Yields:
+		list: The captured tids, in the order they were created.
+	"""
+	saved = getattr(_tid_capture, "tiddlers", None)
+	_tid_capture.tiddlers = []
+	try:
+		yield _tid_capture.tiddlers
+	finally:
+		_tid_capture.tiddlers = saved
+
+def player_columns(time_key: str = "active_time") -> list:
+	"""
+	Return the Party, Name, Prof and FightTime columns opening the player tables.
+
+	Args:
+		time_key (str): The key of the player's fight time, in ms.
+
+	Returns:
+		list: The Column specs, the name carrying the account as tooltip.
+	"""
+	return [
+		Column("!Party |", "last_party", cell=" {} |"),
+		Column("!Name |", "name", tooltip="account", cell="{} |"),
+		Column(" !Prof |", ("profession", lambda player: player["profession"][:3]), text="{{{{{}}}}} {}", cell=" {} |"),
+		Column(" !{{FightTime}} |", lambda player: player[time_key] / 1000, text="{:,.1f}"),
+	]
+
+class TiddlerJsonWriter:
+	"""
+	Write tids to the drag and drop json file as they are created.
+
+	Stands in for tid_list: `append()` serializes each tid straight to the
+	file, so the tids of a night are never all held in memory. The default
+	layout is the same, byte for byte, as json.dump(tid_list, indent=4,
+	sort_keys=True); compact drops the whitespace and writes one tid per
+	line. The file is written under a temporary name and moved into place
+	by `close()`, so an interrupted run leaves no truncated summary behind.
+
+	Args:
+		output_filename (str): The name of the output file.
+		compact (bool, optional): Write without indentation. Defaults to False.
+	"""
+
+	def __init__(self, output_filename: str, compact: bool = False) -> None:
+		self.output_filename = output_filename
+		self.compact = compact
+		self.count = 0
+		self._partial_filename = output_filename + ".part"
+		self._outfile = open(self._partial_filename, 'w')
+
+	def __len__(self) -> int:
+		return self.count
+
+	def __enter__(self) -> "TiddlerJsonWriter":
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback) -> None:
+		if exc_type is None:
+			self.close()
+		else:
+			self._outfile.close()
+			os.remove(self._partial_filename)
+
+	def append(self, tid: dict) -> None:
+		"""Serialize a tid to the file."""
+		if self.compact:
+			text = json.dumps(tid, sort_keys=True, separators=(',', ':'))
+		else:
+			text = "    " + json.dumps(tid, indent=4, sort_keys=True).replace("\n", "\n    ")
+		self._outfile.write((",\n" if self.count else "[\n") + text)
+		self.count += 1
+
+	def close(self) -> None:
+		"""Finish the json list and move the file to output_filename."""
+		if self._outfile.closed:
+			return
+		self._outfile.write("\n]" if self.count else "[]")
+		self._outfile.close()
+		os.replace(self._partial_filename, self.output_filename)
+
+def write_tid_list_to_json(tid_list: list, output_filename: str, compact: bool = False) -> None:
 	"""
 	Write the list of tid files to a json file
 
 	Args:
 		tid_list (list): The list of tid files.
 		output_filename (str): The name of the output file.
+		compact (bool, optional): Write without indentation. Defaults to False.
 
 	Returns:
 		None
 	"""
-	with open(output_filename, 'w') as outfile:
-		json.dump(tid_list, outfile, indent=4, sort_keys=True)
+	with TiddlerJsonWriter(output_filename, compact) as writer:
+		for tid in tid_list:
+			writer.append(tid)
+
+def build_stylesheet_tids(tid_list: list) -> None:
+	"""
+	Output the stylesheet tiddlers of the CSS shared by the report tiddlers, see tw_style.
+
+	Args:
+		tid_list (list): The list of tid files.
+	"""
+	for tiddler in stylesheet_tiddlers():
+		append_tid_for_output(tiddler, tid_list)
 
 def convert_duration(milliseconds: int) -> str:
 	"""
@@ -611,20 +724,6 @@ def build_category_summary_report(
     # Optional column toggles for summary layout
     if enable_hide_columns and layout == "summary":
         rows.append("""
-<style>
-.col-controls {
-  display:flex;flex-wrap:wrap;gap:0.3em 0.5em;align-items:center;
-  background:#343a40;color:#eee;border-radius:0.5em;
-  padding:0.6em 1em;margin-bottom:0.8em;font-size:0.9em;
-}
-.col-controls label {
-  display:flex;align-items:center;gap:0.2em;
-  background:#333;padding:0.2em 0.5em;border-radius:0.3em;cursor:pointer;
-  transition:background 0.2s;
-}
-.col-controls label:hover{background:#444;}
-.col-controls input[type="checkbox"]{accent-color:#6cf;}
-</style>
 <div class='col-toggle'>
 <div class="col-controls">""")
         for i, stat in enumerate(category_stats.keys(), start=5):
@@ -633,57 +732,6 @@ def build_category_summary_report(
 
     # === Focus Layout (table + 3-bar chart per stat) ===
     if layout == "detailed":
-        rows.append("""
-<style>
-.btn {
-  display: inline-block;
-  font-weight: 400;
-  text-align: center;
-  white-space: nowrap;
-  vertical-align: middle;
-  -webkit-user-select: none;
-  -moz-user-select: none;
-  -ms-user-select: none;
-  user-select: none;
-  border: 1px solid transparent;
-  padding: 0.375rem 0.75rem;
-  font-size: 1rem;
-  line-height: 1.5;
-  border-radius: 0.25rem;
-  margin: 1px;
-  transition: color 0.15s ease-in-out, background-color 0.15s ease-in-out, border-color 0.15s ease-in-out, box-shadow 0.15s ease-in-out;
-}
-
-.btn-dark {
-  color: #fff;
-  background-color: #343a40;
-  border-color: #343a40;
-}
-
-.btn-dark:hover {
-  color: #fff;
-  background-color: #23272b;
-  border-color: #1d2124;
-}
-
-.btn-dark:focus, .btn-dark.focus {
-  box-shadow: 0 0 0 0.2rem rgba(52, 58, 64, 0.5);
-}
-
-.btn-dark.disabled, .btn-dark:disabled {
-  color: #fff;
-  background-color: #343a40;
-  border-color: #343a40;
-}
-.btn-sm{
-  padding: 0.2rem 0.4rem;
-  font-size: 0.75rem;
-  line-height: 1.5;
-  border-radius: 0.2rem;
-}
-</style>
-""")
-
         # Radio buttons for selecting stat focus
         for stat in category_stats:
             stat_icon = alt_stat_icon.get(stat, "{{"+stat+"}}")
@@ -691,19 +739,40 @@ def build_category_summary_report(
                 f'<$radio class="btn btn-sm btn-dark" field="{caption}_selected" value="{stat}"> {stat_icon} </$radio>'
             )
 
+        stat_table = TWTable([
+            Column("!Party |", "Party", cell=" {} |"),
+            Column("!Name |", "Name", cell=" {} |"),
+            Column("!Prof |", ("Prof", lambda p: p["Prof"][:3]), text="{{{{{}}}}} {}", cell=" {} |"),
+            Column("!{{FightTime}} |", "FightTime", text="{:,.1f}", cell=" {} |"),
+            Column("!Total|", "Total", text="{:,.2f}"),
+            Column("!Stat/1s|", "Stat/1s", text="{:,.2f}"),
+            Column("!Stat/60s|", "Stat/60s", text="{:,.2f}"),
+        ])
+
+        # The charts of every stat plot columns of one shared dataset
+        players = list(top_stats.get("player", {}).values())
+        dataset = ChartDataset(
+            f"{tid_date_time}-{caption}-Detailed-Data",
+            f"{caption} - Detailed Data",
+            ["Party", "Name", "Prof", "FightTime"] + [f"{stat} {toggle}" for stat in category_stats for toggle in TOGGLES],
+        )
+        for player in players:
+            dataset.append([player["last_party"], player["name"], player["profession"], player["active_time"] / 1000])
+
         # One table and chart per stat
         for stat, category in category_stats.items():
             # Compute values per player
             chart_data = []
-            for player in top_stats.get("player", {}).values():
-                vals = compute_values(player, stat, category)
+            for player, dataset_row in zip(players, dataset.source):
+                vals = {k: round(v, 2) for k, v in compute_values(player, stat, category).items()}
                 chart_data.append({
                     "Party": player["last_party"],
                     "Name": player["name"],
                     "Prof": player["profession"],
                     "FightTime": player["active_time"] / 1000,
-                    **{k: round(v, 2) for k, v in vals.items()},
+                    **vals,
                 })
+                dataset_row.extend(vals[toggle] for toggle in TOGGLES)
 
             # Sort by Stat/1s descending
             chart_data.sort(key=lambda x: x[sort_mode], reverse=True)
@@ -713,38 +782,30 @@ def build_category_summary_report(
             rows.append('<div class="flex-row">\n    <div class="flex-col border">\n\n')
             format_stat = stat[0].upper() + stat[1:]
             rows.append(f"!! {format_stat}\n")
-            rows.append("|thead-dark table-caption-top table-hover sortable|k\n")
-            rows.append("|!Party |!Name |!Prof |!{{FightTime}} |!Total|!Stat/1s|!Stat/60s|h")
-
-            for p in chart_data:
-                rows.append(
-                    f"| {p['Party']} | {p['Name']} | {{{{{p['Prof']}}}}} {p['Prof'][:3]} | "
-                    f"{p['FightTime']:,.1f} | {p['Total']:,.2f}| {p['Stat/1s']:,.2f}| {p['Stat/60s']:,.2f}|"
-                )
+            rows.append(TABLE_CLASS + "\n")
+            rows.append(stat_table.header())
+            rows.extend(stat_table.rows(chart_data))
 
             rows.append("\n    </div>\n    <div class='flex-col border'>\n\n")
-            # Sort chart by requested metric
-            sorted_chart = sorted(chart_data, key=lambda x: x.get(sort_mode, 0), reverse=True)
-            json_chart = json.dumps(sorted_chart)
 
-            # Chart: 3 bars per player with legend toggle
+            # Chart: 3 bars per player with legend toggle, sorted by the requested metric
             chart_block = f"""
 <$echarts $text=```
 option = {{
   title: {{ text: '{format_stat}', subtext: '{caption}' }},
   tooltip: {{ trigger: 'axis' }},
   legend: {{ selected: {{ "Stat/1s": false, "Total": true, "Stat/60s":false }}, top:'10%' }},
-  dataset: {{
-    dimensions: ["Party", "Name", "Profession", "Total", "Stat/1s", "Stat/60s"],
-    source: {json_chart}
-  }},
+  dataset: [
+    {dataset.reference()},
+    {sort_transform(f"{stat} {sort_mode}")}
+  ],
   xAxis: {{}},
   yAxis: {{ type: 'category', inverse: true }},
   grid: {{ top: '15%', containLabel: true }},
   series: [
-    {{ type: 'bar', name: 'Total', encode: {{ x: 'Total', y: 'Name' }} }},
-    {{ type: 'bar', name: 'Stat/1s', encode: {{ x: 'Stat/1s', y: 'Name' }} }},
-    {{ type: 'bar', name: 'Stat/60s', encode: {{ x: 'Stat/60s', y: 'Name' }} }}
+    {{ type: 'bar', name: 'Total', datasetIndex: 1, encode: {{ x: "{stat} Total", y: 'Name' }} }},
+    {{ type: 'bar', name: 'Stat/1s', datasetIndex: 1, encode: {{ x: "{stat} Stat/1s", y: 'Name' }} }},
+    {{ type: 'bar', name: 'Stat/60s', datasetIndex: 1, encode: {{ x: "{stat} Stat/60s", y: 'Name' }} }}
   ],
   dataZoom: [
     {{ type: 'slider', yAxisIndex: 0, start: 0, end: 50 }},
@@ -769,32 +830,34 @@ option = {{
             ),
             tid_list,
         )
+        append_tid_for_output(dataset.tiddler(), tid_list)
 
     # === Summary Layout (one large table) ===
     elif layout == "summary":
+        # (player, fight time, {stat: values}) of each player in the table
+        player_values = []
+        for player in top_stats.get("player", {}).values():
+            fight_time = player.get("active_time", 0) / 1000
+            if fight_time == 0:
+                continue
+            values = {stat: compute_values(player, stat, category) for stat, category in category_stats.items()}
+            player_values.append((player, fight_time, values))
+
         for toggle in TOGGLES:
             rows.append(f'<$reveal stateTitle=<<currentTiddler>> stateField="category_radio" '
                         f'type="match" text="{toggle}" animate="yes">\n')
 
-            header = "|thead-dark table-caption-top table-hover sortable|k\n"
-            header += "|!Party |!Name | !Prof | !{{FightTime}} |"
-            for stat in category_stats.keys():
-                stat_icon = alt_stat_icon.get(stat, "{{"+stat+"}}")
-                header += f" !{stat_icon} |"
-            header += "h"
-            rows.append(header)
-
-            for player in top_stats.get("player", {}).values():
-                fight_time = player.get("active_time", 0) / 1000
-                if fight_time == 0:
-                    continue
-                row = (f"| {player['last_party']} |{player['name']} | "
-                       f"{{{{{player['profession']}}}}} {player['profession'][:3]} | "
-                       f"{fight_time:,.1f} |")
-                for stat, category in category_stats.items():
-                    val = compute_values(player, stat, category)[toggle]
-                    row += f" {val:,.2f}|"
-                rows.append(row)
+            summary_table = TWTable([
+                Column("!Party |", lambda r: r[0]["last_party"], cell=" {} |"),
+                Column("!Name |", lambda r: r[0]["name"], cell="{} |"),
+                Column(" !Prof |", (lambda r: r[0]["profession"], lambda r: r[0]["profession"][:3]), text="{{{{{}}}}} {}", cell=" {} |"),
+                Column(" !{{FightTime}} |", lambda r: r[1], text="{:,.1f}", cell=" {} |"),
+            ] + [
+                Column(f" !{alt_stat_icon.get(stat, '{{'+stat+'}}')} |", lambda r, stat=stat: r[2][stat][toggle], text="{:,.2f}")
+                for stat in category_stats
+            ])
+            rows.append(TABLE_CLASS + "\n" + summary_table.header())
+            rows.extend(summary_table.rows(player_values))
 
             rows.append(f'|<$radio field="category_radio" value="Total"> Total  </$radio>'
                         f' - <$radio field="category_radio" value="Stat/1s"> Stat/1s  </$radio>'
@@ -917,6 +980,48 @@ def compute_boon_metrics(
     return generation_ms, wasted_ms, uptime_raw, wasted_raw
 
 
+class BoonMetrics:
+    """
+    compute_boon_metrics() results by player, boon and category, each computed once.
+
+    Built once after parsing and shared by the boon reports, the boon
+    generation chart and the Discord boon support data, which otherwise
+    recompute the same values for every toggle, layout and report.
+    Players are identified by name, profession and account, so a copy
+    sent to a report worker process matches that worker's top_stats.
+
+    Args:
+        buff_data: metadata (stacking flag).
+        players: top_stats['player'], to compute `boons` for up front.
+        boons: boon ids computed for every player and category when built.
+    """
+
+    __slots__ = ("buff_data", "_metrics")
+
+    def __init__(self, buff_data: Dict[str, Any], players: Optional[Dict[str, Any]] = None, boons=()) -> None:
+        self.buff_data = buff_data
+        self._metrics: Dict[tuple, Tuple[float, float, float, float]] = {}
+        for player in (players or {}).values():
+            for boon_id in boons:
+                for category in CATEGORY_ORDER:
+                    self.get(player, boon_id, category)
+
+    def __len__(self) -> int:
+        return len(self._metrics)
+
+    def get(self, player: Dict[str, Any], boon_id: str, category: str) -> Tuple[float, float, float, float]:
+        """Return compute_boon_metrics(player, boon_id, category, buff_data), computing it on first use."""
+        key = (player["name"], player["profession"], player["account"], boon_id, category)
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            metrics = self._metrics[key] = compute_boon_metrics(player, boon_id, category, self.buff_data)
+        return metrics
+
+    def generation(self, player: Dict[str, Any], boon_id: str, category: str) -> float:
+        """Return the generation_ms of a player's boon in a category."""
+        return self.get(player, boon_id, category)[0]
+
+
 def format_entry(
     generation_ms: float,
     wasted_ms: float,
@@ -1006,14 +1111,18 @@ def build_player_row(
     toggle: str,
     buff_data: Dict[str, Any],
     single_boon_id: Optional[str] = None,
+    boon_metrics: Optional[BoonMetrics] = None,
 ) -> Tuple[str, Optional[List[Any]]]:
     """
     Build a single player's row for the given set of boons.
     - If single_boon_id is provided, boons_meta should contain just that boon and we return a chart row.
+    - boon_metrics: shared BoonMetrics to read the values from.
     Returns (row_html, chart_row or None)
     """
     if player.get("active_time", 0) == 0:
         return "", None
+    if boon_metrics is None:
+        boon_metrics = BoonMetrics(buff_data)
 
     row, chart_row = build_player_basic_cells(player)
     chart_values_for_sort = []
@@ -1031,7 +1140,7 @@ def build_player_row(
             chart_val = 0
         else:
             stacking = buff_data.get(boon_id, {}).get("stacking", False)
-            generation_ms, wasted_ms, uptime_raw, wasted_raw = compute_boon_metrics(player, boon_id, category, buff_data)
+            generation_ms, wasted_ms, uptime_raw, wasted_raw = boon_metrics.get(player, boon_id, category)
             entry, chart_val = format_entry(generation_ms, wasted_ms, uptime_raw, wasted_raw, toggle, stacking, player.get("active_time",0))
         row += f" {entry}|"
         chart_row.append(chart_val)
@@ -1049,6 +1158,7 @@ def build_boon_report(
     layout: str = "focus",  # "focus" or "summary"
     category: Optional[str] = None,  # required if layout="summary"
     boon_type: Optional[str] = None,
+    boon_metrics: Optional[BoonMetrics] = None,
 ) -> None:
     """
     Generator for boon reports.
@@ -1065,25 +1175,15 @@ def build_boon_report(
         layout: "focus" or "summary".
         category: which generation type to show if summary (e.g. "selfBuffs").
         boon_type: optional label for summary output.
+        boon_metrics: shared BoonMetrics, built from buff_data when not given.
     """
+    if boon_metrics is None:
+        boon_metrics = BoonMetrics(buff_data)
     rows: List[str] = []
     rows.append('<div style="overflow-y: auto; width: 100%; overflow-x:auto;">\n\n')
 
     if layout == "focus":
         # --- Focus Layout (per-boon tables + charts) ---
-        rows.append("""
-<style>
-.btn {
-  display:inline-block; font-weight:400; text-align:center; white-space:nowrap;
-  border:1px solid transparent; padding:0.375rem 0.75rem; font-size:1rem;
-  line-height:1.5; border-radius:0.25rem; margin:1px;
-  transition:color .15s ease-in-out, background-color .15s ease-in-out, border-color .15s ease-in-out;
-}
-.btn-dark { color:#fff; background-color:#343a40; border-color:#343a40; }
-.btn-dark:hover { background-color:#23272b; border-color:#1d2124; }
-.btn-sm { padding:0.2rem 0.4rem; font-size:0.75rem; border-radius:0.2rem; }
-</style>
-""")
 
         # Button bar
         for boon_id, boon_name in boons.items():
@@ -1096,6 +1196,15 @@ def build_boon_report(
                 f' </$radio>'
             )
 
+        # The charts of every boon plot columns of one shared dataset
+        gen_columns = ["Self Gen", "Group Gen", "Squad Gen", "Total Gen"]
+        dataset = ChartDataset(
+            f"{tid_date_time}-Boon-Generation-Detailed-Data",
+            "Boons - Detailed Data",
+            ["Party", "Name", "Prof", "Total Fight Time"]
+            + [f"{boon_name} {column}" for boon_id, boon_name in boons.items() if boon_id in buff_data for column in gen_columns],
+        )
+
         # Per-boon sections
         for boon_id, boon_name in boons.items():
             if boon_id not in buff_data:
@@ -1128,12 +1237,14 @@ def build_boon_report(
                         if cat != "totalBuffs" and boon_id not in player.get(cat, {}):
                             entry, val = " - ", 0
                         else:
-                            gen, waste, up, wastep = compute_boon_metrics(player, boon_id, cat, buff_data)
+                            gen, waste, up, wastep = boon_metrics.get(player, boon_id, cat)
                             entry, val = format_entry(gen, waste, up, wastep, toggle, stacking, player["active_time"])
                         row += f" {entry}|"
                         per_row_chart.append(val)
                     chart_data.append(per_row_chart)
                     rows.append(row)
+                # The chart plots the last toggle's values, in player order
+                boon_chart_rows = chart_data
                 try:
                     sorted_pairs = sorted(
 						zip(chart_data, rows[-len(chart_data):]),  # last chart_data rows belong to this boon
@@ -1153,13 +1264,12 @@ def build_boon_report(
                 )
                 rows.append("\n</$reveal>")
 
-            # Sorted data for chart
-            try:
-                sorted_chart = sorted(chart_data, key=lambda x: float(x[6]) if len(x) > 6 else 0, reverse=True)
-            except Exception:
-                sorted_chart = chart_data
+            # Chart data, sorted by Squad Gen in the chart
+            if not dataset.source:
+                dataset.source = [chart_row[:4] for chart_row in boon_chart_rows]
+            for dataset_row, chart_row in zip(dataset.source, boon_chart_rows):
+                dataset_row.extend(chart_row[4:])
 
-            json_chart = json.dumps(sorted_chart)
             boon_chart = f"""
 <$echarts $text=```
 option = {{
@@ -1167,13 +1277,13 @@ title: {{ text: '{boon_name} Uptime Generation', subtext: 'selectable legend for
 legend: {{ orient:'horizontal', top:'10%', selected:{{'Total Gen':false,'Squad Gen':true,'Group Gen':false,'Self Gen':false}} }},
 grid:{{top:'15%', containLabel:true}},
 tooltip:{{top:'center'}},
-dataset:{{dimensions:["Party","Name","Prof","Total Fight Time","Self Gen","Group Gen","Squad Gen","Total Gen"],source:{json_chart}}},
+dataset:[{dataset.reference()},{sort_transform(f"{boon_name} Squad Gen")}],
 xAxis:{{}}, yAxis:{{type:'category',inverse:true}},
 dataZoom:[{{type:'slider',yAxisIndex:0,filterMode:'none', start:0, end:60}},{{type:'inside',yAxisIndex:0,filterMode:'none'}}],
-series:[{{type:'bar',name:'Total Gen',encode:{{x:'Total Gen',y:'Name'}}}},
-{{type:'bar',name:'Squad Gen',encode:{{x:'Squad Gen',y:'Name'}}}},
-{{type:'bar',name:'Group Gen',encode:{{x:'Group Gen',y:'Name'}}}},
-{{type:'bar',name:'Self Gen',encode:{{x:'Self Gen',y:'Name'}}}}]
+series:[{{type:'bar',name:'Total Gen',datasetIndex:1,encode:{{x:"{boon_name} Total Gen",y:'Name'}}}},
+{{type:'bar',name:'Squad Gen',datasetIndex:1,encode:{{x:"{boon_name} Squad Gen",y:'Name'}}}},
+{{type:'bar',name:'Group Gen',datasetIndex:1,encode:{{x:"{boon_name} Group Gen",y:'Name'}}}},
+{{type:'bar',name:'Self Gen',datasetIndex:1,encode:{{x:"{boon_name} Self Gen",y:'Name'}}}}]
 }};
 ```$height="800px" $width="100%" $theme="dark"/>
 """
@@ -1194,6 +1304,7 @@ series:[{{type:'bar',name:'Total Gen',encode:{{x:'Total Gen',y:'Name'}}}},
             ),
             tid_list,
         )
+        append_tid_for_output(dataset.tiddler(), tid_list)
 
     elif layout == "summary":
         # --- Summary Layout (one big table with all boons as columns) ---
@@ -1218,7 +1329,7 @@ series:[{{type:'bar',name:'Total Gen',encode:{{x:'Total Gen',y:'Name'}}}},
             for player in top_stats.get("player", {}).values():
                 if player.get("active_time", 0) == 0:
                     continue
-                row_html, _ = build_player_row(player, boons_meta, category, toggle, buff_data)
+                row_html, _ = build_player_row(player, boons_meta, category, toggle, buff_data, boon_metrics=boon_metrics)
                 rows.append(row_html)
 
             caption = CATEGORY_CAPTIONS.get(category, category)
@@ -1247,8 +1358,10 @@ series:[{{type:'bar',name:'Total Gen',encode:{{x:'Total Gen',y:'Name'}}}},
     else:
         raise ValueError("layout must be 'focus' or 'summary'")
 
-def build_boon_summary(top_stats: dict, boons: dict, category: str, buff_data: dict, tid_date_time: str, boon_type = None) -> None:
-	"""Print a table of boon uptime stats for all players in the log."""
+def build_boon_summary(top_stats: dict, boons: dict, category: str, buff_data: dict, tid_date_time: str, boon_type = None, boon_metrics: BoonMetrics = None) -> None:
+	"""Print a table of boon uptime stats for all players in the log, reading the values from boon_metrics."""
+	if boon_metrics is None:
+		boon_metrics = BoonMetrics(buff_data)
 	
 	# Initialize a list to hold the rows of the table
 	rows = []
@@ -1301,56 +1414,10 @@ def build_boon_summary(top_stats: dict, boons: dict, category: str, buff_data: d
 					entry = " - "
 				else:
 					# Determine if the boon is stacking
-					stacking = buff_data[boon_id].get('stacking', False)                
-					num_fights = player["num_fights"]
-					group_supported = player["group_supported"]
-					squad_supported = player["squad_supported"]
-
-					# Calculate generation and uptime percentage based on category
-					if category == "selfBuffs":
-						generation_ms = player[category][boon_id]["generation"]
-						wasted_ms = player[category][boon_id]["wasted"]
-						if stacking:
-							uptime_percentage = round((generation_ms / player['active_time']), 3)
-							wasted_percentage = round((wasted_ms / player['active_time']), 3)
-						else:
-							uptime_percentage = round((generation_ms / player['active_time']) * 100, 3)
-							wasted_percentage = round((wasted_ms / player['active_time']) * 100, 3)
-					elif category == "groupBuffs":
-						generation_ms = player[category][boon_id]["generation"]
-						wasted_ms = player[category][boon_id]["wasted"]
-						if stacking:
-							uptime_percentage = round((generation_ms / player['active_time']) / ((group_supported - num_fights)/num_fights), 3)
-							wasted_percentage = round((wasted_ms / player['active_time']) / ((group_supported - num_fights)/num_fights), 3)
-						else:
-							uptime_percentage = round((generation_ms / player['active_time']) / ((group_supported - num_fights)/num_fights) * 100, 3)
-							wasted_percentage = round((wasted_ms / player['active_time']) / ((group_supported - num_fights)/num_fights) * 100, 3)
-					elif category == "squadBuffs":
-						generation_ms = player[category][boon_id]["generation"]
-						wasted_ms = player[category][boon_id]["wasted"]
-						if stacking:
-							uptime_percentage = round((generation_ms / player['active_time']) / ((squad_supported - num_fights)/num_fights), 3)
-							wasted_percentage = round((wasted_ms / player['active_time']) / ((squad_supported - num_fights)/num_fights), 3)
-						else:
-							uptime_percentage = round((generation_ms / player['active_time']) / ((squad_supported - num_fights)/num_fights) * 100, 3)
-							wasted_percentage = round((wasted_ms / player['active_time']) / ((squad_supported - num_fights)/num_fights) * 100, 3)
-					elif category == "totalBuffs":
-						generation_ms = 0
-						wasted_ms = 0
-						if boon_id in player["selfBuffs"]:
-							generation_ms += player["selfBuffs"][boon_id]["generation"]
-							wasted_ms += player["selfBuffs"][boon_id]["wasted"] 
-						if boon_id in player["squadBuffs"]:
-							generation_ms += player["squadBuffs"][boon_id]["generation"]
-							wasted_ms += player["squadBuffs"][boon_id]["wasted"]
-						if stacking:
-							uptime_percentage = round((generation_ms / player['active_time']) / (squad_supported), 3)
-							wasted_percentage = round((wasted_ms / player['active_time']) / (squad_supported), 3)
-						else:
-							uptime_percentage = round((generation_ms / player['active_time']) / (squad_supported) * 100, 3)
-							wasted_percentage = round((wasted_ms / player['active_time']) / (squad_supported) * 100, 3)
-					else:
-						raise ValueError(f"Invalid category: {category}")
+					stacking = buff_data[boon_id].get('stacking', False)
+					generation_ms, wasted_ms, uptime_raw, wasted_raw = boon_metrics.get(player, boon_id, category)
+					uptime_percentage = round(uptime_raw, 3)
+					wasted_percentage = round(wasted_raw, 3)
 					
 					# Determine entry based on toggle
 
@@ -1397,7 +1464,143 @@ def build_boon_summary(top_stats: dict, boons: dict, category: str, buff_data: d
 	)    
 
 
-def build_uptime_summary(top_stats: dict, boons: dict, buff_data: dict, caption: str, tid_date_time: str, boon_type = None) -> None:
+NON_DAMAGING_CONDITIONS = {
+	'b720', #Blinded
+	'b721', #Crippled
+	'b722', #Chilled
+	'b727', #Immobile
+	'b742', #Weakness
+	'b791', #Fear
+	'b26766', #Slow
+	'b27705' #Taunt
+	}
+
+DEBUFF_DAMAGE_GAINED = {"b70350", "b70806"}
+
+
+def uptime_entry(buff_uptimes: dict, boon_id: str, active_time: int) -> str:
+	"""Uptime cell of a boon, with the uptime before resist reduction as tooltip for non damaging conditions."""
+	if boon_id not in buff_uptimes:
+		return " - "
+	uptime_ms = buff_uptimes[boon_id]["uptime_ms"]
+	uptime_percentage = round(uptime_ms / active_time * 100, 3)
+	if boon_id in NON_DAMAGING_CONDITIONS:
+		offset_uptime_ms = uptime_ms - buff_uptimes[boon_id]["resist_reduction"]
+		offset_uptime_percentage = round(offset_uptime_ms / active_time * 100, 3)
+		tooltip = f"Uptime without resist reduction:<br>{uptime_percentage:.3f}%"
+		return f'<div class="xtooltip"> @@color:green; {offset_uptime_percentage:.3f}%% @@ <span class="xtooltiptext" style="padding-left: 5px">{tooltip}</span></div>'
+	return f"{uptime_percentage:.3f}%"
+
+
+def classify_buffs(overall: dict, buff_groups: dict) -> dict:
+	"""
+	Classify the buffs observed in the squad into the report groups listing them.
+
+	Each overall category is walked once, looking every observed buff up in an
+	index of the groups wanting it, instead of probing the category once per
+	configured buff of every group.
+
+	Args:
+		overall (dict): top_stats['overall'].
+		buff_groups (dict): Report group name -> (overall category, {buff_id: name}),
+			e.g. {"Conditions-In": ("buffUptimes", config_output.buffs_conditions)}.
+
+	Returns:
+		dict: Report group name -> {buff_id: name} of the buffs with uptime, in config order.
+	"""
+	wanted = {}
+	for group, (category, buffs) in buff_groups.items():
+		category_index = wanted.setdefault(category, {})
+		for buff_id in buffs:
+			category_index.setdefault(buff_id, []).append(group)
+
+	observed = {group: set() for group in buff_groups}
+	for category, category_index in wanted.items():
+		for buff_id, buff_stats in overall.get(category, {}).items():
+			groups = category_index.get(buff_id)
+			if groups and buff_stats["uptime_ms"] > 0:
+				for group in groups:
+					observed[group].add(buff_id)
+
+	return {
+		group: {buff_id: name for buff_id, name in buffs.items() if buff_id in observed[group]}
+		for group, (category, buffs) in buff_groups.items()
+	}
+
+
+class BuffMatrix:
+	"""
+	Player rows and buff cells shared by the uptime and debuff summaries.
+
+	The Party, Name, Prof and FightTime cells of every player are formatted
+	once, and each buff column is formatted the first time a summary shows
+	it and reused by the others, so the summaries no longer walk
+	top_stats['player'] once each. Two threads filling the same column
+	compute the same cells, so the cache needs no lock.
+
+	Args:
+		players (dict): top_stats['player'].
+	"""
+
+	__slots__ = ("players", "prefixes", "active", "_uptime_columns", "_target_columns")
+
+	def __init__(self, players: dict) -> None:
+		self.players = list(players.values())
+		self.prefixes = TWTable(player_columns()).rows(self.players)
+		self.active = [index for index, player in enumerate(self.players) if player["active_time"] != 0]
+		self._uptime_columns = {}
+		self._target_columns = {}
+
+	def uptime_column(self, boon_id: str) -> list:
+		"""Return the buffUptimes cells of a buff, one per active player."""
+		column = self._uptime_columns.get(boon_id)
+		if column is None:
+			players = self.players
+			column = [uptime_entry(players[index]["buffUptimes"], boon_id, players[index]["active_time"]) for index in self.active]
+			self._uptime_columns[boon_id] = column
+		return column
+
+	def target_column(self, boon_id: str) -> tuple:
+		"""Return the targetBuffs cells and applied counts of a debuff, one per player."""
+		column = self._target_columns.get(boon_id)
+		if column is None:
+			cells = []
+			counts = []
+			for player in self.players:
+				target_buff = player["targetBuffs"].get(boon_id)
+				if target_buff is None:
+					cells.append("")
+					counts.append(0)
+					continue
+				counts.append(target_buff["applied_counts"])
+				uptime_seconds = f"{round(target_buff['uptime_ms'] / 1000, 3):,.0f}"
+				if boon_id in DEBUFF_DAMAGE_GAINED:
+					cells.append(f'<span data-tooltip="Damage Gained: {target_buff["damage_gained"]:,.0f}">{uptime_seconds}</span>')
+				else:
+					cells.append(uptime_seconds)
+			column = self._target_columns[boon_id] = (cells, counts)
+		return column
+
+	def uptime_rows(self, boon_ids: list) -> list:
+		"""Return the uptime summary rows of the active players for the given buffs."""
+		columns = [self.uptime_column(boon_id) for boon_id in boon_ids]
+		prefixes = self.prefixes
+		return [
+			prefixes[index] + "".join(f" {column[row]}|" for column in columns)
+			for row, index in enumerate(self.active)
+		]
+
+	def target_rows(self, boon_ids: list) -> list:
+		"""Return the debuff summary rows of every player for the given debuffs, ending with the applied count."""
+		columns = [self.target_column(boon_id) for boon_id in boon_ids]
+		rows = []
+		for index, prefix in enumerate(self.prefixes):
+			applied_counts = sum(counts[index] for _, counts in columns)
+			rows.append(prefix + "".join(f" {cells[index]}|" for cells, _ in columns) + f" {applied_counts:,.0f}|")
+		return rows
+
+
+def build_uptime_summary(top_stats: dict, boons: dict, buff_data: dict, caption: str, tid_date_time: str, boon_type = None, buff_matrix: BuffMatrix = None) -> None:
 	"""Print a table of boon uptime stats for all players in the log.
 
 	The table will contain the following columns:
@@ -1407,116 +1610,43 @@ def build_uptime_summary(top_stats: dict, boons: dict, buff_data: dict, caption:
 	- Account
 	- Fight Time
 	- Average uptime for each boon
+
+	Args:
+		buff_matrix (BuffMatrix): Player cells shared with the other summaries. Built from top_stats when omitted.
 	"""
 	rows = []
 	
 	rows.append('<div style="overflow-y: auto; width: 100%; overflow-x:auto;">\n\n')
-	# Build the player table header
-	header = "|thead-dark table-caption-top table-hover sortable|k\n"
-	header += "|!Party |!Name | !Prof | !{{FightTime}} |"
-	for boon_id, boon_name in boons.items():
-		if boon_id not in buff_data:
-			continue
-		skillIcon = buff_data[boon_id]["icon"]
 
-		header += f" ![img width=24 [{boon_name}|{skillIcon}]] |"
-	header += "h"
+	if buff_matrix is None:
+		buff_matrix = BuffMatrix(top_stats["player"])
+
+	shown_boons = [boon_id for boon_id in boons if boon_id in buff_data]
+	header = TWTable(player_columns()).header(end="")
+	header += "".join(f" ![img width=24 [{boons[boon_id]}|{buff_data[boon_id]['icon']}]] |" for boon_id in shown_boons) + "h"
 
-	non_damaging_conditions = [
-		'b720', #Blinded
-		'b721', #Crippled
-		'b722', #Chilled
-		'b727', #Immobile
-		'b742', #Weakness
-		'b791', #Fear
-		'b26766', #Slow
-		'b27705' #Taunt
-		]
 	# Build the Squad table rows
+	overall_uptimes = top_stats["overall"]["buffUptimes"]
 	header2 = f"|Squad Average Uptime |<|<|<|"
-	for boon_id in boons:
-		if boon_id not in buff_data:
-			continue
-		if boon_id not in top_stats["overall"]["buffUptimes"]:
-			detailEntry = " - "
-		elif boon_id in non_damaging_conditions:
-			offset_uptime_ms = top_stats["overall"]["buffUptimes"][boon_id]["uptime_ms"] - top_stats["overall"]["buffUptimes"][boon_id]["resist_reduction"]
-			offset_uptime_percentage = round((offset_uptime_ms / top_stats['overall']["active_time"]) * 100, 3)
-			offset_uptime_percentage = f"{offset_uptime_percentage:.3f}%"			
-			uptime_ms = top_stats["overall"]["buffUptimes"][boon_id]["uptime_ms"]
-			uptime_percentage = round((uptime_ms / top_stats['overall']["active_time"]) * 100, 3)
-			uptime_percentage = f"{uptime_percentage:.3f}%"
-			tooltip = f"Uptime without resist reduction:<br>{uptime_percentage}"
-			# Add the tooltip to the row
-			detailEntry = f'<div class="xtooltip"> @@color:green; {offset_uptime_percentage}% @@ <span class="xtooltiptext" style="padding-left: 5px">'+tooltip+'</span></div>'
-		else:
-			uptime_ms = top_stats["overall"]["buffUptimes"][boon_id]["uptime_ms"]
-			uptime_percentage = round((uptime_ms / top_stats['overall']["active_time"]) * 100, 3)
-			detailEntry = f"{uptime_percentage:.3f}%"
-		header2 += f" {detailEntry}|" 
+	for boon_id in shown_boons:
+		header2 += f" {uptime_entry(overall_uptimes, boon_id, top_stats['overall']['active_time'])}|"
 	header2 += "h"
 
-	rows.append(header)
+	rows.append(TABLE_CLASS + "\n" + header)
 	rows.append(header2)
 	#build party table rows
 	
 	#footer, moved to header 
-	for group in top_stats["overall"]["buffUptimes"]['group']:
+	for group in overall_uptimes['group']:
 		footer = f"|Party-{group} Average Uptime |<|<|<|"
-		for boon_id in boons:
-			if boon_id not in buff_data:
-				continue
-			if boon_id not in top_stats["overall"]["buffUptimes"]['group'][group]:
-				detailEntry = " - "
-			elif boon_id in non_damaging_conditions:
-				offset_uptime_ms = top_stats["overall"]["buffUptimes"]['group'][group][boon_id]["uptime_ms"] - top_stats["overall"]["buffUptimes"]['group'][group][boon_id]["resist_reduction"]
-				offset_uptime_percentage = round((offset_uptime_ms / top_stats['overall']['group_data'][group]['fight_time']) * 100, 3)
-				offset_uptime_percentage = f"{offset_uptime_percentage:.3f}%"
-				uptime_ms = top_stats["overall"]["buffUptimes"]['group'][group][boon_id]["uptime_ms"]
-				uptime_percentage = round((uptime_ms / top_stats['overall']['group_data'][group]['fight_time']) * 100, 3)
-				uptime_percentage = f"{uptime_percentage:.3f}%"
-				tooltip = f"Uptime without resist reduction:<br>{uptime_percentage}"
-				# Add the tooltip to the row
-				detailEntry = f'<div class="xtooltip"> @@color:green; {offset_uptime_percentage}% @@ <span class="xtooltiptext" style="padding-left: 5px">'+tooltip+'</span></div>'
-			else:
-				uptime_ms = top_stats["overall"]["buffUptimes"]['group'][group][boon_id]["uptime_ms"]
-				uptime_percentage = round((uptime_ms / top_stats['overall']['group_data'][group]['fight_time']) * 100, 3)
-				detailEntry = f"{uptime_percentage:.3f}%"
-			footer += f" {detailEntry}|"
+		group_time = top_stats['overall']['group_data'][group]['fight_time']
+		for boon_id in shown_boons:
+			footer += f" {uptime_entry(overall_uptimes['group'][group], boon_id, group_time)}|"
 		footer += "h"	#footer, moved to header
 		rows.append(footer)
 
 	# Build the table body
-	for player in top_stats["player"].values():
-		if player["active_time"] == 0:
-			continue	
-		account = player["account"]
-		name = player["name"]
-		tt_name = f'<span data-tooltip="{account}">{name}</span>'
-		row = f"| {player['last_party']} |{tt_name} |"+" {{"+f"{player['profession']}"+"}}"+f" {player['profession'][:3]} "+f"| {player['active_time'] / 1000:,.1f}|"
-		for boon_id in boons:
-			if boon_id not in buff_data:
-				continue
-
-			if boon_id not in player["buffUptimes"]:
-				detailEntry = " - "
-			elif boon_id in non_damaging_conditions:
-				offset_uptime_ms = player["buffUptimes"][boon_id]["uptime_ms"] - player["buffUptimes"][boon_id]["resist_reduction"]
-				offset_uptime_percentage = round(offset_uptime_ms / player['active_time'] * 100, 3)
-				offset_uptime_percentage = f"{offset_uptime_percentage:.3f}%"
-				uptime_ms = player["buffUptimes"][boon_id]["uptime_ms"]
-				uptime_percentage = round(uptime_ms / player['active_time'] * 100, 3)
-				uptime_percentage = f"{uptime_percentage:.3f}%"
-				tooltip = f"Uptime without resist reduction:<br>{uptime_percentage}"
-				# Add the tooltip to the row
-				detailEntry = f'<div class="xtooltip"> @@color:green; {offset_uptime_percentage}% @@ <span class="xtooltiptext" style="padding-left: 5px">'+tooltip+'</span></div>'
-			else:
-				uptime_ms = player["buffUptimes"][boon_id]["uptime_ms"]
-				uptime_percentage = round(uptime_ms / player['active_time'] * 100, 3)
-				detailEntry = f"{uptime_percentage:.3f}%"
-
-			row += f" {detailEntry}|"
-		rows.append(row)
+	rows.extend(buff_matrix.uptime_rows(shown_boons))
 	rows.append(f"|{caption} Table|c")
 
 	rows.append("\n\n</div>")
@@ -1530,7 +1660,7 @@ def build_uptime_summary(top_stats: dict, boons: dict, buff_data: dict, caption:
 		tid_list
 	)
 
-def build_debuff_uptime_summary(top_stats: dict, boons: dict, buff_data: dict, caption: str, tid_date_time: str) -> None:
+def build_debuff_uptime_summary(top_stats: dict, boons: dict, buff_data: dict, caption: str, tid_date_time: str, buff_matrix: BuffMatrix = None) -> None:
 	"""Print a table of boon uptime stats for all players in the log.
 
 	The table will contain the following columns:
@@ -1548,7 +1678,10 @@ def build_debuff_uptime_summary(top_stats: dict, boons: dict, buff_data: dict, c
 		buff_data (dict): Dictionary containing information about each buff.
 		caption (str): The caption for the table.
 		tid_date_time (str): A string to use as the date and time for the table id.
+		buff_matrix (BuffMatrix): Player cells shared with the other summaries. Built from top_stats when omitted.
 	"""
+	if buff_matrix is None:
+		buff_matrix = BuffMatrix(top_stats["player"])
 	rows = []
 	
 	rows.append('<div style="overflow-y: auto; width: 100%; overflow-x:auto;">\n\n')
@@ -1585,35 +1718,7 @@ def build_debuff_uptime_summary(top_stats: dict, boons: dict, buff_data: dict, c
 	rows.append(header2)
 
 	# Build the table body
-	for player in top_stats["player"].values():
-		debuff_data = {"b70350": [0.10,'targetDamage1S'], "b70806": [0.10,'targetPowerDamage1S']}
-		account = player["account"]
-		name = player["name"]
-		tt_name = f'<span data-tooltip="{account}">{name}</span>'
-		row = f"| {player['last_party']} |{tt_name} |"+" {{"+f"{player['profession']}"+"}}"+f" {player['profession'][:3]} "+f"| {player['active_time'] / 1000:,.1f}|"
-		applied_counts = 0
-		for boon_id in boons:
-			entry = ""
-			if boon_id not in buff_data:
-				continue
-
-			if boon_id not in player["targetBuffs"]:
-				uptime_percentage = " - "
-			else:
-				applied_counts += player["targetBuffs"][boon_id]["applied_counts"]
-				uptime_ms = player["targetBuffs"][boon_id]["uptime_ms"]
-				uptime_percentage = round((uptime_ms / 1000), 3)				
-				uptime_percentage = f"{uptime_percentage:,.0f}"
-				if boon_id in debuff_data:
-					damage_gained = player['targetBuffs'][boon_id]['damage_gained']
-					entry = f'<span data-tooltip="Damage Gained: {damage_gained:,.0f}">{uptime_percentage}</span>'
-				else:
-					entry = uptime_percentage
-
-			row += f" {entry}|"
-		row += f" {applied_counts:,.0f}|"
-
-		rows.append(row)
+	rows.extend(buff_matrix.target_rows([boon_id for boon_id in boons if boon_id in buff_data]))
 	rows.append(f"|{caption} Table|c")
 
 	rows.append("\n\n</div>")
@@ -1676,46 +1781,41 @@ def build_healing_summary(top_stats: dict, caption: str, tid_date_time: str) ->
 	# Sort healing stats by total healing amount in descending order
 	sorted_healing_stats = sorted(healing_stats.items(), key=lambda x: x[1]['healing'], reverse=True)
 	
+	healers = [
+		stats for _, stats in sorted_healing_stats
+		if stats['healing'] + stats['downed_healing'] + stats['barrier']
+	]
+
+	def per_second(stat):
+		return lambda healer: healer[stat] / (healer['fight_time'] / 1000)
+
+	# One table per toggle, reading the stats with the toggle's prefix
+	heal_tables = {}
+	for toggle, prefix, downed_per_second in [
+		("Total", "", "{:,.2f}"), ("Squad", "squad_", "{:,.1f}"), ("Group", "group_", "{:,.1f}"),
+		("Self", "self_", "{:,.1f}"), ("OffSquad", "off_squad_", "{:,.1f}"),
+	]:
+		heal_tables[toggle] = TWTable(player_columns("fight_time") + [
+			Column(" !{{Healing}} |", prefix+"healing", text="{:,}"),
+			Column(" !{{HealingPS}} |", per_second(prefix+"healing"), text="{:,.2f}"),
+			Column(" !{{Barrier}} |", prefix+"barrier", text="{:,}"),
+			Column(" !{{BarrierPS}} |", per_second(prefix+"barrier"), text="{:,.2f}", cell="{}|"),
+			Column(" !{{DownedHealing}} |", prefix+"downed_healing", text="{:,}"),
+			Column(" !{{DownedHealingPS}} |", per_second(prefix+"downed_healing"), text=downed_per_second),
+		])
+
 	# Initialize HTML rows for the table
 	rows = []
 	
 	rows.append('<div style="overflow-y: auto; width: 100%; overflow-x:auto;">\n\n')
 	
 	# Build the table header
-	for toggle in ["Total", "Squad", "Group", "Self", "OffSquad"]:
+	for toggle in heal_tables:
 		rows.append(f'<$reveal stateTitle=<<currentTiddler>> stateField="category_heal" type="match" text="{toggle}" animate="yes">\n')
-		header = "|thead-dark table-caption-top table-hover sortable|k\n"
-		header += "|!Party |!Name | !Prof | !{{FightTime}} | !{{Healing}} | !{{HealingPS}} | !{{Barrier}} | !{{BarrierPS}} | !{{DownedHealing}} | !{{DownedHealingPS}} |h"
-		rows.append(header)
+		rows.append(TABLE_CLASS + "\n" + heal_tables[toggle].header())
 
 		# Build the table body
-		for healer in sorted_healing_stats:
-			name = healer[0].split('|')[0]
-			account = healer[1]['account']
-			tt_name = f'<span data-tooltip="{account}">{name}</span>'
-			if (healer[1]['healing'] + healer[1]['downed_healing'] + healer[1]['barrier']):
-				fighttime = healer[1]['fight_time'] / 1000
-				if toggle == "Total":
-					row = f"| {healer[1]['last_party']} |{tt_name} |"+" {{"+f"{healer[1]['profession']}"+"}}"+f" {healer[1]['profession'][:3]}"+" "+f"| {fighttime:,.1f}|"
-					row += f" {healer[1]['healing']:,}| {healer[1]['healing'] / fighttime:,.2f}| {healer[1]['barrier']:,}|"
-					row += f"{healer[1]['barrier'] / fighttime:,.2f}| {healer[1]['downed_healing']:,}| {healer[1]['downed_healing'] / fighttime:,.2f}|"
-				elif toggle == "Squad":
-					row = f"| {healer[1]['last_party']} |{tt_name} |"+" {{"+f"{healer[1]['profession']}"+"}}"+f" {healer[1]['profession'][:3]}"+" "+f"| {fighttime:,.1f}|"
-					row += f" {healer[1]['squad_healing']:,}| {healer[1]['squad_healing'] / fighttime:,.2f}| {healer[1]['squad_barrier']:,}|"
-					row += f"{healer[1]['squad_barrier'] / fighttime:,.2f}| {healer[1]['squad_downed_healing']:,}| {healer[1]['squad_downed_healing'] / fighttime:,.1f}|"
-				elif toggle == "Group":
-					row = f"| {healer[1]['last_party']} |{tt_name} |"+" {{"+f"{healer[1]['profession']}"+"}}"+f" {healer[1]['profession'][:3]}"+" "+f"| {fighttime:,.1f}|"
-					row += f" {healer[1]['group_healing']:,}| {healer[1]['group_healing'] / fighttime:,.2f}| {healer[1]['group_barrier']:,}|"
-					row += f"{healer[1]['group_barrier'] / fighttime:,.2f}| {healer[1]['group_downed_healing']:,}| {healer[1]['group_downed_healing'] / fighttime:,.1f}|"
-				elif toggle == "Self":
-					row = f"| {healer[1]['last_party']} |{tt_name} |"+" {{"+f"{healer[1]['profession']}"+"}}"+f" {healer[1]['profession'][:3]}"+" "+f"| {fighttime:,.1f}|"
-					row += f" {healer[1]['self_healing']:,}| {healer[1]['self_healing'] / fighttime:,.2f}| {healer[1]['self_barrier']:,}|"
-					row += f"{healer[1]['self_barrier'] / fighttime:,.2f}| {healer[1]['self_downed_healing']:,}| {healer[1]['self_downed_healing'] / fighttime:,.1f}|"
-				elif toggle == "OffSquad":
-					row = f"| {healer[1]['last_party']} |{tt_name} |"+" {{"+f"{healer[1]['profession']}"+"}}"+f" {healer[1]['profession'][:3]}"+" "+f"| {fighttime:,.1f}|"
-					row += f" {healer[1]['off_squad_healing']:,}| {healer[1]['off_squad_healing'] / fighttime:,.2f}| {healer[1]['off_squad_barrier']:,}|"
-					row += f"{healer[1]['off_squad_barrier'] / fighttime:,.2f}| {healer[1]['off_squad_downed_healing']:,}| {healer[1]['off_squad_downed_healing'] / fighttime:,.1f}|"
-				rows.append(row)
+		rows.extend(heal_tables[toggle].rows(healers))
 
 	# Add caption row and finalize table
 		rows.append(f'|<$radio field="category_heal" value="Total"> Total  </$radio> - <$radio field="category_heal" value="Squad"> Squad  </$radio> - <$radio field="category_heal" value="Group"> Group  </$radio> - <$radio field="category_heal" value="Self"> Self  </$radio>  - <$radio field="category_heal" value="OffSquad"> OffSquad  </$radio>- {caption} Table|c')
@@ -1903,7 +2003,7 @@ def build_skill_cast_summary(skill_casts_by_role: dict, skill_data: dict, captio
 	for prof_role, cast_data in skill_casts_by_role.items():
 		# Get the total number of casts per skill
 		cast_skills = cast_data['total']
-		sorted_cast_skills = sorted(cast_skills.items(), key=lambda x: x[1], reverse=True)
+		sorted_cast_skills = select_top(cast_skills.items(), skill_casts_by_role_limit, key=itemgetter(1))
 		rows = []
 		
 		rows.append('<div style="overflow-y: auto; width: 100%; overflow-x:auto;">\n\n')
@@ -1913,17 +2013,14 @@ def build_skill_cast_summary(skill_casts_by_role: dict, skill_data: dict, captio
 		apm_entry = f'<div class="xtooltip"> APM <span class="xtooltiptext" style="padding-left: 5px">Total Actions per Minute /<br>APM without Autos</span></div>'
 		header += f" {apm_entry}|"
 		# Add the skill names to the header
-		i = 0
 		for skill, count in sorted_cast_skills:
-			if i < skill_casts_by_role_limit:
-				skill_icon = skill_data[skill]['icon']
-				skill_name = skill_data[skill]['name']
-				skill_auto = skill_data[skill]['auto']
-				if skill_auto:
-					header += f'![img width=24 class="tc-test-case-wrapper" [{skill_name}|{skill_icon}]]|'				
-				else:
-					header += f"![img width=24 [{skill_name}|{skill_icon}]]|"
-			i+=1
+			skill_icon = skill_data[skill]['icon']
+			skill_name = skill_data[skill]['name']
+			skill_auto = skill_data[skill]['auto']
+			if skill_auto:
+				header += f'![img width=24 class="tc-test-case-wrapper" [{skill_name}|{skill_icon}]]|'				
+			else:
+				header += f"![img width=24 [{skill_name}|{skill_icon}]]|"
 		header += "h"
 
 		rows.append(header)
@@ -1943,14 +2040,11 @@ def build_skill_cast_summary(skill_casts_by_role: dict, skill_data: dict, captio
 		
 			row = f"|{name} |" + " " + f"{profession} " + f"|{account} |" + f"{time_secs:,.1f}|" + f" {apm}/{apm_no_auto} |"
 			# Add the skill casts per minute to the row
-			i = 0
 			for skill, count in sorted_cast_skills:
-				if i < skill_casts_by_role_limit:
-					if skill in player_data['Skills']:
-						row += f" {(player_data['Skills'][skill] / time_mins):.2f}|"
-					else:
-						row += f" - |"
-				i+=1
+				if skill in player_data['Skills']:
+					row += f" {(player_data['Skills'][skill] / time_mins):.2f}|"
+				else:
+					row += f" - |"
 			rows.append(row)
 
 		rows.append(f"|{caption} / Minute|c")
@@ -2147,12 +2241,85 @@ def build_main_tid(datetime, tag_list, guild_name, description_append):
 		tid_list
 	)
 
-def build_menu_tid(datetime: str, db_update: bool) -> None:
+# Menu tab of each tiddler title suffix and the builder creating it
+MENU_TAB_BUILDERS = {
+	"Overview": "build_fight_summary",
+	"General-Stats": "build_general_stats_tid",
+	"Buffs": "build_buffs_stats_tid",
+	"Damage-Modifiers": "build_damage_modifiers_menu_tid",
+	"Mechanics": "build_mechanics_tid",
+	"Skill-Usage": "build_skill_usage_stats_tid",
+	"Minions": "build_minions_tid",
+	"High-Scores": "build_high_scores_tid",
+	"Top-Damage-By-Skill": "build_top_damage_by_skill",
+	"Player-Damage-By-Skill": "build_damage_outgoing_by_skill_tid",
+	"Squad-Composition": "build_squad_composition",
+	"On-Tag-Review": "build_on_tag_review",
+	"DPS-Stats": "build_dps_stats_menu",
+	"Defense-Damage-Mitigation": "build_defense_damage_mitigation",
+	"Attendance": "build_attendance_table",
+	"commander-summary-menu": "build_commander_summary_menu",
+	"Dashboard": "build_dashboard_menu_tid",
+	"Leaderboard": "build_leaderboard_menu_tid",
+	"high_scores_Leaderboard": "build_high_scores_leaderboard_tids",
+	"Damage": "build_damage_summary_table",
+	"Damage-With-Buffs": "build_damage_with_buffs",
+	"Offensive-Summary": "build_category_summary_report",
+	"Offensive-Detailed": "build_category_summary_report",
+	"Defenses-Summary": "build_category_summary_report",
+	"Defenses-Detailed": "build_category_summary_report",
+	"Support-Summary": "build_category_summary_report",
+	"Support-Detailed": "build_category_summary_report",
+	"Heal-Stats": "build_healing_summary",
+	"Healers": "build_healer_menu_tabs",
+	"Combat-Resurrect": "build_combat_resurrection_stats_tid",
+	"FB-Pages": "build_fb_pages_tid",
+	"Mesmer-Clone-Usage": "build_mesmer_clone_usage",
+	"Pull-Skills": "build_pull_stats_tid",
+	"Support-Bubble-Chart": "build_support_bubble_chart",
+	"DPS-Bubble-Chart": "build_DPS_bubble_chart",
+	"Utility-Bubble-Chart": "build_utility_bubble_chart",
+	"Total-Squad-Boon-Generation": "build_boon_generation_bar_chart",
+	"Total-Condition-Output-Generation": "build_condition_generation_bar_chart",
+	"Boons": "build_boon_stats_tid",
+	"Boon-Generation-Detailed": "build_boon_report",
+	"Stacking-Buffs": "build_stacking_buffs",
+	"Personal-Buffs": "build_personal_buff_summary",
+	"Offensive-Buffs": "build_other_boon_stats_tid",
+	"Support-Buffs": "build_other_boon_stats_tid",
+	"Defensive-Buffs": "build_other_boon_stats_tid",
+	"Gear-Buff-Uptimes": "build_gear_buff_summary",
+	"Gear-Skill-Damage": "build_gear_skill_summary",
+	"Conditions-In": "build_uptime_summary",
+	"Debuffs-In": "build_uptime_summary",
+	"Conditions-Out": "build_debuff_uptime_summary",
+	"Debuffs-Out": "build_debuff_uptime_summary",
+}
+
+
+def menu_tab_links(datetime: str, tabs: list, profile=FULL_PROFILE) -> str:
+	"""
+	Return the links of menu tabs, leaving out the tabs whose builder the profile skips.
+
+	Args:
+		datetime (str): The datetime string of the log.
+		tabs (list): Tiddler title suffixes of MENU_TAB_BUILDERS, in tab order.
+		profile (ReportProfile, optional): The report profile of the run.
+
+	Returns:
+		str: The space separated [[title]] links.
+	"""
+	return " ".join(f"[[{datetime}-{tab}]]" for tab in tabs if profile.enabled(MENU_TAB_BUILDERS[tab]))
+
+
+def build_menu_tid(datetime: str, db_update: bool, profile=FULL_PROFILE) -> None:
 	"""
 	Build a TID for the main menu.
 
 	Args:
 		datetime (str): The datetime string of the log.
+		db_update (bool): Add the leaderboard tabs, built from the database.
+		profile (ReportProfile, optional): Leaves out the tabs of the reports it skips.
 
 	Returns:
 		None
@@ -2160,26 +2327,14 @@ def build_menu_tid(datetime: str, db_update: bool) -> None:
 	tags = f"{datetime}"
 	title = f"{datetime}-Menu"
 	caption = "Menu"
+	tabs = [
+		"Overview", "General-Stats", "Buffs", "Damage-Modifiers", "Mechanics", "Skill-Usage",
+		"Minions", "High-Scores", "Top-Damage-By-Skill", "Player-Damage-By-Skill", "Squad-Composition", "On-Tag-Review",
+		"DPS-Stats", "Defense-Damage-Mitigation", "Attendance", "commander-summary-menu", "Dashboard",
+	]
 	if db_update:
-		text = (
-		f'<<tabs "[[{datetime}-Overview]] [[{datetime}-General-Stats]] [[{datetime}-Buffs]] '
-		f'[[{datetime}-Damage-Modifiers]] [[{datetime}-Mechanics]] [[{datetime}-Skill-Usage]] '
-		f'[[{datetime}-Minions]] [[{datetime}-High-Scores]] [[{datetime}-Top-Damage-By-Skill]] '
-		f'[[{datetime}-Player-Damage-By-Skill]] [[{datetime}-Squad-Composition]] [[{datetime}-On-Tag-Review]] '
-		f'[[{datetime}-DPS-Stats]] [[{datetime}-Defense-Damage-Mitigation]] [[{datetime}-Attendance]] '
-		f'[[{datetime}-commander-summary-menu]] [[{datetime}-Dashboard]] [[{datetime}-Leaderboard]] [[{datetime}-high_scores_Leaderboard]]" '
-		f'"{datetime}-Overview" "$:/temp/menutab1">>'			
-		)
-	else:
-		text = (
-			f'<<tabs "[[{datetime}-Overview]] [[{datetime}-General-Stats]] [[{datetime}-Buffs]] '
-			f'[[{datetime}-Damage-Modifiers]] [[{datetime}-Mechanics]] [[{datetime}-Skill-Usage]] '
-			f'[[{datetime}-Minions]] [[{datetime}-High-Scores]] [[{datetime}-Top-Damage-By-Skill]] '
-			f'[[{datetime}-Player-Damage-By-Skill]] [[{datetime}-Squad-Composition]] [[{datetime}-On-Tag-Review]] '
-			f'[[{datetime}-DPS-Stats]] [[{datetime}-Defense-Damage-Mitigation]] [[{datetime}-Attendance]] '
-			f'[[{datetime}-commander-summary-menu]] [[{datetime}-Dashboard]]" '
-			f'"{datetime}-Overview" "$:/temp/menutab1">>'
-		)
+		tabs += ["Leaderboard", "high_scores_Leaderboard"]
+	text = f'<<tabs "{menu_tab_links(datetime, tabs, profile)}" "{datetime}-Overview" "$:/temp/menutab1">>'
 
 	append_tid_for_output(
 		create_new_tid_from_template(title, caption, text, tags, 
@@ -2193,44 +2348,33 @@ def build_menu_tid(datetime: str, db_update: bool) -> None:
 		tid_list
 	)
 
-def build_general_stats_tid(datetime, offensive_detailed, defenses_detailed, support_detailed):
+def build_general_stats_tid(datetime, offensive_detailed, defenses_detailed, support_detailed, profile=FULL_PROFILE):
 	"""
-	Build a TID for general stats menu.
+	Build a TID for general stats menu, without the tabs of the reports the profile skips.
 	"""
 	tags = f"{datetime}"
 	title = f"{datetime}-General-Stats"
 	caption = "General Stats"
 	creator = "Drevarr@github.com"
 
-	text_parts = []
-	text_parts .append(f"<<tabs '[[{datetime}-Damage]] [[{datetime}-Damage-With-Buffs]]")
-	if offensive_detailed:
-		text_parts.append(f"[[{datetime}-Offensive-Summary]] [[{datetime}-Offensive-Detailed]]")
-	else:
-		text_parts.append(f"[[{datetime}-Offensive-Summary]]")
-
-	if defenses_detailed:
-		text_parts.append(f"[[{datetime}-Defenses-Summary]] [[{datetime}-Defenses-Detailed]]")
-	else:
-		text_parts.append(f"[[{datetime}-Defenses-Summary]]")
-
-	if support_detailed:
-		text_parts.append(f"[[{datetime}-Support-Summary]] [[{datetime}-Support-Detailed]]")
-	else:
-		text_parts.append(f"[[{datetime}-Support-Summary]]")
+	tabs = ["Damage", "Damage-With-Buffs"]
+	for category, detailed in (("Offensive", offensive_detailed), ("Defenses", defenses_detailed), ("Support", support_detailed)):
+		tabs.append(f"{category}-Summary")
+		if detailed:
+			tabs.append(f"{category}-Detailed")
 
-	text = " ".join(text_parts)
-	text += f"[[{datetime}-Heal-Stats]] [[{datetime}-Healers]] [[{datetime}-Combat-Resurrect]] [[{datetime}-FB-Pages]] [[{datetime}-Mesmer-Clone-Usage]]"
-	text += f"[[{datetime}-Pull-Skills]]' '{datetime}-Offensive-Summary' '$:/temp/tab1'>>"
+	text = "<<tabs '" + menu_tab_links(datetime, tabs, profile)
+	text += menu_tab_links(datetime, ["Heal-Stats", "Healers", "Combat-Resurrect", "FB-Pages", "Mesmer-Clone-Usage"], profile)
+	text += menu_tab_links(datetime, ["Pull-Skills"], profile) + f"' '{datetime}-Offensive-Summary' '$:/temp/tab1'>>"
 
 	append_tid_for_output(
 		create_new_tid_from_template(title, caption, text, tags, creator=creator, fields={'radio': 'Total', 'damage_with_buff': 'might', 'boon_selected':'Might', 'Support_selected': 'condiCleanse', 'Offensive_selected': 'downContribution', 'Defenses_selected': 'damageTaken'}),
 		tid_list
 	)
 
-def build_dashboard_menu_tid(datetime: str) -> None:
+def build_dashboard_menu_tid(datetime: str, profile=FULL_PROFILE) -> None:
 	"""
-	Build a TID for the dashboard menu.
+	Build a TID for the dashboard menu, without the charts the profile skips.
 	"""
 
 	tags = f"{datetime}"
@@ -2238,7 +2382,8 @@ def build_dashboard_menu_tid(datetime: str) -> None:
 	caption = "Dashboard"
 	creator = "Drevarr@github.com"
 
-	text = (f"<<tabs '[[{datetime}-Support-Bubble-Chart]] [[{datetime}-DPS-Bubble-Chart]] [[{datetime}-Utility-Bubble-Chart]] [[{datetime}-Total-Squad-Boon-Generation]] [[{datetime}-Total-Condition-Output-Generation]]' "
+	tabs = ["Support-Bubble-Chart", "DPS-Bubble-Chart", "Utility-Bubble-Chart", "Total-Squad-Boon-Generation", "Total-Condition-Output-Generation"]
+	text = (f"<<tabs '{menu_tab_links(datetime, tabs, profile)}' "
 			f"'{datetime}-Support-Bubble-Chart' '$:/temp/tab1'>>")
 
 	append_tid_for_output(
@@ -2264,24 +2409,21 @@ def build_damage_modifiers_menu_tid(datetime: str) -> None:
 		tid_list
 	)
 
-def build_buffs_stats_tid(datetime, boons_detailed):
+def build_buffs_stats_tid(datetime, boons_detailed, profile=FULL_PROFILE):
 	"""
-	Build a TID for buffs menu.
+	Build a TID for buffs menu, without the tabs of the reports the profile skips.
 	"""
 	tags = f"{datetime}"
 	title = f"{datetime}-Buffs"
 	caption = "Buffs"
 	creator = "Drevarr@github.com"
+	tabs = ["Boons", "Stacking-Buffs", "Personal-Buffs", "Offensive-Buffs", "Support-Buffs", "Defensive-Buffs"]
 	if boons_detailed:
-		text = (f"<<tabs '[[{datetime}-Boons]] [[{datetime}-Boon-Generation-Detailed]] [[{datetime}-Stacking-Buffs]] [[{datetime}-Personal-Buffs]] [[{datetime}-Offensive-Buffs]] [[{datetime}-Support-Buffs]] [[{datetime}-Defensive-Buffs]]"
-				f" [[{datetime}-Gear-Buff-Uptimes]] [[{datetime}-Gear-Skill-Damage]]"
-				f"[[{datetime}-Conditions-In]] [[{datetime}-Debuffs-In]] [[{datetime}-Conditions-Out]] [[{datetime}-Debuffs-Out]]' "
-				f"'{datetime}-Boons' '$:/temp/tab1'>>")
-	else:
-		text = (f"<<tabs '[[{datetime}-Boons]] [[{datetime}-Stacking-Buffs]] [[{datetime}-Personal-Buffs]] [[{datetime}-Offensive-Buffs]] [[{datetime}-Support-Buffs]] [[{datetime}-Defensive-Buffs]]"
-				f" [[{datetime}-Gear-Buff-Uptimes]] [[{datetime}-Gear-Skill-Damage]]"
-				f"[[{datetime}-Conditions-In]] [[{datetime}-Debuffs-In]] [[{datetime}-Conditions-Out]] [[{datetime}-Debuffs-Out]]' "
-				f"'{datetime}-Boons' '$:/temp/tab1'>>")
+		tabs.insert(1, "Boon-Generation-Detailed")
+	text = (f"<<tabs '{menu_tab_links(datetime, tabs, profile)}"
+			f" {menu_tab_links(datetime, ['Gear-Buff-Uptimes', 'Gear-Skill-Damage'], profile)}"
+			f"{menu_tab_links(datetime, ['Conditions-In', 'Debuffs-In', 'Conditions-Out', 'Debuffs-Out'], profile)}' "
+			f"'{datetime}-Boons' '$:/temp/tab1'>>")
 
 	append_tid_for_output(
 		create_new_tid_from_template(title, caption, text, tags, creator=creator),
@@ -2558,8 +2700,8 @@ def build_high_scores_tid(high_scores: dict, skill_data: dict, buff_data: dict,
 		
 		rows.append(header)
 
-		# Sort high scores for the current category
-		sorted_high_scores = sorted(high_scores[category].items(), key=lambda x: x[1], reverse=True)
+		# Sort high scores for the current category, already bounded by their TopK tracker
+		sorted_high_scores = select_top(high_scores[category].items(), key=itemgetter(1))
 		
 		# Build rows for each player
 		for player in sorted_high_scores:
@@ -2902,6 +3044,9 @@ def build_minions_tid(minions: dict, players: dict, skill_data: dict, caption: s
 			tid_list
 		)
 
+TOP_DAMAGE_SKILLS = 25
+
+
 def build_top_damage_by_skill(total_damage_taken: dict, target_damage_dist: dict, skill_data: dict, buff_data: dict, caption: str, tid_date_time: str) -> None:
 	"""
 	Builds a table of top damage by skill.
@@ -2917,13 +3062,13 @@ def build_top_damage_by_skill(total_damage_taken: dict, target_damage_dist: dict
 		caption (str): A string caption for the table.
 		tid_date_time (str): A string representing the timestamp or unique identifier for the TID.
 	"""
-	# Sort skills by total damage in descending order
-	sorted_total_damage_taken = dict(sorted(total_damage_taken.items(), key=lambda item: item[1]["totalDamage"], reverse=True))
-	sorted_target_damage_dist = dict(sorted(target_damage_dist.items(), key=lambda item: item[1]["totalDamage"], reverse=True))
+	# Select the top skills by total damage in descending order
+	top_damage_taken = select_top(total_damage_taken.items(), TOP_DAMAGE_SKILLS, key=lambda item: item[1]["totalDamage"])
+	top_target_damage_dist = select_top(target_damage_dist.items(), TOP_DAMAGE_SKILLS, key=lambda item: item[1]["totalDamage"])
 
 	# Calculate total damage values for percentage calculations
-	total_damage_taken_value = sum(skill["totalDamage"] for skill in sorted_total_damage_taken.values())
-	total_damage_distributed_value = sum(skill["totalDamage"] for skill in sorted_target_damage_dist.values())
+	total_damage_taken_value = sum(skill["totalDamage"] for skill in total_damage_taken.values())
+	total_damage_distributed_value = sum(skill["totalDamage"] for skill in target_damage_dist.values())
 
 	# Prepare HTML rows for the table
 	rows = []
@@ -2940,13 +3085,12 @@ def build_top_damage_by_skill(total_damage_taken: dict, target_damage_dist: dict
 	rows.append(header)
 	
 	# Populate the table with top 25 skills by damage output
-	for i, (skill_id, skill) in enumerate(sorted_target_damage_dist.items()):
-		if i < 25:
-			skill_name = skill_data.get(f"s{skill_id}", {}).get("name", buff_data.get(f"b{skill_id}", {}).get("name", ""))
-			skill_icon = skill_data.get(f"s{skill_id}", {}).get("icon", buff_data.get(f"b{skill_id}", {}).get("icon", ""))
-			entry = f"[img width=24 [{skill_name}|{skill_icon}]]-{skill_name}"
-			row = f"|{entry} | {skill['totalDamage']:,.0f} | {skill['totalDamage']/total_damage_distributed_value*100:,.1f}% |"
-			rows.append(row)
+	for skill_id, skill in top_target_damage_dist:
+		skill_name = skill_data.get(f"s{skill_id}", {}).get("name", buff_data.get(f"b{skill_id}", {}).get("name", ""))
+		skill_icon = skill_data.get(f"s{skill_id}", {}).get("icon", buff_data.get(f"b{skill_id}", {}).get("icon", ""))
+		entry = f"[img width=24 [{skill_name}|{skill_icon}]]-{skill_name}"
+		row = f"|{entry} | {skill['totalDamage']:,.0f} | {skill['totalDamage']/total_damage_distributed_value*100:,.1f}% |"
+		rows.append(row)
 
 	rows.append(f"| Squad Damage Output |c")
 	rows.append('\n\n</div>\n\n    <div class="flex-col">\n\n')
@@ -2957,13 +3101,12 @@ def build_top_damage_by_skill(total_damage_taken: dict, target_damage_dist: dict
 	rows.append(header)
 
 	# Populate the table with top 25 skills by damage taken
-	for i, (skill_id, skill) in enumerate(sorted_total_damage_taken.items()):
-		if i < 25:
-			skill_name = skill_data.get(f"s{skill_id}", {}).get("name", buff_data.get(f"b{skill_id}", {}).get("name", ""))
-			skill_icon = skill_data.get(f"s{skill_id}", {}).get("icon", buff_data.get(f"b{skill_id}", {}).get("icon", ""))
-			entry = f"[img width=24 [{skill_name}|{skill_icon}]]-{skill_name}"
-			row = f"|{entry} | {skill['totalDamage']:,.0f} | {skill['totalDamage']/total_damage_taken_value*100:,.1f}% |"
-			rows.append(row)
+	for skill_id, skill in top_damage_taken:
+		skill_name = skill_data.get(f"s{skill_id}", {}).get("name", buff_data.get(f"b{skill_id}", {}).get("name", ""))
+		skill_icon = skill_data.get(f"s{skill_id}", {}).get("icon", buff_data.get(f"b{skill_id}", {}).get("icon", ""))
+		entry = f"[img width=24 [{skill_name}|{skill_icon}]]-{skill_name}"
+		row = f"|{entry} | {skill['totalDamage']:,.0f} | {skill['totalDamage']/total_damage_taken_value*100:,.1f}% |"
+		rows.append(row)
 
 	rows.append(f"| Enemy Damage Output |c")
 	rows.append("\n\n</div>\n\n</div>")
@@ -2980,15 +3123,19 @@ def build_top_damage_by_skill(total_damage_taken: dict, target_damage_dist: dict
 		tid_list
 	)
 
-def build_healer_menu_tabs(top_stats: dict, caption: str, tid_date_time: str) -> None:
-	"""Builds a menu tab macro for healers."""
+def build_healer_menu_tabs(top_stats: dict, caption: str, tid_date_time: str, shards: bool = False) -> None:
+	"""Builds a menu tab macro for healers, or with shards a template selecting them from the healer shards."""
 
 	# Build the menu tab macro
 	menu_tags = f"{tid_date_time}"
 	menu_title = f"{tid_date_time}-Healers"
 	menu_caption = f"Healer - Outgoing"
 	menu_creator = f"Drevarr@github.com"
-	menu_text = f'<$macrocall $name="tabs" tabsList="[prefix[{tid_date_time}-Healers-]]" '+'default={{{'+f'[prefix[{tid_date_time}-Healers-]first[]]'+'}}} state="$:/temp/sel_healer"/>'
+	if shards:
+		healer_shards = PlayerShards(f"{tid_date_time}-{caption.replace(' ', '-')}")
+		menu_text = healer_shards.macros() + "\n".join(healer_shards.select("$:/temp/sel_healer"))
+	else:
+		menu_text = f'<$macrocall $name="tabs" tabsList="[prefix[{tid_date_time}-Healers-]]" '+'default={{{'+f'[prefix[{tid_date_time}-Healers-]first[]]'+'}}} state="$:/temp/sel_healer"/>'
 
 	# Push the menu tab to the output list
 	append_tid_for_output(
@@ -2996,13 +3143,17 @@ def build_healer_menu_tabs(top_stats: dict, caption: str, tid_date_time: str) ->
 		tid_list
 	)
 
-def build_healer_outgoing_tids(top_stats: dict, skill_data: dict, buff_data: dict, caption: str, tid_date_time: str) -> None:
+def build_healer_outgoing_tids(top_stats: dict, skill_data: dict, buff_data: dict, caption: str, tid_date_time: str, shards: bool = False) -> None:
 	"""
 	Builds tables of outgoing healing and barrier by player and skill.
 
 	Iterates through each healer and builds a table of their outgoing healing and barrier by skill.
 	It also builds a table of the total healing and barrier by target.
+
+	With shards the tables are packed into one data tiddler per profession,
+	see tw_shard, rendered by the template of build_healer_menu_tabs().
 	"""
+	healer_shards = PlayerShards(f"{tid_date_time}-{caption.replace(' ', '-')}") if shards else None
 
 	# Iterate through each healer
 	for healer in top_stats['players_running_healing_addon']:
@@ -3033,6 +3184,8 @@ def build_healer_outgoing_tids(top_stats: dict, skill_data: dict, buff_data: dic
 				skill_name = skill_data.get(skill, {}).get("name", buff_data.get(skill.replace("s", "b"), {}).get("name", ""))
 				skill_icon = skill_data.get(skill, {}).get("icon", buff_data.get(skill.replace("s", "b"), {}).get("icon", ""))
 				entry = f"[img width=24 [{skill_name}|{skill_icon}]]-{skill_name}"
+				if healer_shards is not None:
+					entry = healer_shards.skill(skill, entry)
 				hits = top_stats['player'][healer]['extHealingStats']['skills'][skill]['hits']
 				total_healing = top_stats['player'][healer]['extHealingStats']['skills'][skill]['healing']
 				avg_healing = total_healing/hits if hits > 0 else 0
@@ -3061,6 +3214,8 @@ def build_healer_outgoing_tids(top_stats: dict, skill_data: dict, buff_data: dic
 				skill_name = skill_data.get(skill, {}).get("name", buff_data.get(skill.replace("s", "b"), {}).get("name", ""))
 				skill_icon = skill_data.get(skill, {}).get("icon", buff_data.get(skill.replace("s", "b"), {}).get("icon", ""))
 				entry = f"[img width=24 [{skill_name}|{skill_icon}]]-{skill_name}"
+				if healer_shards is not None:
+					entry = healer_shards.skill(skill, entry)
 				max_barrier = top_stats['player'][healer]['extBarrierStats']['skills'][skill]['max']
 				hits = top_stats['player'][healer]['extBarrierStats']['skills'][skill]['hits']
 				total_barrier = top_stats['player'][healer]['extBarrierStats']['skills'][skill]['totalBarrier']
@@ -3112,12 +3267,20 @@ def build_healer_outgoing_tids(top_stats: dict, skill_data: dict, buff_data: dic
 
 		text = "\n".join(rows)
 
+		if healer_shards is not None:
+			healer_shards.add(healer_profession, healer_name if healer_name != healer_profession else account, text)
+			continue
+
 		append_tid_for_output(
 			create_new_tid_from_template(healer_title, healer_caption, text, healer_tags),
 			tid_list
 		)
 
-def build_damage_outgoing_by_skill_tid(tid_date_time: str, tid_list: list) -> None:
+	if healer_shards is not None:
+		for tiddler in healer_shards.tiddlers():
+			append_tid_for_output(tiddler, tid_list)
+
+def build_damage_outgoing_by_skill_tid(tid_date_time: str, tid_list: list, shards: bool = False) -> None:
 	"""
 	Build a table of damage outgoing by player and skill.
 
@@ -3127,6 +3290,8 @@ def build_damage_outgoing_by_skill_tid(tid_date_time: str, tid_list: list) -> No
 	Args:
 		tid_date_time (str): A string to use as the date and time for the table id.
 		tid_list (list): A list of tiddlers to which the new tid will be added.
+		shards (bool, optional): Select the players from the shards of
+			build_damage_outgoing_by_player_skill_tids(). Defaults to False.
 	"""
 	rows = []
 	# Set the title, caption and tags for the table
@@ -3134,6 +3299,14 @@ def build_damage_outgoing_by_skill_tid(tid_date_time: str, tid_list: list) -> No
 	tid_caption = "Player Damage by Skill"
 	tid_tags = tid_date_time
 
+	if shards:
+		damage_shards = PlayerShards(f"{tid_date_time}-Damage-By-Skill")
+		append_tid_for_output(
+			create_new_tid_from_template(tid_title, tid_caption, damage_shards.macros() + "\n".join(damage_shards.select()), tid_tags),
+			tid_list
+		)
+		return
+
 	# Add the select component to the table
 	rows.append('\n!!!Select players(ctrl+click):')
 	rows.append('<$let state=<<qualify $:/temp/selectedPlayer>>>')
@@ -3161,7 +3334,7 @@ def build_damage_outgoing_by_skill_tid(tid_date_time: str, tid_list: list) -> No
 		tid_list
 	)
 	
-def build_damage_outgoing_by_player_skill_tids(top_stats: dict, skill_data: dict, buff_data: dict, tid_date_time: str, tid_list: list) -> None:
+def build_damage_outgoing_by_player_skill_tids(top_stats: dict, skill_data: dict, buff_data: dict, tid_date_time: str, tid_list: list, shards: bool = False) -> None:
 	"""
 	Build a table of damage outgoing by player and skill.
 
@@ -3171,7 +3344,10 @@ def build_damage_outgoing_by_player_skill_tids(top_stats: dict, skill_data: dict
 		buff_data (dict): A dictionary containing buff metadata, such as name and icon.
 		tid_date_time (str): A string representing the timestamp or unique identifier for the TID.
 		tid_list (list): A list of TIDs to which the generated TID should be appended.
+		shards (bool, optional): Pack the tables into one data tiddler per
+			profession instead of a tiddler per player, see tw_shard. Defaults to False.
 	"""
+	damage_shards = PlayerShards(f"{tid_date_time}-Damage-By-Skill") if shards else None
 	# Sort players by total damage output in descending order
 	damage_totals = {
 		player: data['dpsTargets']['damage']
@@ -3208,6 +3384,8 @@ def build_damage_outgoing_by_player_skill_tids(top_stats: dict, skill_data: dict
 			if connect_hits == 0:
 				connect_hits = 1
 			entry = f"[img width=24 [{skill_name}|{skill_icon}]]-{skill_name[:30]}"
+			if damage_shards is not None:
+				entry = damage_shards.skill(f"s{skill_id}", entry)
 			row = f"|{entry} | {damage:,.0f} | {connect_hits} | {damage / connect_hits:,.1f} | {damage / total_damage * 100:,.1f}%|"
 			rows.append(row)
 		rows.append("\n</div>\n")
@@ -3219,11 +3397,19 @@ def build_damage_outgoing_by_player_skill_tids(top_stats: dict, skill_data: dict
 		else:
 			player_caption = f"{{{profession}}} - {name}"
 
+		if damage_shards is not None:
+			damage_shards.add(profession, name if profession != name else account, text)
+			continue
+
 		append_tid_for_output(
 			create_new_tid_from_template(player_title, player_caption, text, tid_date_time),
 			tid_list
 		)
 
+	if damage_shards is not None:
+		for tiddler in damage_shards.tiddlers():
+			append_tid_for_output(tiddler, tid_list)
+
 def build_squad_composition(top_stats: dict, tid_date_time: str, tid_list: list) -> None:
 	"""
 	Build a table of the squad composition for each fight.
@@ -3396,7 +3582,29 @@ def build_dps_stats_tids(DPSStats: dict, tid_date_time: str, tid_list: list) ->
 			continue
 		sorted_DPSStats.append([player_prof, DPSStats[player_prof]['damageTotal'] / fightTime])
 	sorted_DPSStats = sorted(sorted_DPSStats, key=lambda x: x[1], reverse=True)
-	sorted_DPSStats = list(map(lambda x: x[0], sorted_DPSStats))
+	sorted_DPSStats = [DPSStats[player_prof] for player_prof, _ in sorted_DPSStats]
+
+	def chunk_column(tab: str, i: int) -> Column:
+		"""Column of the i second chunk, the tooltip showing the other of its total or per second value."""
+		key = tabs[tab]
+		total = lambda player: player[key][i]
+		if tab == "Ch-DPS":
+			tooltip, text = total, lambda player: round(player[key][i] / player['duration'])
+		elif tab == "Ch-Total":
+			tooltip, text = lambda player: round(player[key][i] / player['duration']), total
+		elif tab in ["Bur-Total","Ch5Ca-Total"]:
+			tooltip, text = lambda player: round(player[key][i] / i), total
+		else:
+			tooltip, text = total, lambda player: round(player[key][i] / i)
+		return Column(f" !{tab} ({i})s|", text, text="{:,.0f}", tooltip=tooltip, tooltip_text=f"{{:,.0f}} chunk({i}) damage")
+
+	dps_columns = [
+		Column("!Player |", ("account", "name"), text="<span data-tooltip='{}'>{}</span>", cell="{} |"),
+		Column("!Profession |", ("profession", lambda player: player["profession"][:3]), text="{{{{{}}}}} {}"),
+		Column(" ! <span data-tooltip=`Number of seconds player was in squad logs`>Seconds</span>|", "duration", cell=" {} |"),
+		Column(" !DPS|", lambda player: round(player['damageTotal'] / player['duration']), text="{:,.0f}", tooltip="damageTotal", tooltip_text="{:,.0f} total damage", cell=" {} |"),
+		Column(" !Total|", "damageTotal", text="{:,.0f}", tooltip="damageTotal", tooltip_text="{:,.0f} total damage"),
+	]
 
 	for tab in tabs.keys():
 		rows = []
@@ -3409,30 +3617,9 @@ def build_dps_stats_tids(DPSStats: dict, tid_date_time: str, tid_list: list) ->
 		# Add the select component to the table
 		rows.append("\n\n|thead-dark table-caption-top table-hover sortable|k")
 		rows.append(f"| DPS Stats - {tab} |c")
-		header = "|!Player |!Profession | ! <span data-tooltip=`Number of seconds player was in squad logs`>Seconds</span>| !DPS| !Total|"
-		for i in range(1, 11):
-			header += f" !{tab} ({i})s|"
-		header += "h"
-		rows.append(header)
-		for player_prof in sorted_DPSStats:
-			player = DPSStats[player_prof]["name"]
-			profession = DPSStats[player_prof]["profession"]
-			account = DPSStats[player_prof]["account"]
-			fightTime = DPSStats[player_prof]['duration']
-			DPS = '<span data-tooltip="'+f"{DPSStats[player_prof]['damageTotal']:,.0f}"+' total damage">'+f"{round(DPSStats[player_prof]['damageTotal'] / fightTime):,.0f}</span>"
-			TOTAL = '<span data-tooltip="'+f"{DPSStats[player_prof]['damageTotal']:,.0f}"+' total damage">'+f"{DPSStats[player_prof]['damageTotal']:,.0f}</span>"
-			row = f"|<span data-tooltip='{account}'>{player}</span> | {{{{{profession}}}}} {profession[:3]}| {fightTime} | {DPS} | {TOTAL}|"
-			for i in range(1, 11):
-				if tab == "Ch-DPS":
-					row += ' <span data-tooltip="'+f"{DPSStats[player_prof][tabs[tab]][i]:,.0f}"+f' chunk({i}) damage">'+f"{round(DPSStats[player_prof][tabs[tab]][i] / fightTime):,.0f}</span>|"
-				elif tab == "Ch-Total":
-					row += ' <span data-tooltip="'+f"{round(DPSStats[player_prof][tabs[tab]][i] / fightTime):,.0f}"+f' chunk({i}) damage">'+f"{DPSStats[player_prof][tabs[tab]][i]:,.0f}</span>|"
-				elif tab in ["Bur-Total","Ch5Ca-Total"]:
-					row += ' <span data-tooltip="'+f"{round(DPSStats[player_prof][tabs[tab]][i] / i):,.0f}"+f' chunk({i}) damage">'+f"{DPSStats[player_prof][tabs[tab]][i]:,.0f}</span>|"
-				else:
-					row += ' <span data-tooltip="'+f"{DPSStats[player_prof][tabs[tab]][i]:,.0f}"+f' chunk({i}) damage">'+f"{round(DPSStats[player_prof][tabs[tab]][i] / i):,.0f}</span>|"
-
-			rows.append(row)	
+		table = TWTable(dps_columns + [chunk_column(tab, i) for i in range(1, 11)])
+		rows.append(table.header())
+		rows.extend(table.rows(sorted_DPSStats))
 
 		text = "\n".join(rows)
 
@@ -3657,8 +3844,12 @@ def build_DPS_bubble_chart(top_stats: dict, tid_date_time: str, tid_list: list,
 		tid_list
 	)
 
-def build_boon_generation_bar_chart(top_stats: dict, boons: dict, weights: dict, tid_date_time: str, tid_list: list) -> None:
-	total_boon_generation = []
+def build_boon_generation_bar_chart(top_stats: dict, boons: dict, weights: dict, tid_date_time: str, tid_list: list, boon_metrics: BoonMetrics = None) -> None:
+	total_boon_generation = ChartDataset(
+		f"{tid_date_time}-Total-Squad-Boon-Generation-Data",
+		"Total Squad Boon Generation Data",
+		['Player', "Might", "Fury", "Quickness", "Alacrity", "Protection", "Regeneration", "Vigor", "Aegis", "Stability", "Swiftness", "Resistance", "Resolution", 'Total', 'Profession'],
+	)
 	playerCount = 0
 
 	for player, player_data in top_stats['player'].items():
@@ -3676,7 +3867,10 @@ def build_boon_generation_bar_chart(top_stats: dict, boons: dict, weights: dict,
 		for boon in boons:			
 			if boon in ['b5974', 'b13017', 'b10269']:
 				continue
-			generation_ms = player_data['squadBuffs'].get(boon, {}).get('generation', 0)
+			if boon_metrics is not None:
+				generation_ms = boon_metrics.generation(player_data, boon, 'squadBuffs')
+			else:
+				generation_ms = player_data['squadBuffs'].get(boon, {}).get('generation', 0)
 			boon_weight = float(weights['Boon_Weights'].get(boons[boon].lower(), 0))
 			#print(f"Boon Wt Type: {type(boon_weight)}")
 			gen_per_sec = (generation_ms / player_active_time)
@@ -3692,12 +3886,7 @@ def build_boon_generation_bar_chart(top_stats: dict, boons: dict, weights: dict,
 	chart_text = f"""
 <$echarts $text=```
 const dataset = [
-  {{
-    dimensions: [
-      'Player',"Might", "Fury", "Quickness", "Alacrity", "Protection", "Regeneration", "Vigor", "Aegis", "Stability", "Swiftness", "Resistance", "Resolution",'Total','Profession'
-    ],
-    source: {total_boon_generation}
-  }}
+  {total_boon_generation.reference()}
 ];
 function buildSeries(datasetIndex = 1) {{
   // List of dimensions we don't want as boons
@@ -3799,9 +3988,14 @@ option = {{
 		create_new_tid_from_template(tid_title, tid_caption, chart_text, tid_tags),
 		tid_list
 	)
+	append_tid_for_output(total_boon_generation.tiddler(), tid_list)
 
 def build_condition_generation_bar_chart(top_stats: dict, conditions: dict, weights: dict, tid_date_time: str, tid_list: list) -> None:
-	total_condition_generation = []
+	total_condition_generation = ChartDataset(
+		f"{tid_date_time}-Total-Condition-Output-Generation-Data",
+		"Total Condition Output Generation Data",
+		['Player', "Bleeding", "Burning", "Confusion", "Poison", "Torment", "Blind", "Chilled", "Crippled", "Fear", "Immobile", "Slow", "Weakness", "Taunt", "Vulnerability", 'Total', 'Profession'],
+	)
 	playerCount = 0
 
 	for player, player_data in top_stats['player'].items():
@@ -3833,12 +4027,7 @@ def build_condition_generation_bar_chart(top_stats: dict, conditions: dict, weig
 	chart_text = f"""
 <$echarts $text=```
 const dataset = [
-  {{
-    dimensions: [
-      'Player',"Bleeding", "Burning", "Confusion", "Poison", "Torment", "Blind", "Chilled", "Crippled", "Fear", "Immobile", "Slow", "Weakness", "Taunt",  "Vulnerability",'Total','Profession'
-    ],
-    source: {total_condition_generation}
-  }}
+  {total_condition_generation.reference()}
 ];
 function buildSeries(datasetIndex = 1) {{
   // List of dimensions we don't want as boons
@@ -3940,6 +4129,7 @@ option = {{
 		create_new_tid_from_template(tid_title, tid_caption, chart_text, tid_tags),
 		tid_list
 	)
+	append_tid_for_output(total_condition_generation.tiddler(), tid_list)
 
 
 def build_mesmer_clone_usage(mesmer_clone_usage: dict, tid_date_time: str, tid_list: list) -> None: 
@@ -3964,9 +4154,6 @@ def build_mesmer_clone_usage(mesmer_clone_usage: dict, tid_date_time: str, tid_l
 	tid_caption = "Mesmer Clone Usage"
 	tid_tags = tid_date_time
 
-	rows.append("<style>.dot {height: 10px; width: 10px; background-color: magenta; border-radius: 50%; border: 1px solid darkmagenta; display: inline-block;}")
-	rows.append(".cols_3 {column-count: 3;}")
-	rows.append(".dot1 {height: 10px; width: 10px; background-color: white; border-radius: 50%; border: 1px solid darkmagenta; display: inline-block;} </style>")
 	rows.append('<div class="flex-row">')
 	for player, data in mesmer_clone_usage.items():
 		name=player.split("_")[0]
@@ -4683,26 +4870,53 @@ def build_defense_damage_mitigation(player_damage_mitigation: dict, player_minio
 		tid_list	
 	)
 
-def build_fight_line_chart(fight_data: dict, tid_date_time: str, tid_list: list) -> str:
+def build_fight_line_chart(fight_data: dict, tid_date_time: str, tid_list: list, max_points: int = None) -> str:
 	"""
 	Build a line chart for a single fight in the log. The chart shows both outgoing and incoming damage over time.
 
 	Args:
 		fight_data (dict): A dictionary of fight data from the log.
 		fight_num (int): The fight number to generate the chart for.
+		max_points (int, optional): Downsample longer series to this many points, keeping
+			their spikes (see numeric.lttb). Defaults to None, every second.
 
 	Returns:
 		str: The configuration string for the line chart.
 	"""
 
+	def series_row(name, damage_data):
+		"""[name, values] of a series, or [name, values, seconds] once downsampled."""
+		values = damage_data.tolist()
+		if max_points and len(values) > max_points:
+			seconds = numeric.lttb(values, max_points)
+			return [name, [values[second] for second in seconds], seconds]
+		return [name, values]
+
 	for fight_num in fight_data:
-		outgoing_damage_data = list(fight_data[fight_num]["damage1S"].values())
-		incoming_damage_data = list(fight_data[fight_num]["damageTaken1S"].values())
-		time_series = list(fight_data[fight_num]["damage1S"].keys())
 		zf_fight_num = str(fight_num).zfill(2)
 		chart_title = f"Fight-{zf_fight_num}: Damage Output Review"
+		line_chart_title = f"{tid_date_time}_Fight_{zf_fight_num}_Damage_Output_Review"
+
+		# One row per series
+		dataset = ChartDataset(f"{line_chart_title}_Data", f"Fight-{zf_fight_num}: Damage Output Data")
+		dataset.append(series_row("Outgoing Damage", fight_data[fight_num]["damage1S"]))
+		dataset.append(series_row("Incoming Damage", fight_data[fight_num]["damageTaken1S"]))
+		for player in fight_data[fight_num]["players"].keys():
+			#last_value = max(fight_data[fight_num]["players"][player]['damage1S'].values())
+			#num_keys = len(fight_data[fight_num]["players"][player]['damage1S'])
+
+			#if (last_value/num_keys) < 700:
+			#	continue
+
+			player_name = player.split("-")[1][:3]+" - "+player.split("-")[2]
+			dataset.append(series_row(player_name, fight_data[fight_num]["players"][player]['damage1S']))
+
 		line_chart_config = '```py\nPlayer_Line = players with DPS > 700 for the fight\n```\n\n\n\n<$echarts $text="""\n'
 		line_chart_config += f"""
+		const data = {dataset.reference()};
+		// Outgoing and incoming damage keep their colors, the players use the theme's
+		const lineColors = ['dodgerblue', 'khaki'];
+
 		option = {{
 		title: {{
 			text: '{chart_title}',
@@ -4741,15 +4955,15 @@ def build_fight_line_chart(fight_data: dict, tid_date_time: str, tid_list: list)
 			}}
 		],
 		xAxis: {{
-			type: 'category',
+			type: 'value',
+			max: 'dataMax',
 			nameLocation: 'middle',
 			nameGap: 40,
 			name: 'Fight Time',
 			axisLabel: {{
 			formatter: '{{value}}s',
 			align: 'center'
-			}},
-			data: {time_series}
+			}}
 		}},
 		yAxis: {{
 			type: 'value',
@@ -4757,58 +4971,20 @@ def build_fight_line_chart(fight_data: dict, tid_date_time: str, tid_list: list)
 			nameGap: 55,
 			name: 'Damage'
 		}},
-		series: [
-			{{
-			name: 'Outgoing Damage',
-			data: {outgoing_damage_data},
-			type: 'line',
-			smooth: true,
-			itemStyle: {{
-				// Color of the point.
-				color: 'dodgerblue'
-			}},
-			emphasis: {{ focus: 'series' }}
-			}},
-			{{
-			name: 'Incoming Damage',
-			data: {incoming_damage_data},
+		series: data.source.map(([name, values, seconds], index) => ({{
+			name: name,
+			// Downsampled series list the second of each value
+			data: values.map((value, i) => [seconds ? seconds[i] : i, value]),
 			type: 'line',
 			smooth: true,
-			itemStyle: {{
-			// Color of the point.
-			color: 'khaki'
-			}},
+			itemStyle: index < lineColors.length ? {{ color: lineColors[index] }} : {{}},
 			emphasis: {{ focus: 'series' }}
-			}}
-		"""
-		for player in fight_data[fight_num]["players"].keys():
-			#last_value = max(fight_data[fight_num]["players"][player]['damage1S'].values())
-			#num_keys = len(fight_data[fight_num]["players"][player]['damage1S'])
+		}}))
+		}};
 
-			#if (last_value/num_keys) < 700:
-			#	continue
-
-			player_name = player.split("-")[1][:3]+" - "+player.split("-")[2]
-			player_damage_data = []
-			last_index = 0
-			for index in range(len(fight_data[fight_num]["players"][player]['damage1S'])):
-				cur_damage = fight_data[fight_num]["players"][player]['damage1S'][index] # - fight_data[fight_num]["players"][player]['damage1S'][last_index]
-				
-				player_damage_data.append(cur_damage)
-				last_index = index
-
-			player_line_chart_config = f""",
-		{{
-		name: '{player_name}',
-		data: {player_damage_data},
-		type: 'line',
-		smooth: true,
-		emphasis: {{ focus: 'series' }}
-		}}"""
-			line_chart_config += player_line_chart_config
-		line_chart_config += '\n    ]\n    };\n\n"""$height="500px" $width="100%" $theme="dark"/>'
+"""
+		line_chart_config += '"""$height="500px" $width="100%" $theme="dark"/>'
 
-		line_chart_title = f"{tid_date_time}_Fight_{zf_fight_num}_Damage_Output_Review"
 		line_chart_caption = f"Fight-{zf_fight_num}: Damage Output Review"
 		line_chart_tags = "Chart"
 
@@ -4816,6 +4992,7 @@ def build_fight_line_chart(fight_data: dict, tid_date_time: str, tid_list: list)
 			create_new_tid_from_template(line_chart_title, line_chart_caption, line_chart_config, line_chart_tags),
 			tid_list	
 		)
+		append_tid_for_output(dataset.tiddler(), tid_list)
 
 def build_pull_stats_tid(tid_date_time: str, top_stats: dict, skill_data: dict, tid_list: list) -> None:
 	Pull_Skills = config.pull_skills
@@ -4948,7 +5125,20 @@ def build_pull_stats_tid(tid_date_time: str, top_stats: dict, skill_data: dict,
 	)
 
 #Add Glicko Leaderboard Support
-def update_glicko_ratings(db_path: str = "Top_Stats.db"):
+def update_glicko_ratings(db_path: str = "Top_Stats.db", full_rebuild: bool = False):
+	"""
+	Rate every player and stat of each raid date in player_stats and write the ratings to player_ratings.
+
+	The rating, rd and vol of every player and stat are saved in glicko_state
+	after the last date, so a later run only rates the dates added since.
+	The ratings are replayed from the first date when there is no saved state,
+	when the stat columns changed, or when the dates already rated no longer
+	hold the same rows, e.g. an older night was added or a night re-imported.
+
+	Args:
+		db_path (str): The database file.
+		full_rebuild (bool): Ignore the saved state and replay every date.
+	"""
 
 	def create_table(cursor):
 		cursor.execute(
@@ -4990,6 +5180,85 @@ def update_glicko_ratings(db_path: str = "Top_Stats.db"):
 		cursor.execute("SELECT DISTINCT date FROM player_stats ORDER BY date")
 		return [row[0] for row in cursor.fetchall()]
 
+	def create_state_tables(cursor):
+		cursor.execute(
+			"""CREATE TABLE IF NOT EXISTS glicko_state (
+			player_key TEXT,
+			stat TEXT,
+			rating REAL,
+			rd REAL,
+			vol REAL,
+			last_rating REAL,
+			PRIMARY KEY (player_key, stat)
+		)"""
+		)
+		# A progress table without the history fingerprint is dropped, rebuilding the ratings once
+		cursor.execute("PRAGMA table_info(glicko_progress)")
+		progress_columns = [col[1] for col in cursor.fetchall()]
+		if progress_columns and "history" not in progress_columns:
+			cursor.execute("DROP TABLE glicko_progress")
+		cursor.execute(
+			"""CREATE TABLE IF NOT EXISTS glicko_progress (
+			id INTEGER PRIMARY KEY CHECK (id = 1),
+			last_date TEXT,
+			stat_fields TEXT,
+			history TEXT
+		)"""
+		)
+
+	def rated_history(cursor, last_date, stat_fields):
+		# Fingerprint of the rows rated so far, to notice dates added or rewritten on or before last_date,
+		# including corrected stat values of a re-imported night
+		totals = ", ".join(f'TOTAL("{stat}")' for stat in ["duration", "num_fights"] + stat_fields)
+		cursor.execute(
+			f"SELECT COUNT(DISTINCT date), COUNT(*), {totals} FROM player_stats WHERE date <= ?",
+			(last_date,),
+		)
+		return list(cursor.fetchone())
+
+	def load_state(cursor, stat_fields):
+		cursor.execute("SELECT last_date, stat_fields, history FROM glicko_progress WHERE id = 1")
+		progress = cursor.fetchone()
+		if progress is None or progress[0] is None:
+			return None
+		last_date, saved_fields, history = progress
+		if json.loads(saved_fields) != stat_fields:
+			print("Glicko stat columns changed, rebuilding ratings")
+			return None
+		if json.loads(history) != rated_history(cursor, last_date, stat_fields):
+			print(f"Glicko ratings history changed on or before {last_date}, rebuilding ratings")
+			return None
+
+		ratings = defaultdict(lambda: defaultdict(lambda: GlickoPlayer()))
+		last_rating = defaultdict(dict)
+		cursor.execute("SELECT player_key, stat, rating, rd, vol, last_rating FROM glicko_state")
+		for player_key, stat, rating, rd, vol, prev_rating in cursor.fetchall():
+			player = GlickoPlayer(vol=vol)
+			# Restore the glicko2 scale values, not the converted ones, so the replay continues bit for bit
+			player._Player__rating = rating
+			player._Player__rd = rd
+			ratings[player_key][stat] = player
+			if prev_rating is not None:
+				last_rating[player_key][stat] = prev_rating
+		return last_date, ratings, last_rating
+
+	def save_state(cursor, last_date, stat_fields, ratings, last_rating):
+		cursor.execute("DELETE FROM glicko_state")
+		cursor.executemany(
+			"INSERT INTO glicko_state (player_key, stat, rating, rd, vol, last_rating) VALUES (?, ?, ?, ?, ?, ?)",
+			(
+				(player_key, stat, player._Player__rating, player._Player__rd, player.vol, last_rating[player_key].get(stat))
+				for player_key, player_stats in ratings.items()
+				for stat, player in player_stats.items()
+			),
+		)
+		cursor.execute(
+			"""INSERT OR REPLACE INTO glicko_progress
+			(id, last_date, stat_fields, history)
+			VALUES (1, ?, ?, ?)""",
+			(last_date, json.dumps(stat_fields), json.dumps(rated_history(cursor, last_date, stat_fields))),
+		)
+
 	def fetch_player_stats(cursor, raid_date, stat_fields):
 		fields = ", ".join(
 			["account", "name", "profession", "duration", "num_fights"] + stat_fields
@@ -5053,13 +5322,25 @@ def update_glicko_ratings(db_path: str = "Top_Stats.db"):
 	cursor = conn.cursor()
 
 	create_table(cursor)
+	create_state_tables(cursor)
 	stat_fields = get_stat_fields(cursor)
 	all_dates = get_raid_dates(cursor)
 
-	ratings = defaultdict(lambda: defaultdict(lambda: GlickoPlayer()))
-	last_rating = defaultdict(dict)  # will store stat -> previous rating
-
-	for raid_date in all_dates:
+	state = None if full_rebuild else load_state(cursor, stat_fields)
+	if state is None:
+		ratings = defaultdict(lambda: defaultdict(lambda: GlickoPlayer()))
+		last_rating = defaultdict(dict)  # will store stat -> previous rating
+		new_dates = all_dates
+	else:
+		last_date, ratings, last_rating = state
+		new_dates = [raid_date for raid_date in all_dates if raid_date > last_date]
+		if not new_dates:
+			conn.close()
+			print("Glicko ratings up to date.")
+			return
+		print(f"Glicko ratings continued from {last_date}: {len(new_dates)} new raid dates")
+
+	for raid_date in new_dates:
 		rows = fetch_player_stats(cursor, raid_date, stat_fields)
 		if not rows:
 			continue
@@ -5137,6 +5418,8 @@ def update_glicko_ratings(db_path: str = "Top_Stats.db"):
 					),
 				)
 
+	if all_dates:
+		save_state(cursor, all_dates[-1], stat_fields, ratings, last_rating)
 	conn.commit()
 	conn.close()
 	print("Glicko ratings (with normalization and trends) updated.")
@@ -5220,6 +5503,10 @@ def generate_leaderboard(stat: str, db_path: str, top_n: int = 25) -> str:
 	return table
 
 
+# High scores kept per stat category in the database
+HIGH_SCORE_DB_LIMIT = 25
+
+
 def save_high_score(
 	db_path: str,
 	account: str,
@@ -5281,11 +5568,11 @@ def save_high_score(
 			SELECT id FROM high_scores
 			WHERE stat_category = ?
 			ORDER BY stat_value DESC
-			LIMIT 25
+			LIMIT ?
 		)
 		AND stat_category = ?
 	""",
-		(stat_category, stat_category),
+		(stat_category, HIGH_SCORE_DB_LIMIT, stat_category),
 	)
 
 	# Commit and close
@@ -5381,7 +5668,8 @@ def build_high_scores_leaderboard_tids(tid_date_time: str, db_path: str) -> None
 			FROM high_scores
 			WHERE stat_category = ?
 			ORDER BY stat_value DESC
-		""", (category,))
+			LIMIT ?
+		""", (category, HIGH_SCORE_DB_LIMIT))
 		rows = cur.fetchall()
 
 		# Determine if stat_info column should be included
@@ -5482,9 +5770,9 @@ def build_leaderboard_menu_tid(datetime: str, leaderboard_stats: dict, tid_list:
 		tid_list
 	)
 
-def build_boon_support_data(top_stats: dict, support_profs: dict, boon_dict: dict) -> None:
+def build_boon_support_data(top_stats: dict, support_profs: dict, boon_dict: dict, boon_metrics: BoonMetrics = None) -> None:
 	"""
-	Build data for the boon support stats to Discord.
+	Build data for the boon support stats to Discord, reading squad generation from boon_metrics when given.
 	"""
 	boon_support_data = {}
 	print("Building data for boon support stats to Discord")
@@ -5512,7 +5800,11 @@ def build_boon_support_data(top_stats: dict, support_profs: dict, boon_dict: dic
 				# Iterate over the support boons
 				for boon in support_boons:
 					# Set the generation for this boon to 0 if not found
-					boon_gen_sec = round(data['squadBuffs'].get(boon, {}).get('generation', 0)/data["fight_time"],2)
+					if boon_metrics is not None:
+						generation_ms = boon_metrics.generation(data, boon, 'squadBuffs')
+					else:
+						generation_ms = data['squadBuffs'].get(boon, {}).get('generation', 0)
+					boon_gen_sec = round(generation_ms/data["fight_time"],2)
 					player_data.append(boon_gen_sec)
 				boon_support_data[profession].append(player_data)
 
@@ -5758,6 +6050,20 @@ def write_data_to_db(top_stats: dict, last_fight: str, db_path: str = "Top_Stats
 	conn.close()
 	print("Database updated.")
 
+def fight_series_to_json(fight: dict) -> dict:
+	"""Return a fight_data entry with its per second arrays as {second: value} dicts for the JSON output."""
+	def by_second(series):
+		return dict(enumerate(series))
+
+	return {
+		"damage1S": by_second(fight["damage1S"]),
+		"damageTaken1S": by_second(fight["damageTaken1S"]),
+		"players": {
+			player: {"damage1S": by_second(data["damage1S"]), "damageTaken1S": data["damageTaken1S"]}
+			for player, data in fight["players"].items()
+		},
+	}
+
 def output_top_stats_json(top_stats: dict, buff_data: dict, skill_data: dict, damage_mod_data: dict, high_scores: dict, personal_damage_mod_data: dict, personal_buff_data: dict, fb_pages: dict, mechanics: dict, minions: dict, mesmer_clone_usage: dict, death_on_tag: dict, DPSStats: dict, commander_summary_data: dict, enemy_avg_damage_per_skill: dict, player_damage_mitigation: dict, player_minion_damage_mitigation: dict, stacking_uptime_Table: dict, IOL_revive: dict, fight_data: dict, outfile: str) -> None:
 	"""Print the top_stats dictionary as a JSON object to the console."""
 
@@ -5787,7 +6093,7 @@ def output_top_stats_json(top_stats: dict, buff_data: dict, skill_data: dict, da
 	json_dict["player_minion_damage_mitigation"] = {key: value for key, value in player_minion_damage_mitigation.items()}
 	json_dict["stacking_uptime_Table"] = {key: value for key, value in stacking_uptime_Table.items()}
 	json_dict["IOL_revive"] = {key: value for key, value in IOL_revive.items()}
-	json_dict["fight_data"] = {key: value for key, value in fight_data.items()}
+	json_dict["fight_data"] = {key: fight_series_to_json(value) for key, value in fight_data.items()}
 
 	with open(outfile, 'w') as json_file:
 		json.dump(json_dict, json_file, indent=4)
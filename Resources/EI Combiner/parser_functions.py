@@ -19,11 +19,25 @@ import config
 import gzip
 import json
 import math
+import operator
 import requests
 import time
+from array import array
+from combat_time import CombatStartCursor, combat_time_breakpoints
+import numeric
+from fact_store import FactStore, ALL_LEVELS, GROUP, PLAYER
+from player_registry import PlayerRegistry
+from report_profile import FULL_PROFILE
+from records import (
+	CommanderSummaryRecord, DamageMitigationRecord, DeathOnTagRecord, DPSRecord,
+	FirebrandPagesRecord, IllusionOfLifeRecord, StackingUptimeRecord,
+)
+from top_k import HighScoreTracker
 from typing import Optional, Dict
 from requests.exceptions import RequestException, HTTPError, Timeout, ConnectionError
 
+# Run state read by the collectors below; session.CombinerSession binds its own copies while active
+
 # Top stats dictionary to store combined log data
 top_stats = config.top_stats
 
@@ -37,9 +51,18 @@ player_minion_damage_mitigation = {}
 
 # Buff and skill data collected from all logs
 buff_data = {}
+# Player log buff id -> (buff_data key, stacking), filled alongside buff_data
+buff_stacking = {}
 skill_data = {}
 damage_mod_data = {}
-high_scores = {}
+high_scores = HighScoreTracker()
+# Additive per player/fight/overall stat contributions, flushed into top_stats after each fight;
+# overall and group sums are rolled up when top_stats["overall"] is first read
+fact_store = FactStore()
+# Integer ids for (account, name, profession); DPSStats, stacking_uptime_Table, death_on_tag,
+# mesmer_clone_usage and fight_data players are keyed by id until output
+player_registry = PlayerRegistry()
+# The per player accumulators below hold slotted records from records.py, converted with to_plain() for output
 fb_pages = {}
 mechanics = {}
 minions = {}
@@ -79,17 +102,43 @@ def get_player_account(player):
 	Returns:
 		str: The account name of the player
 	"""
-	if len(player['account'].split('-')) >=1:
-		account = player['account'].replace("-", ".")
-	else:
-		account = player['account']
-	return account
+	return player_registry.accounts[player_registry.register(player)]
+
+
+def get_per_second_deltas(cumulative: list, first_from_zero: bool = True) -> array:
+	"""
+	Turn a cumulative per second series from the log into per second amounts.
+
+	Args:
+		cumulative (list): The cumulative series, e.g. a target's damage1S.
+		first_from_zero (bool): Count the first second from zero; when False it is 0.
+
+	Returns:
+		array: The per second amounts.
+	"""
+	return array('q', numeric.diff(cumulative, first_from_zero))
+
+
+def add_series(total: array, series: array) -> None:
+	"""
+	Add a per second series into a running total, growing the total to fit.
+
+	Args:
+		total (array): The running per second total, updated in place.
+		series (array): The series to add.
+	"""
+	if len(total) < len(series):
+		total.extend(array('q', bytes(8 * (len(series) - len(total)))))
+	total[:len(series)] = array('q', map(operator.add, total[:len(series)], series))
 
 
 def get_fight_data(player, fight_num):
 	"""
 	Get the fight data for a player in a given fight
 
+	Per second damage and damage taken are held as int64 arrays indexed by
+	second, for the fight and for each player above 700 dps.
+
 	Args:
 		player (dict): The player data from the log
 		fight_num (int): The fight number to add the data to
@@ -97,47 +146,36 @@ def get_fight_data(player, fight_num):
 	Returns:
 		None
 	"""
-	account = get_player_account(player)
-	player_id = f"{account}-{player['profession']}-{player['name']}"
+	player_id = player_registry.register(player)
 	if fight_num not in fight_data:
 		fight_data[fight_num] = {
-			"damage1S": {},
-			"damageTaken1S": {},
+			"damage1S": array('q'),
+			"damageTaken1S": array('q'),
 			"players": {}
 		}
+	fight = fight_data[fight_num]
 
 	if player['dpsAll'][0]['dps'] >= 700:
-		if player_id not in fight_data[fight_num]["players"]:
-			fight_data[fight_num]["players"][player_id] = {
-				"damage1S": {},
+		if player_id not in fight["players"]:
+			player_damage1S = array('q')
+			for target in player["targetDamage1S"]:
+				add_series(player_damage1S, get_per_second_deltas(target[0]))
+			fight["players"][player_id] = {
+				"damage1S": player_damage1S,
 				"damageTaken1S": player["damageTaken1S"][0]
 			}
-			for target in player["targetDamage1S"]:
-				prior_damage = 0
-				for sec_index in range(len(target[0])):
-					cur_damage = target[0][sec_index] - prior_damage
-					fight_data[fight_num]["damage1S"][sec_index] = fight_data[fight_num]["damage1S"].get(sec_index, 0) + cur_damage
-					fight_data[fight_num]["players"][player_id]["damage1S"][sec_index] = fight_data[fight_num]["players"][player_id]["damage1S"].get(sec_index, 0)+cur_damage
-
-					prior_damage = target[0][sec_index]
-					
-	last_index = 0
+			add_series(fight["damage1S"], player_damage1S)
 
-	for index in range(len(player["damageTaken1S"][0])):
-		current_damage_taken = player["damageTaken1S"][0][index] - player["damageTaken1S"][0][last_index]
-		fight_data[fight_num]["damageTaken1S"][index] = fight_data[fight_num]["damageTaken1S"].get(index, 0) + current_damage_taken
-		last_index = index
+	add_series(fight["damageTaken1S"], get_per_second_deltas(player["damageTaken1S"][0], first_from_zero=False))
 
 
 def check_burst1S_high_score(fight_data, player, fight_num):
-	for player_id in fight_data[fight_num]["players"]:
-		account, profession, name = player_id.split("-")
-		max_burst1S_key = max(fight_data[fight_num]["players"][player_id]["damage1S"], key=fight_data[fight_num]["players"][player_id]["damage1S"].get)
-		max_burst1S_value = fight_data[fight_num]["players"][player_id]["damage1S"][max_burst1S_key]
+	for player_id, player_data in fight_data[fight_num]["players"].items():
+		max_burst1S_value = max(player_data["damage1S"])
 
 		update_high_score(
 			"burst_damage1S",
-			"{{"+profession+"}}"+name+"-"+account+"-"+str(fight_num)+"-burst1S",
+			player_registry.high_score_prefix(player_id)+"-"+str(fight_num)+"-burst1S",
 			round(max_burst1S_value, 2)	
 		)
 			
@@ -213,9 +251,9 @@ def determine_clone_usage(player, skill_map, mesmer_shatter_skills):
 		None
 	"""
 	active_clones = {}
-	name_prof = f"{player['name']}_{player['profession']}_{get_player_account(player)}"
-	if name_prof not in mesmer_clone_usage:
-		mesmer_clone_usage[name_prof] = {}
+	player_id = player_registry.register(player)
+	if player_id not in mesmer_clone_usage:
+		mesmer_clone_usage[player_id] = {}
 	if "activeClones" in player:
 		for timestamp in player['activeClones']:
 			active_clones[timestamp[0]] = timestamp[1]
@@ -225,14 +263,14 @@ def determine_clone_usage(player, skill_map, mesmer_shatter_skills):
 			if skill_id in mesmer_shatter_skills:
 				skill_name = skill_map[skill_id]['name']
 
-				if skill_name not in mesmer_clone_usage[name_prof]:
-					mesmer_clone_usage[name_prof][skill_name] = {}
+				if skill_name not in mesmer_clone_usage[player_id]:
+					mesmer_clone_usage[player_id][skill_name] = {}
 
 				for item in skill['skills']:
 					cast_time = item['castTime']
 					for key, value in reversed(list(active_clones.items())):
 						if key <= cast_time:
-							mesmer_clone_usage[name_prof][skill_name][value] = mesmer_clone_usage[name_prof][skill_name].get(value, 0) + 1 #value
+							mesmer_clone_usage[player_id][skill_name][value] = mesmer_clone_usage[player_id][skill_name].get(value, 0) + 1 #value
 							break
 
 def get_buff_states(buff_states: list) -> dict:
@@ -266,13 +304,7 @@ def calculate_moving_average(data: list, window_size: int) -> list:
 	Returns:
 		list: A list of the moving averages for each element in the input list.
 	"""
-	ma = []
-	for i in range(len(data)):
-		start_index = max(0, i - window_size)
-		end_index = min(len(data), i + window_size)
-		sub_data = data[start_index:end_index + 1]
-		ma.append(sum(sub_data) / len(sub_data))
-	return ma
+	return numeric.moving_average(data, window_size)
 
 def find_lowest(dict):
 	"""
@@ -370,28 +402,17 @@ def check_target_for_buff_start_end(targets, players, damage_buff_ids):
 
 def update_high_score(stat_name: str, key: str, value: float) -> None:
 	"""
-	Update the high scores dictionary with a new value if it is higher than the current lowest value.
+	Update the high scores with a new value if it is higher than the current lowest value.
+
+	Each category keeps its top entries in a heap, so once it is full a
+	candidate costs O(log K) instead of a scan for the lowest entry.
 
 	Args:
 		stat_name (str): The name of the stat to update.
 		key (str): The key to store the value under.
 		value (float): The value to store.
 	"""
-
-	if stat_name not in high_scores:
-		high_scores[stat_name] = {}
-
-	if key in high_scores[stat_name]:
-		if value > high_scores[stat_name][key]:
-			high_scores[stat_name][key] = value
-	elif len(high_scores[stat_name]) < 5:
-		high_scores[stat_name][key] = value
-	else:
-		lowest_key = min(high_scores[stat_name], key=high_scores[stat_name].get)
-		lowest_value = high_scores[stat_name][lowest_key]
-		if value > lowest_value:
-			del high_scores[stat_name][lowest_key]
-			high_scores[stat_name][key] = value
+	high_scores.offer(stat_name, key, value)
 
 
 def determine_player_role(player_data: dict) -> str:
@@ -456,21 +477,9 @@ def get_commander_tag_data(fight_json):
 
 	for player in fight_json["players"]:
 		if player["hasCommanderTag"] and not player["notInSquad"]:
-			commander_name = f"{player['name']}|{player['profession']}|{get_player_account(player)}"
+			commander_name = player_registry.name_prof(player_registry.register(player))
 			if commander_name not in commander_summary_data:
-				commander_summary_data[commander_name] = {
-					'heal_stats': {},
-					'support': {},
-					'statsAll': {},
-					'defenses': {},
-					'totalDamageTaken': {},
-					'prot_mods': {
-						'hitCount': 0,
-						'totalHitCount': 0,
-						'damageGain': 0,
-						'totalDamage': 0
-					}
-				}
+				commander_summary_data[commander_name] = CommanderSummaryRecord()
 			replay_data = player.get("combatReplayData", {})
 			commander_tag_positions = replay_data.get("positions", [])
 
@@ -525,21 +534,14 @@ def get_player_death_on_tag(
         return round((sum(distances) / len(distances)) / inch_to_pixel)
 
     # Setup player entry
-    name_prof = f"{player.get('name', 'Unknown')}|{player.get('profession', 'Unknown')}|{get_player_account(player)}"
-    if name_prof not in death_on_tag:
-        death_on_tag[name_prof] = {
-            "name": player.get("name", ""),
-            "profession": player.get("profession", ""),
-            "account": get_player_account(player),
-            "distToTag": [],
-            "On_Tag": 0,
-            "Off_Tag": 0,
-            "Run_Back": 0,
-            "After_Tag_Death": 0,
-            "Total": 0,
-            "Ranges": [],
-        }
-    entry = death_on_tag[name_prof]
+    player_id = player_registry.register(player)
+    if player_id not in death_on_tag:
+        death_on_tag[player_id] = DeathOnTagRecord(
+            player.get("name", ""),
+            player.get("profession", ""),
+            player_registry.account(player_id),
+        )
+    entry = death_on_tag[player_id]
 
     # Distance to commander (static)
     stats_all = player.get("statsAll", [{}])
@@ -578,7 +580,7 @@ def get_player_death_on_tag(
             # Distance at death
             death_distance = math.hypot(x1 - x2, y1 - y2)
             death_range = round(death_distance / inch_to_pixel)
-            entry["Total"] += 1
+            entry.Total += 1
 
             # Average distance calculation
             if int(down_key) > int(dead_tag_mark) and dead_tag:
@@ -587,7 +589,7 @@ def get_player_death_on_tag(
                 player_dist_to_tag = avg_distance(
                     player_positions, commander_tag_positions, player_dead_poll, inch_to_pixel
                 )
-                entry["After_Tag_Death"] += 1
+                entry.After_Tag_Death += 1
             else:
                 # Before tag death
                 player_dead_poll = position_mark
@@ -597,19 +599,19 @@ def get_player_death_on_tag(
 
             # Classification
             if death_range <= On_Tag:
-                entry["On_Tag"] += 1
+                entry.On_Tag += 1
             elif death_range <= Run_Back:
-                entry["Off_Tag"] += 1
-                entry["Ranges"].append(death_range)
+                entry.Off_Tag += 1
+                entry.Ranges.append(death_range)
             else:
-                entry["Run_Back"] += 1
+                entry.Run_Back += 1
 
     # Record static distance
     if player_dist_to_tag <= Run_Back:
-        entry["distToTag"].append(player_dist_to_tag)
+        entry.distToTag.append(player_dist_to_tag)
 
 
-def get_player_fight_dps(dpsTargets: dict, name: str, profession: str, account: str, fight_num: int, fight_time: int) -> None:
+def get_player_fight_dps(dpsTargets: dict, player_id: int, fight_num: int, fight_time: int) -> None:
 	"""
 	Get the maximum damage hit by skill.
 
@@ -625,7 +627,7 @@ def get_player_fight_dps(dpsTargets: dict, name: str, profession: str, account:
 
 	update_high_score(
 		"fight_dps",
-		"{{"+profession+"}}"+name+"-"+str(account)+"-"+str(fight_num)+"-DPS",
+		player_registry.high_score_prefix(player_id)+"-"+str(fight_num)+"-DPS",
 		target_damage
 		)
 
@@ -635,7 +637,8 @@ def get_combat_start_from_player_json(initial_time, player_json):
 
 	This function analyzes the player's health percentages and power damage over time to
 	identify when combat began. It checks for the first instance of health reduction or 
-	change in power damage to infer the start of combat.
+	change in power damage to infer the start of combat. To find several starts in one
+	fight, use a single CombatStartCursor instead.
 
 	Args:
 		initial_time (int): The initial timestamp to start checking from.
@@ -644,30 +647,7 @@ def get_combat_start_from_player_json(initial_time, player_json):
 	Returns:
 		int: The timestamp representing the start of combat, or -1 if no combat is found.
 	"""
-
-	start_combat = -1
-	if 'healthPercents' not in player_json:
-		return start_combat 
-	last_health_percent = 100
-	for change in player_json['healthPercents']:
-		if change[0] < initial_time:
-			last_health_percent = change[1]
-			continue
-		if change[1] - last_health_percent < 0:
-			# got dmg
-			start_combat = change[0]
-			break
-		last_health_percent = change[1]
-	for i in range(math.ceil(initial_time/1000), len(player_json['damage1S'][0])):
-		if i == 0:
-			continue
-		if player_json['powerDamage1S'][0][i] != player_json['powerDamage1S'][0][i-1]:
-			if start_combat == -1:
-				start_combat = i*1000
-			else:
-				start_combat = min(start_combat, i*1000)
-			break
-	return start_combat
+	return CombatStartCursor(player_json).next_start(initial_time)
 
 def get_combat_time_breakpoints(player_json):
 	"""
@@ -679,39 +659,22 @@ def get_combat_time_breakpoints(player_json):
 	Returns:
 		list: A list of [start, end] tuples representing combat time breakpoints.
 	"""
-	# Get the initial combat start time
-	start_combat = get_combat_start_from_player_json(0, player_json)
-
-	# Check if 'combatReplayData' is available, use 'activeTimes' if not
-	if 'combatReplayData' not in player_json:
-		print("WARNING: combatReplayData not in json, using activeTimes as time in combat")
-		return [[start_combat, player_json.get('activeTimes', 0)]]
-
-	replay = player_json['combatReplayData']
-
-	# Check if 'dead' data is available in replay, use 'activeTimes' if not
-	if 'dead' not in replay:
-		return [[start_combat, player_json.get('activeTimes', 0)]]
-
-	breakpoints = []
-	player_deaths = dict(replay['dead'])
-	player_downs = dict(replay['down'])
+	return combat_time_breakpoints(player_json)
 
-	# Iterate over player deaths and downs to calculate breakpoints
-	for death_key, death_value in player_deaths.items():
-		for down_key, down_value in player_downs.items():
-			if death_key == down_value:
-				if start_combat != -1:
-					breakpoints.append([start_combat, death_key])
-				start_combat = get_combat_start_from_player_json(death_value + 1000, player_json)
-				break
+def get_squad_combat_breakpoints(fight_json: dict) -> dict:
+	"""
+	Calculate the combat time breakpoints of every squad player in a fight once.
 
-	# Determine the end of combat based on damage data
-	end_combat = len(player_json['damage1S'][0]) * 1000
-	if start_combat != -1:
-		breakpoints.append([start_combat, end_combat])
+	Args:
+		fight_json (dict): The fight JSON.
 
-	return breakpoints
+	Returns:
+		dict: The [start, end] breakpoints of each squad player, keyed by player id.
+	"""
+	return {
+		player_registry.register(player): combat_time_breakpoints(player)
+		for player in fight_json['players'] if not player['notInSquad']
+	}
 
 def sum_breakpoints(breakpoints):
 	"""
@@ -802,9 +765,12 @@ def split_boon_states_by_combat_breakpoints(states, breakpoints, duration):
 
 	return new_states
 
-def get_stacking_uptime_data(player, damagePS, duration, fight_ticks, blacklist):
+def get_stacking_uptime_data(player, damagePS, duration, fight_ticks, blacklist, combat_breakpoints=None):
 	"""
 	Get uptime and damage data for stacking buffs like might and stability
+
+	combat_breakpoints are the player's combat windows, computed from the
+	player JSON if not given.
 	"""
 	# Track Stacking Buff Uptimes
 	boons = {
@@ -813,28 +779,21 @@ def get_stacking_uptime_data(player, damagePS, duration, fight_ticks, blacklist)
 		'b1122': "Stability", 'b719': "Swiftness", 'b26980': "Resistance", 'b873': "Resolution"
 	}
 
-	player_prof_name = f"{player['name']}|{player['profession']}|{get_player_account(player)}"
+	player_id = player_registry.register(player)
 	if player["account"] in blacklist:
 		return
-	if player_prof_name not in stacking_uptime_Table:
-		stacking_uptime_Table[player_prof_name] = {}
-		stacking_uptime_Table[player_prof_name]["account"] = get_player_account(player)
-		stacking_uptime_Table[player_prof_name]["name"] = player['name']
-		stacking_uptime_Table[player_prof_name]["profession"] = player['profession']
-		stacking_uptime_Table[player_prof_name]["duration_Might"] = 0
-		stacking_uptime_Table[player_prof_name]["duration_Stability"] = 0
-		stacking_uptime_Table[player_prof_name]["Might"] = [0] * 26
-		stacking_uptime_Table[player_prof_name]["Stability"] = [0] * 26
-		for buff_id in boons:
-			buff_name = boons[buff_id]
-			stacking_uptime_Table[player_prof_name]["damage_with_"+buff_name] = [0] * 26 if buff_name == 'Might' else [0] * 2
+	if player_id not in stacking_uptime_Table:
+		stacking_uptime_Table[player_id] = StackingUptimeRecord(
+			player_registry.account(player_id), player['name'], player['profession'], boons.values()
+		)
+	uptime_record = stacking_uptime_Table[player_id]
 		
-	player_damage = damagePS
-	player_damage_per_tick = [player_damage[0]]
-	for fight_tick in range(fight_ticks - 1):
-		player_damage_per_tick.append(player_damage[fight_tick + 1] - player_damage[fight_tick])
+	player_damage_per_tick = numeric.diff(damagePS[:fight_ticks])
+	damage_before = numeric.prefix_sums(player_damage_per_tick)
 
-	player_combat_breakpoints = get_combat_time_breakpoints(player)
+	if combat_breakpoints is None:
+		combat_breakpoints = get_combat_time_breakpoints(player)
+	player_combat_breakpoints = combat_breakpoints
 
 	for item in player['buffUptimesActive']:
 		buffId = "b"+str(item['id'])	
@@ -850,7 +809,7 @@ def get_stacking_uptime_data(player, damagePS, duration, fight_ticks, blacklist)
 			if buff_name in ['Stability', 'Might']:
 				uptime = state_end - state_start
 				total_time += uptime
-				stacking_uptime_Table[player_prof_name][buff_name][min(stacks, 25)] += uptime
+				uptime_record.stacks(buff_name)[min(stacks, 25)] += uptime
 
 			start_sec = state_start / 1000
 			end_sec = state_end / 1000
@@ -866,18 +825,18 @@ def get_stacking_uptime_data(player, damagePS, duration, fight_ticks, blacklist)
 				damage_with_stacks = player_damage_per_tick[start_sec_int] * (end_sec - start_sec)
 			else:
 				damage_with_stacks = player_damage_per_tick[start_sec_int] * (1.0 - start_sec_rem)
-				damage_with_stacks += sum(player_damage_per_tick[start_sec_int + s] for s in range(1, end_sec_int - start_sec_int))
+				damage_with_stacks += numeric.interval_sum(damage_before, start_sec_int + 1, end_sec_int)
 				damage_with_stacks += player_damage_per_tick[end_sec_int] * end_sec_rem
 
 			if idx == 0:
 				# Get any damage before we have boon states
 				damage_with_stacks += player_damage_per_tick[start_sec_int] * (start_sec_rem)
-				damage_with_stacks += sum(player_damage_per_tick[s] for s in range(0, start_sec_int))
+				damage_with_stacks += numeric.interval_sum(damage_before, 0, start_sec_int)
 			if idx == len(states) - 1:
 				# leave this as if, not elif, since we can have 1 state which is both the first and last
 				# Get any damage after we have boon states
 				damage_with_stacks += player_damage_per_tick[end_sec_int] * (1.0 - end_sec_rem)
-				damage_with_stacks += sum(player_damage_per_tick[s] for s in range(end_sec_int + 1, len(player_damage_per_tick)))
+				damage_with_stacks += numeric.interval_sum(damage_before, end_sec_int + 1, len(player_damage_per_tick))
 			elif len(states) > 1 and state_end != states[idx + 1][0]:
 				# Get any damage between deaths, this is usually a small amount of condis that are still ticking after death
 				next_state_start = states[idx + 1][0]
@@ -886,18 +845,18 @@ def get_stacking_uptime_data(player, damagePS, duration, fight_ticks, blacklist)
 				next_start_sec_rem = next_state_sec - next_start_sec_int
 
 				damage_with_stacks += player_damage_per_tick[end_sec_int] * (1.0 - end_sec_rem)
-				damage_with_stacks += sum(player_damage_per_tick[s] for s in range(end_sec_int + 1, next_start_sec_int))
+				damage_with_stacks += numeric.interval_sum(damage_before, end_sec_int + 1, next_start_sec_int)
 				damage_with_stacks += player_damage_per_tick[next_start_sec_int] * (next_start_sec_rem)
 
 			if buff_name == 'Might':
-				stacking_uptime_Table[player_prof_name]["damage_with_"+buff_name][min(stacks, 25)] += damage_with_stacks
+				uptime_record.damage_with[buff_name][min(stacks, 25)] += damage_with_stacks
 			else:
-				stacking_uptime_Table[player_prof_name]["damage_with_"+buff_name][min(stacks, 1)] += damage_with_stacks
+				uptime_record.damage_with[buff_name][min(stacks, 1)] += damage_with_stacks
 
 		if buff_name in ['Stability', 'Might']:
-			stacking_uptime_Table[player_prof_name]["duration_"+buff_name] += total_time
+			uptime_record.add_duration(buff_name, total_time)
 
-def calculate_dps_stats(fight_json, blacklist):
+def calculate_dps_stats(fight_json, blacklist, combat_breakpoints=None):
 	"""
 	Calculates the various DPS stats from the fight JSON.
 
@@ -911,7 +870,18 @@ def calculate_dps_stats(fight_json, blacklist):
 	* Calculates the burst damage, which is the maximum damage done by each player in X seconds
 	* Calculates the ch5Ca burst damage, which is the maximum damage done by each player in X seconds, but only counting damage done while Ch5Ca is active
 
+	combat_breakpoints is the result of get_squad_combat_breakpoints() for the
+	fight, computed here if not given, so each player's combat time is worked
+	out once rather than in every loop.
+
 	"""
+	if combat_breakpoints is None:
+		combat_breakpoints = get_squad_combat_breakpoints(fight_json)
+	combat_times = {
+		player_id: round(sum_breakpoints(breakpoints) / 1000)
+		for player_id, breakpoints in combat_breakpoints.items()
+	}
+
 	fight_ticks = len(fight_json['players'][0]["damage1S"][0])
 	duration = round(fight_json['durationMS']/1000)
 
@@ -921,26 +891,22 @@ def calculate_dps_stats(fight_json, blacklist):
 			for player in fight_json['players']:
 				if player['notInSquad']:
 					continue
-				player_prof_name = player['profession'] + " " + player['name'] + " " + get_player_account(player)
-				if player_prof_name not in damage_ps:
-					damage_ps[player_prof_name] = [0] * fight_ticks
+				player_id = player_registry.register(player)
+				if player_id not in damage_ps:
+					damage_ps[player_id] = [0] * fight_ticks
 
 				damage_on_target = player["targetDamage1S"][index][0]
 				for i in range(fight_ticks):
-					damage_ps[player_prof_name][i] += damage_on_target[i]
+					damage_ps[player_id][i] += damage_on_target[i]
 
-	squad_damage_per_tick = []
-	for fight_tick in range(fight_ticks - 1):
-		squad_damage_on_tick = 0
-		for player in fight_json['players']:
-			if player['notInSquad']:
-				continue
-			combat_time = round(sum_breakpoints(get_combat_time_breakpoints(player)) / 1000)
-			if combat_time:
-				player_prof_name = player['profession'] + " " + player['name'] + " " + get_player_account(player)
-				player_damage = damage_ps[player_prof_name]
-				squad_damage_on_tick += player_damage[fight_tick + 1] - player_damage[fight_tick]
-		squad_damage_per_tick.append(squad_damage_on_tick)
+	squad_damage_per_tick = [0] * (fight_ticks - 1)
+	for player in fight_json['players']:
+		if player['notInSquad']:
+			continue
+		player_id = player_registry.register(player)
+		if combat_times[player_id]:
+			player_damage_per_tick = numeric.diff(damage_ps[player_id])[1:]
+			squad_damage_per_tick = list(map(operator.add, squad_damage_per_tick, player_damage_per_tick))
 
 	squad_damage_total = sum(squad_damage_per_tick)
 	squad_damage_per_tick_ma = calculate_moving_average(squad_damage_per_tick, 1)
@@ -954,46 +920,29 @@ def calculate_dps_stats(fight_json, blacklist):
 			continue
 		if player['account'] in blacklist:
 			continue
-		player_prof_name = player['profession'] + " " + player['name']+ " " + get_player_account(player)
-		combat_time = round(sum_breakpoints(get_combat_time_breakpoints(player)) / 1000)
+		player_id = player_registry.register(player)
+		combat_time = combat_times[player_id]
 		if combat_time:
-			if player_prof_name not in DPSStats:
-				DPSStats[player_prof_name] = {
-					"account": get_player_account(player),
-					"name": player["name"],
-					"profession": player["profession"],
-					"duration": 0,
-					"combatTime": 0,
-					"coordinationDamage": 0,
-					"chunkDamage": [0] * CHUNK_DAMAGE_SECONDS,
-					"chunkDamageTotal": [0] * CHUNK_DAMAGE_SECONDS,
-					"carrionDamage": 0,
-					"carrionDamageTotal": 0,
-					"damageTotal": 0,
-					"squadDamageTotal": 0,
-					"burstDamage": [0] * CHUNK_DAMAGE_SECONDS,
-					"ch5CaBurstDamage": [0] * CHUNK_DAMAGE_SECONDS,
-					"downs": 0,
-					"kills": 0,
-				}
+			if player_id not in DPSStats:
+				DPSStats[player_id] = DPSRecord(
+					player_registry.account(player_id), player["name"], player["profession"], CHUNK_DAMAGE_SECONDS
+				)
 				
-			ch5_ca_damage_1s[player_prof_name] = [0] * fight_ticks
+			ch5_ca_damage_1s[player_id] = [0] * fight_ticks
 				
-			player_damage = damage_ps[player_prof_name]
+			player_damage = damage_ps[player_id]
 			
-			DPSStats[player_prof_name]["duration"] += duration
-			DPSStats[player_prof_name]["combatTime"] += combat_time
-			DPSStats[player_prof_name]["damageTotal"] += player_damage[fight_ticks - 1]
-			DPSStats[player_prof_name]["squadDamageTotal"] += squad_damage_total
+			DPSStats[player_id].duration += duration
+			DPSStats[player_id].combatTime += combat_time
+			DPSStats[player_id].damageTotal += player_damage[fight_ticks - 1]
+			DPSStats[player_id].squadDamageTotal += squad_damage_total
 
 			for stats_target in player["statsTargets"]:
-				DPSStats[player_prof_name]["downs"] += stats_target[0]['downed']
-				DPSStats[player_prof_name]["kills"] += stats_target[0]['killed']
+				DPSStats[player_id].downs += stats_target[0]['downed']
+				DPSStats[player_id].kills += stats_target[0]['killed']
 
 			# Coordination_Damage: Damage weighted by coordination with squad
-			player_damage_per_tick = [player_damage[0]]
-			for fight_tick in range(fight_ticks - 1):
-				player_damage_per_tick.append(player_damage[fight_tick + 1] - player_damage[fight_tick])
+			player_damage_per_tick = numeric.diff(player_damage)
 
 			player_damage_ma = calculate_moving_average(player_damage_per_tick, 1)
 
@@ -1008,9 +957,9 @@ def calculate_dps_stats(fight_json, blacklist):
 
 				squad_damage_percent = squad_damage_on_tick / squad_damage_ma_total
 
-				DPSStats[player_prof_name]["coordinationDamage"] += player_damage_on_tick * squad_damage_percent * duration
+				DPSStats[player_id].coordinationDamage += player_damage_on_tick * squad_damage_percent * duration
 			
-			get_stacking_uptime_data(player, player_damage, duration, fight_ticks, blacklist)
+			get_stacking_uptime_data(player, player_damage, duration, fight_ticks, blacklist, combat_breakpoints[player_id])
 
 	# Chunk damage: Damage done within X seconds of target down
 	for index, target in enumerate(fight_json['targets']):
@@ -1034,30 +983,28 @@ def calculate_dps_stats(fight_json, blacklist):
 							continue
 						if player['account'] in blacklist:
 							continue
-						combat_time = round(sum_breakpoints(get_combat_time_breakpoints(player)) / 1000)
-						if combat_time:
-							player_prof_name = player['profession'] + " " + player['name'] + " " + get_player_account(player)	
+						player_id = player_registry.register(player)
+						if combat_times[player_id]:
 							damage_on_target = player["targetDamage1S"][index][0]
 							player_damage = damage_on_target[downIndex] - damage_on_target[startIndex]
 							#player_damage = player["targetDamage1S"][downIndex][0] - player["targetDamage1S"][startIndex][0]
 
-							DPSStats[player_prof_name]["chunkDamage"][chunk_damage_seconds] += player_damage
+							DPSStats[player_id].chunkDamage[chunk_damage_seconds] += player_damage
 							squad_damage_on_target += player_damage
 
 							if chunk_damage_seconds == 5:
 								for i in range(startIndex, downIndex):
-									ch5_ca_damage_1s[player_prof_name][i] += damage_on_target[i + 1] - damage_on_target[i]
+									ch5_ca_damage_1s[player_id][i] += damage_on_target[i + 1] - damage_on_target[i]
 
 					for player in fight_json['players']:
 						if player['notInSquad']:
 							continue
 						if player['account'] in blacklist:
 							continue
-						combat_time = round(sum_breakpoints(get_combat_time_breakpoints(player)) / 1000)
-						if combat_time:
-							player_prof_name = player['profession'] + " " + player['name'] + " " + get_player_account(player)
+						player_id = player_registry.register(player)
+						if combat_times[player_id]:
 
-							DPSStats[player_prof_name]["chunkDamageTotal"][chunk_damage_seconds] += squad_damage_on_target
+							DPSStats[player_id].chunkDamageTotal[chunk_damage_seconds] += squad_damage_on_target
 
 	# Carrion damage: damage to downs that die 
 	for index, target in enumerate(fight_json['targets']):
@@ -1076,27 +1023,25 @@ def calculate_dps_stats(fight_json, blacklist):
 								continue
 							if player['account'] in blacklist:
 								continue
-							combat_time = round(sum_breakpoints(get_combat_time_breakpoints(player)) / 1000)
-							if combat_time:
-								player_prof_name = player['profession'] + " " + player['name'] + " " + get_player_account(player)
+							player_id = player_registry.register(player)
+							if combat_times[player_id]:
 								damage_on_target = player["targetDamage1S"][index][0]
 								carrion_damage = damage_on_target[dmgEnd] - damage_on_target[dmgStart]
 
-								DPSStats[player_prof_name]["carrionDamage"] += carrion_damage
+								DPSStats[player_id].carrionDamage += carrion_damage
 								total_carrion_damage += carrion_damage
 
 								for i in range(dmgStart, dmgEnd):
-									ch5_ca_damage_1s[player_prof_name][i] += damage_on_target[i + 1] - damage_on_target[i]
+									ch5_ca_damage_1s[player_id][i] += damage_on_target[i + 1] - damage_on_target[i]
 
 						for player in fight_json['players']:
 							if player['notInSquad']:
 								continue
 							if player['account'] in blacklist:
 								continue
-							combat_time = round(sum_breakpoints(get_combat_time_breakpoints(player)) / 1000)
-							if combat_time:
-								player_prof_name = player['profession'] + " " + player['name'] + " " + get_player_account(player)
-								DPSStats[player_prof_name]["carrionDamageTotal"] += total_carrion_damage
+							player_id = player_registry.register(player)
+							if combat_times[player_id]:
+								DPSStats[player_id].carrionDamageTotal += total_carrion_damage
 
 	# Burst damage: max damage done in n seconds
 	for player in fight_json['players']:
@@ -1104,14 +1049,13 @@ def calculate_dps_stats(fight_json, blacklist):
 			continue
 		if player['account'] in blacklist:
 			continue
-		combat_time = round(sum_breakpoints(get_combat_time_breakpoints(player)) / 1000)
-		if combat_time:
-			player_prof_name = player['profession'] + " " + player['name'] + " " + get_player_account(player)
-			player_damage = damage_ps[player_prof_name]
-			for i in range(1, CHUNK_DAMAGE_SECONDS):
-				for fight_tick in range(i, fight_ticks):
-					dmg = player_damage[fight_tick] - player_damage[fight_tick - i]
-					DPSStats[player_prof_name]["burstDamage"][i] = max(dmg, DPSStats[player_prof_name]["burstDamage"][i])
+		player_id = player_registry.register(player)
+		if combat_times[player_id]:
+			player_damage = damage_ps[player_id]
+			bursts = numeric.windowed_maxes(player_damage[:fight_ticks], range(1, CHUNK_DAMAGE_SECONDS))
+			for i, dmg in enumerate(bursts, 1):
+				if dmg is not None:
+					DPSStats[player_id].burstDamage[i] = max(dmg, DPSStats[player_id].burstDamage[i])
 
 	# Ch5Ca Burst damage: max damage done in n seconds
 	for player in fight_json['players']:
@@ -1119,28 +1063,21 @@ def calculate_dps_stats(fight_json, blacklist):
 			continue
 		if player['account'] in blacklist:
 			continue
-		combat_time = round(sum_breakpoints(get_combat_time_breakpoints(player)) / 1000)
-		if combat_time:
-			player_prof_name = player['profession'] + " " + player['name'] + " " + get_player_account(player)
-			player_damage_ps = ch5_ca_damage_1s[player_prof_name]
-			player_damage = [0] * len(player_damage_ps)
-			player_damage[0] = player_damage_ps[0]
-			for i in range(1, len(player_damage)):
-				player_damage[i] = player_damage[i - 1] + player_damage_ps[i]
-			for i in range(1, CHUNK_DAMAGE_SECONDS):
-				for fight_tick in range(i, fight_ticks):
-					dmg = player_damage[fight_tick] - player_damage[fight_tick - i]
-					DPSStats[player_prof_name]["ch5CaBurstDamage"][i] = max(dmg, DPSStats[player_prof_name]["ch5CaBurstDamage"][i])
-
-def get_player_stats_targets(statsTargets: dict, name: str, profession: str, account: str, fight_num: int, fight_time: int) -> None:
+		player_id = player_registry.register(player)
+		if combat_times[player_id]:
+			player_damage = numeric.cumsum(ch5_ca_damage_1s[player_id])
+			bursts = numeric.windowed_maxes(player_damage[:fight_ticks], range(1, CHUNK_DAMAGE_SECONDS))
+			for i, dmg in enumerate(bursts, 1):
+				if dmg is not None:
+					DPSStats[player_id].ch5CaBurstDamage[i] = max(dmg, DPSStats[player_id].ch5CaBurstDamage[i])
+
+def get_player_stats_targets(statsTargets: dict, player_id: int, fight_num: int, fight_time: int) -> None:
 	"""
 	Gets the stats for a player in a fight for a given stat
 
 	Args:
 		statsTargets (dict): A dictionary of stats for the player
-		name (str): The name of the player
-		profession (str): The profession of the player
-		account (str): The account of the player
+		player_id (int): The player's registry id
 		fight_num (int): The number of the fight
 		fight_time (int): The length of the fight
 
@@ -1156,7 +1093,7 @@ def get_player_stats_targets(statsTargets: dict, name: str, profession: str, acc
 
 		fight_stat_value = round(fight_stat_value / fight_time, 3)
 
-		update_high_score(f"statTarget_{stat}", "{{"+profession+"}}"+name+"-"+str(account)+"-"+str(fight_num)+"-"+stat, fight_stat_value)	
+		update_high_score(f"statTarget_{stat}", player_registry.high_score_prefix(player_id)+"-"+str(fight_num)+"-"+stat, fight_stat_value)	
 
 def get_total_shield_damage(fight_data: dict) -> int:
 	"""
@@ -1193,6 +1130,7 @@ def get_buffs_data(buff_map: dict) -> None:
 				'icon': icon,
 				'classification': classification
 			}
+			buff_stacking[int(buff_id[1:])] = (buff_id, stacking)
 		
 def get_skills_data(skill_map: dict) -> None:
 	"""
@@ -1397,7 +1335,7 @@ def get_parties_by_fight(fight_num: int, players: list, blacklist: list) -> None
 			# Add the player to the group
 			top_stats["parties_by_fight"][fight_num][group].append(prof_name)
 
-def get_stat_by_key(fight_num: int, player: dict, stat_category: str, name_prof: str) -> None:
+def get_stat_by_key(fight_num: int, player: dict, stat_category: str, player_id: int) -> None:
 	"""
 	Add player stats by key to top_stats dictionary
 
@@ -1405,10 +1343,12 @@ def get_stat_by_key(fight_num: int, player: dict, stat_category: str, name_prof:
 		filename (str): The filename of the fight.
 		player (dict): The player dictionary.
 		stat_category (str): The category of stats to collect.
-		name_prof (str): The name of the profession.
+		player_id (int): The player's registry id.
 	"""
 	player_stats = player[stat_category][0]
 	active_time_seconds = player['activeTimes'][0] / 1000 if player['activeTimes'] else 0
+	high_score_key = f"{player_registry.high_score_prefix(player_id)}-{fight_num} | "
+	contributions = []
 
 	for stat, value in player_stats.items():
 		if stat in ['boonStripsTime', 'condiCleanseTime', 'condiCleanseTimeSelf'] and value > 999999:
@@ -1420,23 +1360,22 @@ def get_stat_by_key(fight_num: int, player: dict, stat_category: str, name_prof:
 			high_score_value = round(value / active_time_seconds, 3) if active_time_seconds > 0 else 0
 			update_high_score(
 				f"{stat_category}_{stat}",
-				f"{{{{{player['profession']}}}}}{player['name']}-{get_player_account(player)}-{str(fight_num)} | {stat}",
+				high_score_key + stat,
 				high_score_value
 			)
-		top_stats['player'][name_prof][stat_category][stat] = top_stats['player'][name_prof][stat_category].get(stat, 0) + value
-		top_stats['fight'][fight_num][stat_category][stat] = top_stats['fight'][fight_num][stat_category].get(stat, 0) + value
-		top_stats['overall'][stat_category][stat] = top_stats['overall'][stat_category].get(stat, 0) + value
+		contributions.append((stat, value))
 
 		if player.get('hasCommanderTag'):
-			commander_name = f"{player['name']}|{player['profession']}|{get_player_account(player)}"
+			commander_name = player_registry.name_prof(player_id)
 			if commander_name not in commander_summary_data:
-				commander_summary_data[commander_name] = {stat_category: {}}
-			elif stat_category not in commander_summary_data[commander_name]:
-				commander_summary_data[commander_name][stat_category] = {}
-			commander_summary_data[commander_name][stat_category][stat] = commander_summary_data[commander_name][stat_category].get(stat, 0) + value
+				commander_summary_data[commander_name] = CommanderSummaryRecord()
+			commander_stats = commander_summary_data[commander_name].category(stat_category)
+			commander_stats[stat] = commander_stats.get(stat, 0) + value
+
+	fact_store.add(fight_num, player_id, stat_category, None, contributions)
 
 
-def get_defense_hits_and_glances(fight_num: int, player: dict, stat_category: str, name_prof: str) -> None:
+def get_defense_hits_and_glances(fight_num: int, player: dict, stat_category: str, player_id: int) -> None:
 	"""
 	Add defensive hits and glances to top_stats dictionary
 
@@ -1444,58 +1383,81 @@ def get_defense_hits_and_glances(fight_num: int, player: dict, stat_category: st
 		fight_num (int): The number of the fight.
 		player (dict): The player dictionary.
 		stat_category (str): The category of stats to collect.
-		name_prof (str): The name of the profession.
+		player_id (int): The player's registry id.
 	"""
 	direct_hits, glancing_hits = calculate_defensive_hits_and_glances(player)
-	top_stats['player'][name_prof][stat_category]['directHits'] = top_stats['player'][name_prof][stat_category].get('directHits', 0) + direct_hits
-	top_stats['player'][name_prof][stat_category]['glanceCount'] = top_stats['player'][name_prof][stat_category].get('glanceCount', 0) + glancing_hits	
-	top_stats['fight'][fight_num][stat_category]['directHits'] = top_stats['fight'][fight_num][stat_category].get('directHits', 0) + direct_hits
-	top_stats['fight'][fight_num][stat_category]['glanceCount'] = top_stats['fight'][fight_num][stat_category].get('glanceCount', 0) + glancing_hits
-	top_stats['overall'][stat_category]['directHits'] = top_stats['overall'][stat_category].get('directHits', 0) + direct_hits
-	top_stats['overall'][stat_category]['glanceCount'] = top_stats['overall'][stat_category].get('glanceCount', 0) + glancing_hits
+	fact_store.add(fight_num, player_id, stat_category, None, (('directHits', direct_hits), ('glanceCount', glancing_hits)))
 
-def get_stat_by_target_and_skill(fight_num: int, player: dict, stat_category: str, name_prof: str) -> None:
+def get_stat_by_target_and_skill(fight_num: int, player: dict, stat_category: str, player_id: int) -> None:
 	"""
 	Add player stats by target and skill to top_stats dictionary
 
+	Each skill is first summed across the targets it hit, so the fact store
+	gets one row set per skill. The max hit high score is offered once per
+	skill, for the first target it was reached on.
+
 	Args:
 		filename (str): The filename of the fight.
 		player (dict): The player dictionary.
 		stat_category (str): The category of stats to collect.
-		name_prof (str): The name of the profession.
+		player_id (int): The player's registry id.
 	"""
+	# skill_id -> [(target index, position) of max, max, min, {stat: sum}], in first seen order
+	skill_totals = {}
 	for index, target in enumerate(player[stat_category]):
-		if target[0]:
-			for skill in target[0]:
-				skill_id = skill['id']
-
-				if skill_id not in top_stats['player'][name_prof][stat_category]:
-					top_stats['player'][name_prof][stat_category][skill_id] = {}
-				if skill_id not in top_stats['fight'][fight_num][stat_category]:
-					top_stats['fight'][fight_num][stat_category][skill_id] = {}
-				if skill_id not in top_stats['overall'][stat_category]:
-					top_stats['overall'][stat_category][skill_id] = {}
-					
-				for stat, value in skill.items():
-					if stat == 'max':
-						update_high_score(f"statTarget_{stat}", "{{"+player["profession"]+"}}"+player["name"]+"-"+get_player_account(player)+"-"+str(fight_num)+"-"+str(index)+" | "+str(skill_id), value)
-						if value > top_stats['player'][name_prof][stat_category][skill_id].get(stat, 0):
-							top_stats['player'][name_prof][stat_category][skill_id][stat] = value
-							top_stats['fight'][fight_num][stat_category][skill_id][stat] = value
-							top_stats['overall'][stat_category][skill_id][stat] = value
-					elif stat == 'min':
-						if value <= top_stats['player'][name_prof][stat_category][skill_id].get(stat, 0):
-							top_stats['player'][name_prof][stat_category][skill_id][stat] = value
-							top_stats['fight'][fight_num][stat_category][skill_id][stat] = value
-							top_stats['overall'][stat_category][skill_id][stat] = value
-					elif stat not in ['id', 'max', 'min']:
-						top_stats['player'][name_prof][stat_category][skill_id][stat] = top_stats['player'][name_prof][stat_category][skill_id].get(
-							stat, 0) + value
-						top_stats['fight'][fight_num][stat_category][skill_id][stat] = top_stats['fight'][fight_num][stat_category][skill_id].get(
-							stat, 0) + value
-						top_stats['overall'][stat_category][skill_id][stat] = top_stats['overall'][stat_category][skill_id].get(stat, 0) + value
-
-def get_stat_by_target(fight_num: int, player: dict, stat_category: str, name_prof: str) -> None:
+		if not target[0]:
+			continue
+		for position, skill in enumerate(target[0]):
+			totals = skill_totals.get(skill['id'])
+			if totals is None:
+				skill_totals[skill['id']] = [
+					(index, position), skill.get('max'), skill.get('min'),
+					{stat: value for stat, value in skill.items() if stat not in ('id', 'max', 'min')}
+				]
+				continue
+			max_hit = skill.get('max')
+			if max_hit is not None and (totals[1] is None or max_hit > totals[1]):
+				totals[0] = (index, position)
+				totals[1] = max_hit
+			min_hit = skill.get('min')
+			if min_hit is not None and (totals[2] is None or min_hit < totals[2]):
+				totals[2] = min_hit
+			sums = totals[3]
+			for stat, value in skill.items():
+				if stat not in ('id', 'max', 'min'):
+					sums[stat] = sums.get(stat, 0) + value
+
+	name_prof = player_registry.name_prof(player_id)
+	high_score_prefix = player_registry.high_score_prefix(player_id)+"-"+str(fight_num)+"-"
+	player_skills = top_stats['player'][name_prof][stat_category]
+	fight_skills = top_stats['fight'][fight_num][stat_category]
+	# setdefault() skips the overall rollup, only max and min are read here
+	overall_skills = top_stats['overall'].setdefault(stat_category, {})
+	max_hits = []
+	for skill_id, (max_at, max_hit, min_hit, sums) in skill_totals.items():
+		player_skill = player_skills.setdefault(skill_id, {})
+		fight_skill = fight_skills.setdefault(skill_id, {})
+		overall_skill = overall_skills.setdefault(skill_id, {})
+
+		if max_hit is not None:
+			max_hits.append((max_at, skill_id, max_hit))
+			if max_hit > player_skill.get('max', 0):
+				player_skill['max'] = max_hit
+				fight_skill['max'] = max_hit
+				overall_skill['max'] = max_hit
+		if min_hit is not None:
+			if min_hit <= player_skill.get('min', 0):
+				player_skill['min'] = min_hit
+				fight_skill['min'] = min_hit
+				overall_skill['min'] = min_hit
+
+		fact_store.add(fight_num, player_id, stat_category, skill_id, sums.items())
+
+	# Offer in target order, as when every target was offered
+	for (index, _), skill_id, max_hit in sorted(max_hits):
+		update_high_score("statTarget_max", high_score_prefix+str(index)+" | "+str(skill_id), max_hit)
+
+def get_stat_by_target(fight_num: int, player: dict, stat_category: str, player_id: int) -> None:
 	"""
 	Add player stats by target to top_stats dictionary
 
@@ -1503,19 +1465,17 @@ def get_stat_by_target(fight_num: int, player: dict, stat_category: str, name_pr
 		filename (str): The filename of the fight.
 		player (dict): The player dictionary.
 		stat_category (str): The category of stats to collect.
-		name_prof (str): The name of the profession.
+		player_id (int): The player's registry id.
 	"""
+	name_prof = player_registry.name_prof(player_id)
 	if stat_category not in top_stats['player'][name_prof]:
 		top_stats['player'][name_prof][stat_category] = {}
 
 	for target in player[stat_category]:
 		if target[0]:
-			for stat, value in target[0].items():
-				top_stats['player'][name_prof][stat_category][stat] = top_stats['player'][name_prof][stat_category].get(stat, 0) + value
-				top_stats['fight'][fight_num][stat_category][stat] = top_stats['fight'][fight_num][stat_category].get(stat, 0) + value
-				top_stats['overall'][stat_category][stat] = top_stats['overall'][stat_category].get(stat, 0) + value
+			fact_store.add(fight_num, player_id, stat_category, None, target[0].items())
 
-def get_stat_by_skill(fight_num: int, player: dict, stat_category: str, name_prof: str) -> None:
+def get_stat_by_skill(fight_num: int, player: dict, stat_category: str, player_id: int) -> None:
 	"""
 	Add player stats by skill to top_stats dictionary.
 
@@ -1523,7 +1483,7 @@ def get_stat_by_skill(fight_num: int, player: dict, stat_category: str, name_pro
 		fight_num (int): The fight number.
 		player (dict): The player dictionary.
 		stat_category (str): The category of stats to collect.
-		name_prof (str): The name of the profession.
+		player_id (int): The player's registry id.
 	"""
 
 	# Defensive guard: skip if no data for this category
@@ -1535,18 +1495,7 @@ def get_stat_by_skill(fight_num: int, player: dict, stat_category: str, name_pro
 			continue
 
 		skill_id = skill["id"]
-
-		# Ensure dict structure exists
-		for level in ("player", "fight", "overall"):
-			if level == "player":
-				container = top_stats[level][name_prof][stat_category]
-			elif level == "fight":
-				container = top_stats[level][fight_num][stat_category]
-			else:  # "overall"
-				container = top_stats[level][stat_category]
-
-			if skill_id not in container:
-				container[skill_id] = {}
+		contributions = []
 
 		# Process each stat for this skill
 		for stat, value in skill.items():
@@ -1557,32 +1506,22 @@ def get_stat_by_skill(fight_num: int, player: dict, stat_category: str, name_pro
 			if stat == "max":
 				update_high_score(
 					f"{stat_category}_{stat}",
-					f"{{{{{player['profession']}}}}}{player['name']}-{get_player_account(player)}-{fight_num} | {skill_id}",
+					f"{player_registry.high_score_prefix(player_id)}-{fight_num} | {skill_id}",
 					value,
 				)
 
 			# Aggregate into top_stats
-			top_stats["player"][name_prof][stat_category][skill_id][stat] = (
-				top_stats["player"][name_prof][stat_category][skill_id].get(stat, 0) + value
-			)
-			top_stats["fight"][fight_num][stat_category][skill_id][stat] = (
-				top_stats["fight"][fight_num][stat_category][skill_id].get(stat, 0) + value
-			)
-			top_stats["overall"][stat_category][skill_id][stat] = (
-				top_stats["overall"][stat_category][skill_id].get(stat, 0) + value
-			)
+			contributions.append((stat, value))
 
 			# Commander-specific summary
 			if player.get("hasCommanderTag"):
-				commander_name = f"{player['name']}|{player['profession']}|{get_player_account(player)}"
-				if skill_id not in commander_summary_data[commander_name][stat_category]:
-					commander_summary_data[commander_name][stat_category][skill_id] = {}
+				commander_name = player_registry.name_prof(player_id)
+				commander_skill_stats = commander_summary_data[commander_name].category(stat_category).setdefault(skill_id, {})
+				commander_skill_stats[stat] = commander_skill_stats.get(stat, 0) + value
 
-				commander_summary_data[commander_name][stat_category][skill_id][stat] = (
-					commander_summary_data[commander_name][stat_category][skill_id].get(stat, 0) + value
-				) 
+		fact_store.add(fight_num, player_id, stat_category, skill_id, contributions)
 
-def get_buff_uptimes(fight_num: int, player: dict, group: str, stat_category: str, name_prof: str, fight_duration: int, active_time: int) -> None:
+def get_buff_uptimes(fight_num: int, player: dict, group: str, stat_category: str, player_id: int, fight_duration: int, active_time: int) -> None:
 	"""
 	Calculate buff uptime stats for a player
 
@@ -1590,7 +1529,7 @@ def get_buff_uptimes(fight_num: int, player: dict, group: str, stat_category: st
 		filename (str): The filename of the fight.
 		player (dict): The player dictionary.
 		stat_category (str): The category of stats to collect.
-		name_prof (str): The name of the profession.
+		player_id (int): The player's registry id.
 		fight_duration (int): The duration of the fight in milliseconds.
 		active_time (int): The duration of the player's active time in milliseconds.
 
@@ -1614,19 +1553,6 @@ def get_buff_uptimes(fight_num: int, player: dict, group: str, stat_category: st
 		buff_state = buff['states']
 		state_data = get_buff_states(buff_state)
 
-		if buff_id not in top_stats['player'][name_prof][stat_category]:
-			top_stats['player'][name_prof][stat_category][buff_id] = {}
-		if buff_id not in top_stats['fight'][fight_num][stat_category]:
-			top_stats['fight'][fight_num][stat_category][buff_id] = {}
-		if buff_id not in top_stats['overall'][stat_category]:
-			top_stats['overall'][stat_category][buff_id] = {}
-		if "group" not in top_stats['overall'][stat_category]:
-			top_stats['overall'][stat_category]["group"] = {}
-		if group not in top_stats['overall'][stat_category]["group"]:
-			top_stats['overall'][stat_category]["group"][group] = {}
-		if buff_id not in top_stats['overall'][stat_category]["group"][group]:
-			top_stats['overall'][stat_category]["group"][group][buff_id] = {}
-
 		if stat_category == 'buffUptimes':
 			stat_value = buff_presence * fight_duration / 100 if buff_presence else buff_uptime_ms
 		elif stat_category == 'buffUptimesActive':
@@ -1646,17 +1572,11 @@ def get_buff_uptimes(fight_num: int, player: dict, group: str, stat_category: st
 		if buff_id in non_damaging_conditions and resist_data:
 			resist_offset += calculate_resist_offset(resist_data, state_data)
 
-		top_stats['player'][name_prof][stat_category][buff_id]['uptime_ms'] = top_stats['player'][name_prof][stat_category][buff_id].get('uptime_ms', 0) + stat_value
-		top_stats['player'][name_prof][stat_category][buff_id]['state_changes'] = top_stats['player'][name_prof][stat_category][buff_id].get('state_changes', 0) + state_changes
-		top_stats['fight'][fight_num][stat_category][buff_id]['uptime_ms'] = top_stats['fight'][fight_num][stat_category][buff_id].get('uptime_ms', 0) + stat_value
-		top_stats['overall'][stat_category][buff_id]['uptime_ms'] = top_stats['overall'][stat_category][buff_id].get('uptime_ms', 0) + stat_value
-		top_stats['overall'][stat_category]["group"][group][buff_id]['uptime_ms'] = top_stats['overall'][stat_category]["group"][group][buff_id].get('uptime_ms', 0) + stat_value
-		top_stats['player'][name_prof][stat_category][buff_id]['resist_reduction'] = top_stats['player'][name_prof][stat_category][buff_id].get('resist_reduction', 0) + resist_offset
-		top_stats['fight'][fight_num][stat_category][buff_id]['resist_reduction'] = top_stats['fight'][fight_num][stat_category][buff_id].get('resist_reduction', 0) + resist_offset
-		top_stats['overall'][stat_category][buff_id]['resist_reduction'] = top_stats['overall'][stat_category][buff_id].get('resist_reduction', 0) + resist_offset
-		top_stats['overall'][stat_category]["group"][group][buff_id]['resist_reduction'] = top_stats['overall'][stat_category]["group"][group][buff_id].get('resist_reduction', 0) + resist_offset
+		fact_store.add(fight_num, player_id, stat_category, buff_id, (('uptime_ms', stat_value),), ALL_LEVELS | GROUP, group)
+		fact_store.add(fight_num, player_id, stat_category, buff_id, (('state_changes', state_changes),), PLAYER)
+		fact_store.add(fight_num, player_id, stat_category, buff_id, (('resist_reduction', resist_offset),), ALL_LEVELS | GROUP, group)
 
-def get_target_buff_data(fight_num: int, player: dict, targets: dict, stat_category: str, name_prof: str) -> None:
+def get_target_buff_data(fight_num: int, player: dict, targets: dict, stat_category: str, player_id: int) -> None:
 	"""
 	Calculate buff uptime stats for a target caused by squad player
 
@@ -1665,7 +1585,7 @@ def get_target_buff_data(fight_num: int, player: dict, targets: dict, stat_categ
 		player (dict): The player dictionary.
 		targets (dict): The targets dictionary.
 		stat_category (str): The category of stats to collect.
-		name_prof (str): The name of the profession.
+		player_id (int): The player's registry id.
 		fight_duration (int): The duration of the fight in milliseconds.
 
 	Returns:
@@ -1707,97 +1627,68 @@ def get_target_buff_data(fight_num: int, player: dict, targets: dict, stat_categ
 								damage_with_buff = calculate_damage_during_buff(player, target_idx, firstTime, secondTime, debuff_data[buff_id][1])
 					conditionTime += buffTime
 
-					#if buff_id not in top_stats['player'][name_prof][stat_category]:
-					if buff_id not in top_stats['player'][name_prof][stat_category]:
-						top_stats['player'][name_prof][stat_category][buff_id] = {
-							'uptime_ms': 0,
-							'applied_counts': 0,
-						}
-						if buff_id in debuff_data:
-							top_stats['player'][name_prof][stat_category][buff_id]['damage_gained'] = 0
-					if buff_id not in top_stats['fight'][fight_num][stat_category]:
-						top_stats['fight'][fight_num][stat_category][buff_id] = {
-							'uptime_ms': 0,
-							'applied_counts': 0,
-						}
-					if buff_id not in top_stats['overall'][stat_category]:
-						top_stats['overall'][stat_category][buff_id] = {
-							'uptime_ms': 0,
-							'applied_counts': 0,
-						}
-
-					top_stats['player'][name_prof][stat_category][buff_id]['uptime_ms'] += conditionTime
-					top_stats['player'][name_prof][stat_category][buff_id]['applied_counts'] += appliedCounts
+					fact_store.add(fight_num, player_id, stat_category, buff_id, (('uptime_ms', conditionTime), ('applied_counts', appliedCounts)))
 					if buff_id in debuff_data:
-						top_stats['player'][name_prof][stat_category][buff_id]['damage_gained'] += damage_with_buff * debuff_data[buff_id][0]
-
-					top_stats['fight'][fight_num][stat_category][buff_id]['uptime_ms'] += conditionTime
-					top_stats['fight'][fight_num][stat_category][buff_id]['applied_counts'] += appliedCounts
-
-					top_stats['overall'][stat_category][buff_id]['uptime_ms'] += conditionTime
-					top_stats['overall'][stat_category][buff_id]['applied_counts'] += appliedCounts
+						fact_store.add(fight_num, player_id, stat_category, buff_id, (('damage_gained', damage_with_buff * debuff_data[buff_id][0]),), PLAYER)
 
 		target_idx += 1
 
-def get_buff_generation(fight_num: int, player: dict, stat_category: str, name_prof: str, duration: int, buff_data: dict, squad_count: int, group_count: int) -> None:
+def get_buff_generation(fight_num: int, player: dict, player_id: int, fight_duration: int, active_time: int, squad_count: int, group_count: int, stat_categories=None) -> None:
 	"""
-	Calculate buff generation stats for a player
+	Calculate buff generation stats for a player in all six generation categories in one pass
+
+	squadBuffs, groupBuffs and selfBuffs are scaled by the fight duration and
+	the number of players the buff reached; the *Active variants are kept as
+	reported by the log.
 
 	Args:
 		fight_num (int): The number of the fight.
 		player (dict): The player dictionary.
-		stat_category (str): The category of stats to collect.
-		name_prof (str): The name of the profession.
-		duration (int): The duration of the fight in milliseconds.
-		buff_data (dict): A dictionary of buff IDs to their data.
+		player_id (int): The player's registry id.
+		fight_duration (int): The duration of the fight in milliseconds.
+		active_time (int): The player's active time in milliseconds.
 		squad_count (int): The number of players in the squad.
 		group_count (int): The number of players in the group.
-	"""
-	for buff in player.get(stat_category, []):
-		buff_id = 'b'+str(buff['id'])
-		buff_stacking = buff_data[buff_id].get('stacking', False)
-
-		if buff_id not in top_stats['player'][name_prof][stat_category]:
-			top_stats['player'][name_prof][stat_category][buff_id] = {}
-		if buff_id not in top_stats['fight'][fight_num][stat_category]:
-			top_stats['fight'][fight_num][stat_category][buff_id] = {}
-		if buff_id not in top_stats['overall'][stat_category]:
-			top_stats['overall'][stat_category][buff_id] = {}
-
-		buff_generation = buff['buffData'][0].get('generation', 0)
-		buff_wasted = buff['buffData'][0].get('wasted', 0)
-
-		if buff_stacking:
-			if stat_category == 'squadBuffs':
-				buff_generation *= duration * (squad_count - 1)
-				buff_wasted *= duration * (squad_count - 1)
-			elif stat_category == 'groupBuffs':
-				buff_generation *= duration * (group_count - 1)
-				buff_wasted *= duration * (group_count - 1)
-			elif stat_category == 'selfBuffs':
-				buff_generation *= duration
-				buff_wasted *= duration
+		stat_categories (iterable, optional): Only collect these categories. Defaults to all six.
+	"""
+	generation_categories = (
+		('squadBuffs', fight_duration, squad_count - 1),
+		('groupBuffs', fight_duration, group_count - 1),
+		('selfBuffs', fight_duration, 1),
+		('squadBuffsActive', active_time, None),
+		('groupBuffsActive', active_time, None),
+		('selfBuffsActive', active_time, None),
+	)
+	for stat_category, duration, recipients in generation_categories:
+		if stat_categories is not None and stat_category not in stat_categories:
+			continue
+		buffs = player.get(stat_category)
+		if not buffs:
+			continue
+		stacking_scale = duration * recipients if recipients is not None else None
+		rows = []
+		for buff in buffs:
+			buff_info = buff_stacking.get(buff['id'])
+			if buff_info is None:
+				buff_id = 'b'+str(buff['id'])
+				buff_info = (buff_id, buff_data[buff_id].get('stacking', False))
+			buff_id, stacking = buff_info
 
-		else:
-			if stat_category == 'squadBuffs':
-				buff_generation = (buff_generation / 100) * duration * (squad_count-1)
-				buff_wasted = (buff_wasted / 100) * duration * (squad_count-1)
-			elif stat_category == 'groupBuffs':
-				buff_generation = (buff_generation / 100) * duration * (group_count-1)
-				buff_wasted = (buff_wasted / 100) * duration * (group_count-1)
-			elif stat_category == 'selfBuffs':
-				buff_generation = (buff_generation / 100) * duration
-				buff_wasted = (buff_wasted / 100) * duration
+			generation_data = buff['buffData'][0]
+			buff_generation = generation_data.get('generation', 0)
+			buff_wasted = generation_data.get('wasted', 0)
 
-				
-		top_stats['player'][name_prof][stat_category][buff_id]['generation'] = top_stats['player'][name_prof][stat_category][buff_id].get('generation', 0) + buff_generation
-		top_stats['player'][name_prof][stat_category][buff_id]['wasted'] = top_stats['player'][name_prof][stat_category][buff_id].get('wasted', 0) + buff_wasted
+			if recipients is not None:
+				if stacking:
+					buff_generation *= stacking_scale
+					buff_wasted *= stacking_scale
+				else:
+					buff_generation = (buff_generation / 100) * duration * recipients
+					buff_wasted = (buff_wasted / 100) * duration * recipients
 
-		top_stats['fight'][fight_num][stat_category][buff_id]['generation'] = top_stats['fight'][fight_num][stat_category][buff_id].get('generation', 0) + buff_generation
-		top_stats['fight'][fight_num][stat_category][buff_id]['wasted'] = top_stats['fight'][fight_num][stat_category][buff_id].get('wasted', 0) + buff_wasted
+			rows.append((buff_id, (buff_generation, buff_wasted)))
 
-		top_stats['overall'][stat_category][buff_id]['generation'] = top_stats['overall'][stat_category][buff_id].get('generation', 0) + buff_generation
-		top_stats['overall'][stat_category][buff_id]['wasted'] = top_stats['overall'][stat_category][buff_id].get('wasted', 0) + buff_wasted
+		fact_store.add_rows(fight_num, player_id, stat_category, ('generation', 'wasted'), rows)
 
 def get_skill_cast_by_prof_role(active_time, player: dict, stat_category: str, name_prof: str) -> None:
 	"""
@@ -1881,15 +1772,9 @@ def get_healStats_data(fight_num: int, player: dict, players: dict, stat_categor
 				if heal_target_tag:
 					commander_name = f"{heal_target_name}|{players[index]['profession']}|{players[index]['account']}"
 
-					if name_prof not in commander_summary_data[commander_name]['heal_stats']:
-						commander_summary_data[commander_name]['heal_stats'][name_prof] = {
-							'outgoing_healing': 0,
-							'downed_healing': 0,
-							'outgoing_barrier': 0
-						}
-
-					commander_summary_data[commander_name]['heal_stats'][name_prof]['outgoing_healing'] += outgoing_healing
-					commander_summary_data[commander_name]['heal_stats'][name_prof]['downed_healing'] += downed_healing
+					heal_record = commander_summary_data[commander_name].heal_from(name_prof)
+					heal_record.outgoing_healing += outgoing_healing
+					heal_record.downed_healing += downed_healing
 
 
 				if 'heal_targets' not in top_stats['player'][name_prof][stat_category]:
@@ -1963,7 +1848,7 @@ def get_healStats_data(fight_num: int, player: dict, players: dict, stat_categor
 				top_stats['overall'][stat_category]['downed_healing'] = (
 					top_stats['overall'][stat_category].get('downed_healing', 0) + downed_healing
 				)
-		update_high_score(f"{stat_category}_Healing", "{{"+player["profession"]+"}}"+player["name"]+"-"+get_player_account(player)+"-"+str(fight_num)+" | Healing", round(fight_healing/(fight_time/1000), 2))	
+		update_high_score(f"{stat_category}_Healing", player_registry.high_score_prefix(player_registry.register(player))+"-"+str(fight_num)+" | Healing", round(fight_healing/(fight_time/1000), 2))	
 
 	fight_barrier = 0
 	if stat_category == 'extBarrierStats' and 'extBarrierStats' in player:
@@ -1982,14 +1867,7 @@ def get_healStats_data(fight_num: int, player: dict, players: dict, stat_categor
 				if heal_target_tag:
 					commander_name = f"{barrier_target_name}|{players[index]['profession']}|{players[index]['account']}"
 
-					if name_prof not in commander_summary_data[commander_name]['heal_stats']:
-						commander_summary_data[commander_name]['heal_stats'][name_prof] = {
-							'outgoing_healing': 0,
-							'downed_healing': 0,
-							'outgoing_barrier': 0
-						}
-
-					commander_summary_data[commander_name]['heal_stats'][name_prof]['outgoing_barrier'] += outgoing_barrier	
+					commander_summary_data[commander_name].heal_from(name_prof).outgoing_barrier += outgoing_barrier
 
 
 				if 'barrier_targets' not in top_stats['player'][name_prof][stat_category]:
@@ -2037,7 +1915,7 @@ def get_healStats_data(fight_num: int, player: dict, players: dict, stat_categor
 				top_stats['overall'][stat_category]['outgoing_barrier'] = (
 					top_stats['overall'][stat_category].get('outgoing_barrier', 0) + outgoing_barrier
 				)
-		update_high_score(f"{stat_category}_Barrier", "{{"+player["profession"]+"}}"+player["name"]+"-"+get_player_account(player)+"-"+str(fight_num)+" | Barrier", round(fight_barrier/(fight_time/1000), 2))
+		update_high_score(f"{stat_category}_Barrier", player_registry.high_score_prefix(player_registry.register(player))+"-"+str(fight_num)+" | Barrier", round(fight_barrier/(fight_time/1000), 2))
 
 def get_healing_skill_data(player: dict, stat_category: str, name_prof: str) -> None:
 	"""
@@ -2131,7 +2009,7 @@ def get_barrier_skill_data(player: dict, stat_category: str, name_prof: str) ->
 					top_stats['player'][name_prof][stat_category]['skills'][skill_id].get('totalBarrier', 0) + total_barrier
 				)
 
-def get_damage_mod_by_player(fight_num: int, player: dict, name_prof: str) -> None:
+def get_damage_mod_by_player(fight_num: int, player: dict, player_id: int) -> None:
 	"""
 	Collect and update damage modifier statistics for a player.
 
@@ -2142,7 +2020,7 @@ def get_damage_mod_by_player(fight_num: int, player: dict, name_prof: str) -> No
 	Args:
 		fight_num (int): The fight number.
 		player (dict): The player dictionary containing player-specific data.
-		name_prof (str): The player's name and profession identifier.
+		player_id (int): The player's registry id.
 	"""
 	mod_list = ["damageModifiers", "damageModifiersTarget", "incomingDamageModifiers", "incomingDamageModifiersTarget"]
 	commander_tag = player['hasCommanderTag']
@@ -2161,63 +2039,20 @@ def get_damage_mod_by_player(fight_num: int, player: dict, name_prof: str) -> No
 
 				# Update commander summary data if the player has a commander tag
 				if commander_tag:
-					commander_name = f"{player['name']}|{player['profession']}|{get_player_account(player)}"
+					commander_name = player_registry.name_prof(player_id)
 					if mod_id == 'd-58':
-						commander_summary_data[commander_name]['prot_mods']['hitCount'] += mod_hit_count
-						commander_summary_data[commander_name]['prot_mods']['totalHitCount'] += mod_total_hit_count
-						commander_summary_data[commander_name]['prot_mods']['damageGain'] += mod_damage_gain
-						commander_summary_data[commander_name]['prot_mods']['totalDamage'] += mod_total_damage
-
-				# Update player's damage modifier statistics
-				if mod_id not in top_stats['player'][name_prof]['damageModifiers']:
-					top_stats['player'][name_prof]['damageModifiers'][mod_id] = {}
-
-				top_stats['player'][name_prof]['damageModifiers'][mod_id]['hitCount'] = (
-					top_stats['player'][name_prof]['damageModifiers'][mod_id].get('hitCount', 0) + mod_hit_count
-				)
-				top_stats['player'][name_prof]['damageModifiers'][mod_id]['totalHitCount'] = (
-					top_stats['player'][name_prof]['damageModifiers'][mod_id].get('totalHitCount', 0) + mod_total_hit_count
-				)
-				top_stats['player'][name_prof]['damageModifiers'][mod_id]['damageGain'] = (
-					top_stats['player'][name_prof]['damageModifiers'][mod_id].get('damageGain', 0) + mod_damage_gain
-				)
-				top_stats['player'][name_prof]['damageModifiers'][mod_id]['totalDamage'] = (
-					top_stats['player'][name_prof]['damageModifiers'][mod_id].get('totalDamage', 0) + mod_total_damage
-				)
-
-				# Update fight-specific damage modifier statistics
-				if mod_id not in top_stats['fight'][fight_num]['damageModifiers']:
-					top_stats['fight'][fight_num]['damageModifiers'][mod_id] = {}
-
-				top_stats['fight'][fight_num]['damageModifiers'][mod_id]['hitCount'] = (
-					top_stats['fight'][fight_num]['damageModifiers'][mod_id].get('hitCount', 0) + mod_hit_count
-				)
-				top_stats['fight'][fight_num]['damageModifiers'][mod_id]['totalHitCount'] = (
-					top_stats['fight'][fight_num]['damageModifiers'][mod_id].get('totalHitCount', 0) + mod_total_hit_count
-				)
-				top_stats['fight'][fight_num]['damageModifiers'][mod_id]['damageGain'] = (
-					top_stats['fight'][fight_num]['damageModifiers'][mod_id].get('damageGain', 0) + mod_damage_gain
-				)
-				top_stats['fight'][fight_num]['damageModifiers'][mod_id]['totalDamage'] = (
-					top_stats['fight'][fight_num]['damageModifiers'][mod_id].get('totalDamage', 0) + mod_total_damage
-				)
-
-				# Update overall damage modifier statistics
-				if mod_id not in top_stats['overall']['damageModifiers']:
-					top_stats['overall']['damageModifiers'][mod_id] = {}
-
-				top_stats['overall']['damageModifiers'][mod_id]['hitCount'] = (
-					top_stats['overall']['damageModifiers'][mod_id].get('hitCount', 0) + mod_hit_count
-				)
-				top_stats['overall']['damageModifiers'][mod_id]['totalHitCount'] = (
-					top_stats['overall']['damageModifiers'][mod_id].get('totalHitCount', 0) + mod_total_hit_count
-				)
-				top_stats['overall']['damageModifiers'][mod_id]['damageGain'] = (
-					top_stats['overall']['damageModifiers'][mod_id].get('damageGain', 0) + mod_damage_gain
-				)
-				top_stats['overall']['damageModifiers'][mod_id]['totalDamage'] = (
-					top_stats['overall']['damageModifiers'][mod_id].get('totalDamage', 0) + mod_total_damage
-				)
+						prot_mods = commander_summary_data[commander_name].prot_mods
+						prot_mods.hitCount += mod_hit_count
+						prot_mods.totalHitCount += mod_total_hit_count
+						prot_mods.damageGain += mod_damage_gain
+						prot_mods.totalDamage += mod_total_damage
+
+				fact_store.add(fight_num, player_id, 'damageModifiers', mod_id, (
+					('hitCount', mod_hit_count),
+					('totalHitCount', mod_total_hit_count),
+					('damageGain', mod_damage_gain),
+					('totalDamage', mod_total_damage),
+				))
 
 def get_firebrand_pages(player, name_prof, name, account, fight_duration_ms):
 	"""
@@ -2232,11 +2067,7 @@ def get_firebrand_pages(player, name_prof, name, account, fight_duration_ms):
 	"""
 	if player['profession'] == "Firebrand" and "rotation" in player:
 		if name_prof not in fb_pages:
-			fb_pages[name_prof] = {}
-			fb_pages[name_prof]["account"] = account
-			fb_pages[name_prof]["name"] = name
-			fb_pages[name_prof]["fightTime"] = 0
-			fb_pages[name_prof]["firebrand_pages"] = {}
+			fb_pages[name_prof] = FirebrandPagesRecord(account, name)
 		
 		# Track Firebrand Buffs
 		tome1_skill_ids = ["41258", "40635", "42449", "40015", "42898"]
@@ -2248,11 +2079,11 @@ def get_firebrand_pages(player, name_prof, name, account, fight_duration_ms):
 			*tome3_skill_ids,
 		]
 
-		fb_pages[name_prof]["fightTime"] += fight_duration_ms
+		fb_pages[name_prof].fightTime += fight_duration_ms
 		for rotation_skill in player['rotation']:
 			skill_id = str(rotation_skill['id'])
 			if skill_id in tome_skill_ids:
-				pages_data = fb_pages[name_prof]["firebrand_pages"]
+				pages_data = fb_pages[name_prof].firebrand_pages
 				pages_data[skill_id] = pages_data.get(skill_id, 0) + len(rotation_skill['skills'])
 
 def get_mechanics_by_fight(fight_number, mechanics_map: dict, players: dict, log_type: str) -> None:
@@ -2413,7 +2244,7 @@ def get_damage_mitigation_data(fight_num: int, players: dict, targets: dict, ski
 	for player in players:
 		if player['notInSquad']:
 			continue
-		name_prof = f"{player['name']}|{player['profession']}|{get_player_account(player)}"
+		name_prof = player_registry.name_prof(player_registry.register(player))
 		if 'totalDamageTaken' in player:
 			if name_prof not in player_damage_mitigation:
 				player_damage_mitigation[name_prof] = {}
@@ -2426,27 +2257,8 @@ def get_damage_mitigation_data(fight_num: int, players: dict, targets: dict, ski
 				else:
 					skill_name = f"Unknown Skill {skill_id}"
 				if skill_name not in player_damage_mitigation[name_prof]:
-					player_damage_mitigation[name_prof][skill_name] = {
-						'blocked': 0,
-						'blocked_dmg': 0,
-						'evaded': 0,
-						'evaded_dmg': 0,
-						'glanced': 0,
-						'glanced_dmg': 0,
-						'missed': 0,
-						'missed_dmg': 0,
-						'invulned': 0,
-						'invulned_dmg': 0,
-						'interrupted': 0,
-						'interrupted_dmg': 0,
-						'total_dmg': 0,
-						'skill_hits': 0,
-						'total_hits': 0,
-						'avg_dmg': 0,
-						'min_dmg': 0,
-						'avoided_damage': 0,
-						'min_avoided_damage': 0
-					}
+					player_damage_mitigation[name_prof][skill_name] = DamageMitigationRecord()
+				mitigation = player_damage_mitigation[name_prof][skill_name]
 
 				if skill_name not in enemy_avg_damage_per_skill:
 					enemy_avg_dmg = 1
@@ -2454,50 +2266,50 @@ def get_damage_mitigation_data(fight_num: int, players: dict, targets: dict, ski
 				else:
 					enemy_min_dmg = sum(enemy_avg_damage_per_skill[skill_name]['min']) / len(enemy_avg_damage_per_skill[skill_name]['min']) if skill_name in enemy_avg_damage_per_skill else 0
 					enemy_avg_dmg = enemy_avg_damage_per_skill[skill_name]['dmg'] / enemy_avg_damage_per_skill[skill_name]['hits'] if enemy_avg_damage_per_skill[skill_name]['hits'] > 0 else 0
-				player_damage_mitigation[name_prof][skill_name]['blocked'] += skill['blocked']
-				player_damage_mitigation[name_prof][skill_name]['evaded'] += skill['evaded']
-				player_damage_mitigation[name_prof][skill_name]['glanced'] += skill['glance']
-				player_damage_mitigation[name_prof][skill_name]['missed'] += skill['missed']
-				player_damage_mitigation[name_prof][skill_name]['invulned'] += skill['invulned']
-				player_damage_mitigation[name_prof][skill_name]['interrupted'] += skill['interrupted']
-				player_damage_mitigation[name_prof][skill_name]['total_dmg'] = enemy_avg_damage_per_skill[skill_name]['dmg'] if skill_name in enemy_avg_damage_per_skill else 0
-				player_damage_mitigation[name_prof][skill_name]['skill_hits'] += skill['hits']
-				player_damage_mitigation[name_prof][skill_name]['total_hits'] = enemy_avg_damage_per_skill[skill_name]['hits'] if skill_name in enemy_avg_damage_per_skill else 0
-				if player_damage_mitigation[name_prof][skill_name]['total_hits'] > 0:
-					player_damage_mitigation[name_prof][skill_name]['avg_dmg'] = enemy_avg_dmg
-					player_damage_mitigation[name_prof][skill_name]['min_dmg'] = enemy_min_dmg
+				mitigation.blocked += skill['blocked']
+				mitigation.evaded += skill['evaded']
+				mitigation.glanced += skill['glance']
+				mitigation.missed += skill['missed']
+				mitigation.invulned += skill['invulned']
+				mitigation.interrupted += skill['interrupted']
+				mitigation.total_dmg = enemy_avg_damage_per_skill[skill_name]['dmg'] if skill_name in enemy_avg_damage_per_skill else 0
+				mitigation.skill_hits += skill['hits']
+				mitigation.total_hits = enemy_avg_damage_per_skill[skill_name]['hits'] if skill_name in enemy_avg_damage_per_skill else 0
+				if mitigation.total_hits > 0:
+					mitigation.avg_dmg = enemy_avg_dmg
+					mitigation.min_dmg = enemy_min_dmg
 					avoided_damage = (
-						player_damage_mitigation[name_prof][skill_name]['glanced'] * player_damage_mitigation[name_prof][skill_name]['avg_dmg'] / 2
+						mitigation.glanced * mitigation.avg_dmg / 2
 						+ (
 							(
-							player_damage_mitigation[name_prof][skill_name]['blocked']
-							+ player_damage_mitigation[name_prof][skill_name]['evaded']
-							+ player_damage_mitigation[name_prof][skill_name]['missed']
-							+ player_damage_mitigation[name_prof][skill_name]['invulned']
-							+ player_damage_mitigation[name_prof][skill_name]['interrupted']
-						) * player_damage_mitigation[name_prof][skill_name]['avg_dmg']
+							mitigation.blocked
+							+ mitigation.evaded
+							+ mitigation.missed
+							+ mitigation.invulned
+							+ mitigation.interrupted
+						) * mitigation.avg_dmg
 						)
 					)
 					min_avoided_damage = (
-						player_damage_mitigation[name_prof][skill_name]['glanced'] * player_damage_mitigation[name_prof][skill_name]['min_dmg'] / 2
+						mitigation.glanced * mitigation.min_dmg / 2
 						+ (
 							(
-							player_damage_mitigation[name_prof][skill_name]['blocked']
-							+ player_damage_mitigation[name_prof][skill_name]['evaded']
-							+ player_damage_mitigation[name_prof][skill_name]['missed']
-							+ player_damage_mitigation[name_prof][skill_name]['invulned']
-							+ player_damage_mitigation[name_prof][skill_name]['interrupted']
-						) * player_damage_mitigation[name_prof][skill_name]['min_dmg']
+							mitigation.blocked
+							+ mitigation.evaded
+							+ mitigation.missed
+							+ mitigation.invulned
+							+ mitigation.interrupted
+						) * mitigation.min_dmg
 						)
 					)
-					player_damage_mitigation[name_prof][skill_name]['blocked_dmg'] += player_damage_mitigation[name_prof][skill_name]['blocked'] * player_damage_mitigation[name_prof][skill_name]['avg_dmg']
-					player_damage_mitigation[name_prof][skill_name]['evaded_dmg'] += player_damage_mitigation[name_prof][skill_name]['evaded'] * player_damage_mitigation[name_prof][skill_name]['avg_dmg']
-					player_damage_mitigation[name_prof][skill_name]['glanced_dmg'] += player_damage_mitigation[name_prof][skill_name]['glanced'] * (player_damage_mitigation[name_prof][skill_name]['avg_dmg']/2)
-					player_damage_mitigation[name_prof][skill_name]['missed_dmg'] += player_damage_mitigation[name_prof][skill_name]['missed'] * player_damage_mitigation[name_prof][skill_name]['avg_dmg']
-					player_damage_mitigation[name_prof][skill_name]['invulned_dmg'] += player_damage_mitigation[name_prof][skill_name]['invulned'] * player_damage_mitigation[name_prof][skill_name]['avg_dmg']
-					player_damage_mitigation[name_prof][skill_name]['interrupted_dmg'] += player_damage_mitigation[name_prof][skill_name]['interrupted'] * player_damage_mitigation[name_prof][skill_name]['avg_dmg']
-					player_damage_mitigation[name_prof][skill_name]['avoided_damage'] += avoided_damage
-					player_damage_mitigation[name_prof][skill_name]['min_avoided_damage'] += min_avoided_damage
+					mitigation.blocked_dmg += mitigation.blocked * mitigation.avg_dmg
+					mitigation.evaded_dmg += mitigation.evaded * mitigation.avg_dmg
+					mitigation.glanced_dmg += mitigation.glanced * (mitigation.avg_dmg/2)
+					mitigation.missed_dmg += mitigation.missed * mitigation.avg_dmg
+					mitigation.invulned_dmg += mitigation.invulned * mitigation.avg_dmg
+					mitigation.interrupted_dmg += mitigation.interrupted * mitigation.avg_dmg
+					mitigation.avoided_damage += avoided_damage
+					mitigation.min_avoided_damage += min_avoided_damage
 
 		if "minions" in player:
 			for minion in player["minions"]:
@@ -2611,7 +2423,7 @@ def get_minions_by_player(player_data: dict, player_name: str, profession: str)
 	Returns:
 		None
 	"""
-	player_name = player_name+"|"+profession+"|"+get_player_account(player_data)
+	player_name = player_registry.name_prof(player_registry.register(player_data))
 	if "minions" in player_data:
 		if profession not in minions:
 			minions[profession] = {"player": {}, "pets_list": [], "pet_skills_list": []}
@@ -2754,22 +2566,12 @@ def get_illusion_of_life_data(players: dict, durationMS: int) -> None:
 						caster_wasted = item['buffData'][0]['wasted'][caster_name]
 					
 						if caster_name not in IOL_revive:
-							IOL_revive[caster_name] = {
-								'prof': "",
-								'casts': 0,
-								'hits': 0,
-								'generated': 0,
-								'wasted': 0,
-								'gen_plus_wasted':0
-							}
+							IOL_revive[caster_name] = IllusionOfLifeRecord("", 0)
 						generated = ((caster_generated/100)*durationMS)/1000
 						wasted = ((caster_wasted/100)*durationMS)/1000
 						total_gen_wasted = round((generated+wasted), 0)
 						hits = math.ceil(total_gen_wasted/15)
-						IOL_revive[caster_name]['hits'] = IOL_revive[caster_name].get('hits',0) + hits
-						IOL_revive[caster_name]['generated'] = IOL_revive[caster_name].get('generated',0) + round(generated,0)
-						IOL_revive[caster_name]['wasted'] = IOL_revive[caster_name].get('wasted',0) + round(wasted,0)
-						IOL_revive[caster_name]['gen_plus_wasted'] = IOL_revive[caster_name].get('gen_plus_wasted',0) + round(total_gen_wasted,0)
+						IOL_revive[caster_name].add_generation(hits, round(generated,0), round(wasted,0), round(total_gen_wasted,0))
 			
 		if 'rotation' in player and playerProf in ['Mesmer', 'Mirage', 'Chronomancer','Virtuoso']:
 			
@@ -2778,11 +2580,135 @@ def get_illusion_of_life_data(players: dict, durationMS: int) -> None:
 					rotationCasts = len(item['skills'])
 
 					if playerName not in IOL_revive:
-						IOL_revive[playerName] = {}
-					IOL_revive[playerName]['casts'] = IOL_revive[playerName].get('casts', 0) + rotationCasts
-					IOL_revive[playerName]['prof'] = playerProf
+						IOL_revive[playerName] = IllusionOfLifeRecord()
+					IOL_revive[playerName].add_casts(playerProf, rotationCasts)
+
+class PlayerFightContext:
+	"""Values of one player in one fight shared by the stat collectors."""
+
+	__slots__ = (
+		"fight_num", "player", "player_id", "name_prof", "name", "group", "players", "targets",
+		"fight_duration", "active_time", "squad_count", "group_count", "running_healing_addon",
+	)
+
+	def __init__(self, **values) -> None:
+		for field, value in values.items():
+			setattr(self, field, value)
+
+
+# (categories, collector) in registration order, see stat_collector()
+stat_collectors = []
+
 
-def parse_file(file_path, fight_num, guild_data, fight_data_charts, blacklist):
+def stat_collector(*stat_categories):
+	"""
+	Register a collector for the per player stat loop in parse_file().
+
+	The collector is called once per player with a PlayerFightContext and the
+	categories it consumes that are listed in config.json_stats, in that order.
+
+	Args:
+		*stat_categories (str): The Elite Insights categories the collector consumes.
+	"""
+	def register(collector):
+		stat_collectors.append((stat_categories, collector))
+		return collector
+	return register
+
+
+def build_collector_plan(json_stats: list, profile=FULL_PROFILE) -> list:
+	"""
+	Order the registered collectors for a list of stat categories.
+
+	Args:
+		json_stats (list): The categories to collect, e.g. config.json_stats.
+		profile (ReportProfile, optional): Skips the categories only feeding reports it does not build.
+
+	Returns:
+		list: (collector, categories) pairs ordered by the first category each consumes.
+	"""
+	plan = []
+	for categories, collector in stat_collectors:
+		consumed = [stat_cat for stat_cat in json_stats if stat_cat in categories and profile.collects_category(stat_cat)]
+		if consumed:
+			plan.append((json_stats.index(consumed[0]), collector, consumed))
+	plan.sort(key=lambda step: step[0])
+	return [(collector, consumed) for _, collector, consumed in plan]
+
+
+# format: player[stat_category][0][stat]
+@stat_collector('defenses', 'support', 'statsAll')
+def collect_stats_by_key(ctx: PlayerFightContext, stat_categories: list) -> None:
+	for stat_cat in stat_categories:
+		get_stat_by_key(ctx.fight_num, ctx.player, stat_cat, ctx.player_id)
+		if stat_cat == 'defenses':
+			get_defense_hits_and_glances(ctx.fight_num, ctx.player, stat_cat, ctx.player_id)
+
+
+# format: player[stat_cat][target][0][skill][stat]
+@stat_collector('targetDamageDist')
+def collect_stats_by_target_and_skill(ctx: PlayerFightContext, stat_categories: list) -> None:
+	for stat_cat in stat_categories:
+		get_stat_by_target_and_skill(ctx.fight_num, ctx.player, stat_cat, ctx.player_id)
+
+
+# format: player[stat_cat][target[0][stat:value]
+@stat_collector('dpsTargets', 'statsTargets')
+def collect_stats_by_target(ctx: PlayerFightContext, stat_categories: list) -> None:
+	for stat_cat in stat_categories:
+		get_stat_by_target(ctx.fight_num, ctx.player, stat_cat, ctx.player_id)
+
+
+# format: player[stat_cat][0][skill][stat:value]
+@stat_collector('totalDamageTaken')
+def collect_stats_by_skill(ctx: PlayerFightContext, stat_categories: list) -> None:
+	for stat_cat in stat_categories:
+		get_stat_by_skill(ctx.fight_num, ctx.player, stat_cat, ctx.player_id)
+
+
+# format: player[stat_cat][buff][buffData][0][stat:value]
+@stat_collector('buffUptimes', 'buffUptimesActive')
+def collect_buff_uptimes(ctx: PlayerFightContext, stat_categories: list) -> None:
+	for stat_cat in stat_categories:
+		get_buff_uptimes(ctx.fight_num, ctx.player, ctx.group, stat_cat, ctx.player_id, ctx.fight_duration, ctx.active_time)
+
+
+# format: player[stat_category][buff][buffData][0][generation]
+@stat_collector('squadBuffs', 'groupBuffs', 'selfBuffs', 'squadBuffsActive', 'groupBuffsActive', 'selfBuffsActive')
+def collect_buff_generation(ctx: PlayerFightContext, stat_categories: list) -> None:
+	get_buff_generation(ctx.fight_num, ctx.player, ctx.player_id, ctx.fight_duration, ctx.active_time, ctx.squad_count, ctx.group_count, stat_categories)
+
+
+# format: player[stat_category][skill][skills][casts]
+@stat_collector('rotation')
+def collect_skill_casts(ctx: PlayerFightContext, stat_categories: list) -> None:
+	if 'rotation' in ctx.player:
+		get_skill_cast_by_prof_role(ctx.active_time, ctx.player, 'rotation', ctx.name_prof)
+
+
+@stat_collector('extHealingStats', 'extBarrierStats')
+def collect_heal_stats(ctx: PlayerFightContext, stat_categories: list) -> None:
+	if not ctx.running_healing_addon:
+		return
+	for stat_cat in stat_categories:
+		get_healStats_data(ctx.fight_num, ctx.player, ctx.players, stat_cat, ctx.name_prof, ctx.fight_duration)
+		if stat_cat == 'extHealingStats':
+			get_healing_skill_data(ctx.player, stat_cat, ctx.name_prof)
+		else:
+			get_barrier_skill_data(ctx.player, stat_cat, ctx.name_prof)
+
+
+@stat_collector('targetBuffs')
+def collect_target_buffs(ctx: PlayerFightContext, stat_categories: list) -> None:
+	get_target_buff_data(ctx.fight_num, ctx.player, ctx.targets, 'targetBuffs', ctx.player_id)
+
+
+@stat_collector('damageModifiers')
+def collect_damage_modifiers(ctx: PlayerFightContext, stat_categories: list) -> None:
+	get_damage_mod_by_player(ctx.fight_num, ctx.player, ctx.player_id)
+
+
+def parse_file(file_path, fight_num, guild_data, fight_data_charts, blacklist, profile=FULL_PROFILE):
 	"""
 	Parses a single log file and stores the data in a global top_stats dictionary.
 
@@ -2794,11 +2720,14 @@ def parse_file(file_path, fight_num, guild_data, fight_data_charts, blacklist):
 		each player.
 	fight_data_charts: A boolean indicating whether to store detailed fight data
 		for each player.
+	profile: The ReportProfile of the run. Collectors and stat categories only
+		feeding reports and outputs it skips are not run.
 
 	Side effects:
 	Modifies the global top_stats dictionary.
 	"""
 	json_stats = config.json_stats
+	collector_plan = build_collector_plan(json_stats, profile)
 
 	if file_path.endswith('.gz'):
 		with gzip.open(file_path, mode="r") as f:
@@ -2842,7 +2771,9 @@ def parse_file(file_path, fight_num, guild_data, fight_data_charts, blacklist):
 
 	log_type, fight_name = determine_log_type_and_extract_fight_name(fight_name)
 
-	calculate_dps_stats(json_data, blacklist)
+	combat_breakpoints = get_squad_combat_breakpoints(json_data)
+	if profile.collects("dps_stats"):
+		calculate_dps_stats(json_data, blacklist, combat_breakpoints)
 
 	top_stats['overall']['last_fight'] = f"{fight_date}-{fight_end}"
 	#Initialize fight_num stats
@@ -2897,16 +2828,23 @@ def parse_file(file_path, fight_num, guild_data, fight_data_charts, blacklist):
 	get_personal_buff_data(personal_buffs)
 
 	#collect mechanics data
-	get_mechanics_by_fight(fight_num, mechanics_map, players, log_type)
+	if profile.collects("mechanics"):
+		get_mechanics_by_fight(fight_num, mechanics_map, players, log_type)
 
 	#top_stats['fight'][fight_num]['rallies'] = get_rally_mechanics_by_fight(mechanics_map)
 	top_stats['fight'][fight_num]['rallies'] = get_rally_mechanics_by_fight(mechanics_map, players)
 	top_stats['overall']['rallies'] = top_stats['overall'].get('rallies', 0) + top_stats['fight'][fight_num]['rallies']
 
 	#collect damage mitigation data
-	get_damage_mitigation_data(fight_num, players, targets, skill_map, buff_map)
-
-	get_illusion_of_life_data(players, fight_duration_ms)
+	if profile.collects("damage_mitigation"):
+		get_damage_mitigation_data(fight_num, players, targets, skill_map, buff_map)
+
+	if profile.collects("illusion_of_life"):
+		get_illusion_of_life_data(players, fight_duration_ms)
+	collect_fb_pages = profile.collects("firebrand_pages")
+	collect_minions = profile.collects("minions")
+	collect_clone_usage = profile.collects("clone_usage")
+	collect_death_on_tag = profile.collects("death_on_tag")
 	
 	#process each player in the fight
 	for player in players:
@@ -2915,7 +2853,8 @@ def parse_file(file_path, fight_num, guild_data, fight_data_charts, blacklist):
 			continue
 		name = player['name']
 		profession = player['profession']
-		account = get_player_account(player)
+		player_id = player_registry.register(player)
+		account = player_registry.account(player_id)
 
 		#skip blacklisted accounts
 		if account in blacklist:
@@ -2925,12 +2864,12 @@ def parse_file(file_path, fight_num, guild_data, fight_data_charts, blacklist):
 		group_count = len(top_stats['parties_by_fight'][fight_num][group])
 		squad_count = top_stats['fight'][fight_num]['squad_count']
 
-		name_prof = name + "|" + profession + "|" + account
+		name_prof = player_registry.name_prof(player_id)
 		tag = player['hasCommanderTag']
 		if tag:	#Commander Tracking
 			top_stats['fight'][fight_num]['commander'] = name_prof
 
-		combat_time = round(sum_breakpoints(get_combat_time_breakpoints(player)) / 1000)
+		combat_time = round(sum_breakpoints(combat_breakpoints[player_id]) / 1000)
 		if not combat_time:
 			continue
 		
@@ -2976,17 +2915,20 @@ def parse_file(file_path, fight_num, guild_data, fight_data_charts, blacklist):
 
 			check_burst1S_high_score(fight_data, player, fight_num)
 
-		get_firebrand_pages(player, name_prof, name, account,fight_duration_ms)
+		if collect_fb_pages:
+			get_firebrand_pages(player, name_prof, name, account,fight_duration_ms)
 
-		get_player_fight_dps(player["dpsTargets"], name, profession, account, fight_num, (fight_duration_ms/1000))
-		get_player_stats_targets(player["statsTargets"], name, profession, account, fight_num, (fight_duration_ms/1000))
+		get_player_fight_dps(player["dpsTargets"], player_id, fight_num, (fight_duration_ms/1000))
+		get_player_stats_targets(player["statsTargets"], player_id, fight_num, (fight_duration_ms/1000))
 
-		get_minions_by_player(player, name, profession)
+		if collect_minions:
+			get_minions_by_player(player, name, profession)
 
-		if player["profession"] in ["Mesmer", "Chronomancer", "Mirage"]:
+		if collect_clone_usage and player["profession"] in ["Mesmer", "Chronomancer", "Mirage"]:
 			determine_clone_usage(player, skill_map, mesmer_shatter_skills)
 
-		get_player_death_on_tag(player, commander_tag_positions, dead_tag_mark, dead_tag, inches_to_pixel, polling_rate)
+		if collect_death_on_tag:
+			get_player_death_on_tag(player, commander_tag_positions, dead_tag_mark, dead_tag, inches_to_pixel, polling_rate)
 
 		# Cumulative group and squad supported counts
 		top_stats['player'][name_prof]['num_fights'] = top_stats['player'][name_prof].get('num_fights', 0) + 1
@@ -3009,54 +2951,28 @@ def parse_file(file_path, fight_num, guild_data, fight_data_charts, blacklist):
 		top_stats['fight'][fight_num]['active_time'] = top_stats['fight'][fight_num].get('active_time', 0) + active_time
 		top_stats['overall']['active_time'] = top_stats['overall'].get('active_time', 0) + active_time
 
+		# Initialize the player's category dictionaries if they don't exist
+		player_stats = top_stats['player'][name_prof]
 		for stat_cat in json_stats:
+			player_stats.setdefault(stat_cat, {})
+
+		ctx = PlayerFightContext(
+			fight_num=fight_num,
+			player=player,
+			player_id=player_id,
+			name_prof=name_prof,
+			name=name,
+			group=group,
+			players=players,
+			targets=targets,
+			fight_duration=fight_duration_ms,
+			active_time=active_time,
+			squad_count=squad_count,
+			group_count=group_count,
+			running_healing_addon=name in players_running_healing_addon,
+		)
+		for collector, stat_categories in collector_plan:
+			collector(ctx, stat_categories)
 
-			# Initialize dictionaries for player, fight, and overall stats if they don't exist
-			top_stats['player'].setdefault(name_prof, {}).setdefault(stat_cat, {})
-			#top_stats['fight'][fight_num].setdefault(stat_cat, {})
-			#top_stats['overall'].setdefault(stat_cat, {})
-
-			# format: player[stat_category][0][stat]
-			if stat_cat in ['defenses', 'support', 'statsAll']:
-				get_stat_by_key(fight_num, player, stat_cat, name_prof)
-				if stat_cat in ['defenses']:
-					get_defense_hits_and_glances(fight_num, player, stat_cat, name_prof)
-
-			# format: player[stat_cat][target][0][skill][stat]
-			if stat_cat in ['targetDamageDist']:
-				get_stat_by_target_and_skill(fight_num, player, stat_cat, name_prof)
-
-			# format: player[stat_cat][target[0][stat:value]
-			if stat_cat in ['dpsTargets', 'statsTargets']:
-				get_stat_by_target(fight_num, player, stat_cat, name_prof)
-
-			# format: player[stat_cat][0][skill][stat:value]
-			if stat_cat in ['totalDamageTaken']:
-				get_stat_by_skill(fight_num, player, stat_cat, name_prof)
-
-			# format: player[stat_cat][buff][buffData][0][stat:value]
-			if stat_cat in ['buffUptimes', 'buffUptimesActive']:
-				get_buff_uptimes(fight_num, player, group, stat_cat, name_prof, fight_duration_ms, active_time)
-
-			# format: player[stat_category][buff][buffData][0][generation]
-			if stat_cat in ['squadBuffs', 'groupBuffs', 'selfBuffs']:
-				get_buff_generation(fight_num, player, stat_cat, name_prof, fight_duration_ms, buff_data, squad_count, group_count)
-			if stat_cat in ['squadBuffsActive', 'groupBuffsActive', 'selfBuffsActive']:                
-				get_buff_generation(fight_num, player, stat_cat, name_prof, active_time, buff_data, squad_count, group_count)
-
-			# format: player[stat_category][skill][skills][casts]
-			if stat_cat == 'rotation' and 'rotation' in player:
-				get_skill_cast_by_prof_role(active_time, player, stat_cat, name_prof)
-
-			if stat_cat in ['extHealingStats', 'extBarrierStats'] and name in players_running_healing_addon:
-				get_healStats_data(fight_num, player, players, stat_cat, name_prof, fight_duration_ms)
-				if stat_cat == 'extHealingStats':
-					get_healing_skill_data(player, stat_cat, name_prof)
-				else:
-					get_barrier_skill_data(player, stat_cat, name_prof)
-
-			if stat_cat in ['targetBuffs']:
-				get_target_buff_data(fight_num, player, targets, stat_cat, name_prof)
-
-			if stat_cat in ['damageModifiers']:
-				get_damage_mod_by_player(fight_num, player, name_prof)
+	# Roll the fight's recorded contributions up into top_stats
+	fact_store.flush(top_stats, player_registry.name_prof)
@@ -0,0 +1,109 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+class PlayerRegistry:
+	"""Per-run registry of stable integer ids for (account, name, profession).
+
+	Collectors key their accumulators on the id returned by `register()`.
+	The identity strings used by the output (``name|profession|account`` for
+	top_stats, ``profession name account`` for DPSStats, ...) are built once
+	per player and looked up by id, or swapped in for whole accumulators with
+	`materialize()` once parsing is complete.
+	"""
+
+	def __init__(self) -> None:
+		self._ids = {}
+		self._sanitized_accounts = {}
+		self.accounts = []
+		self.names = []
+		self.professions = []
+		self._name_prof = []
+		self._dps_keys = []
+		self._clone_keys = []
+		self._chart_keys = []
+		self._high_score_prefixes = []
+
+	def __len__(self) -> int:
+		return len(self.accounts)
+
+	def register(self, player: dict) -> int:
+		"""Return the id of a player from the log, assigning one on first sight.
+
+		Args:
+			player (dict): The player data from the log.
+
+		Returns:
+			int: The player id.
+		"""
+		raw_account = player['account']
+		account = self._sanitized_accounts.get(raw_account)
+		if account is None:
+			# Accounts are written with "." in place of "-" so they can be split on "-"
+			account = raw_account.replace("-", ".")
+			self._sanitized_accounts[raw_account] = account
+
+		name = player['name']
+		profession = player['profession']
+		identity = (account, name, profession)
+		player_id = self._ids.get(identity)
+		if player_id is None:
+			player_id = len(self.accounts)
+			self._ids[identity] = player_id
+			self.accounts.append(account)
+			self.names.append(name)
+			self.professions.append(profession)
+			self._name_prof.append(f"{name}|{profession}|{account}")
+			self._dps_keys.append(f"{profession} {name} {account}")
+			self._clone_keys.append(f"{name}_{profession}_{account}")
+			self._chart_keys.append(f"{account}-{profession}-{name}")
+			self._high_score_prefixes.append("{{"+profession+"}}"+name+"-"+account)
+		return player_id
+
+	def account(self, player_id: int) -> str:
+		return self.accounts[player_id]
+
+	def name_prof(self, player_id: int) -> str:
+		"""Key used by top_stats['player'] and the commander summary: name|profession|account."""
+		return self._name_prof[player_id]
+
+	def dps_key(self, player_id: int) -> str:
+		"""Key used by DPSStats: profession name account."""
+		return self._dps_keys[player_id]
+
+	def clone_key(self, player_id: int) -> str:
+		"""Key used by mesmer_clone_usage: name_profession_account."""
+		return self._clone_keys[player_id]
+
+	def chart_key(self, player_id: int) -> str:
+		"""Key used by the fight line charts: account-profession-name."""
+		return self._chart_keys[player_id]
+
+	def high_score_prefix(self, player_id: int) -> str:
+		"""Leading part of high score keys: {{profession}}name-account."""
+		return self._high_score_prefixes[player_id]
+
+	def materialize(self, accumulator: dict, key_format) -> dict:
+		"""Return a copy of an id keyed accumulator keyed by output strings.
+
+		Args:
+			accumulator (dict): Values keyed by player id.
+			key_format (callable): One of the key methods, e.g. `dps_key`.
+
+		Returns:
+			dict: The same values keyed by the formatted strings, in the same order.
+		"""
+		return {key_format(player_id): value for player_id, value in accumulator.items()}
@@ -0,0 +1,239 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+class Record:
+	"""Base for fixed-field per-player accumulators.
+
+	Subclasses list their fields in ``__slots__`` in output order, so a
+	record carries no per-instance dict and `to_dict()` rebuilds the plain
+	dict the JSON and TID builders read.
+	"""
+
+	__slots__ = ()
+
+	def to_dict(self) -> dict:
+		return {field: to_plain(getattr(self, field)) for field in self.__slots__}
+
+
+def to_plain(value):
+	"""Return a value with any records, nested in dicts, replaced by plain dicts."""
+	if isinstance(value, Record):
+		return value.to_dict()
+	if isinstance(value, dict):
+		return {key: to_plain(item) for key, item in value.items()}
+	return value
+
+
+class DPSRecord(Record):
+	"""Per-player totals for the DPS stats tables."""
+
+	__slots__ = (
+		"account", "name", "profession", "duration", "combatTime", "coordinationDamage",
+		"chunkDamage", "chunkDamageTotal", "carrionDamage", "carrionDamageTotal",
+		"damageTotal", "squadDamageTotal", "burstDamage", "ch5CaBurstDamage", "downs", "kills",
+	)
+
+	def __init__(self, account: str, name: str, profession: str, chunk_seconds: int) -> None:
+		self.account = account
+		self.name = name
+		self.profession = profession
+		self.duration = 0
+		self.combatTime = 0
+		self.coordinationDamage = 0
+		self.chunkDamage = [0] * chunk_seconds
+		self.chunkDamageTotal = [0] * chunk_seconds
+		self.carrionDamage = 0
+		self.carrionDamageTotal = 0
+		self.damageTotal = 0
+		self.squadDamageTotal = 0
+		self.burstDamage = [0] * chunk_seconds
+		self.ch5CaBurstDamage = [0] * chunk_seconds
+		self.downs = 0
+		self.kills = 0
+
+
+class StackingUptimeRecord(Record):
+	"""Per-player stack uptimes of Might and Stability, and damage dealt per boon stack.
+
+	Args:
+		boon_names (iterable): Boons to track damage for; Might by stack count, the rest by up or down.
+	"""
+
+	__slots__ = ("account", "name", "profession", "duration_Might", "duration_Stability", "Might", "Stability", "damage_with")
+
+	def __init__(self, account: str, name: str, profession: str, boon_names) -> None:
+		self.account = account
+		self.name = name
+		self.profession = profession
+		self.duration_Might = 0
+		self.duration_Stability = 0
+		self.Might = [0] * 26
+		self.Stability = [0] * 26
+		self.damage_with = {boon_name: [0] * 26 if boon_name == 'Might' else [0] * 2 for boon_name in boon_names}
+
+	def stacks(self, buff_name: str) -> list:
+		"""Return the uptime by stack count of Might or Stability."""
+		return self.Might if buff_name == 'Might' else self.Stability
+
+	def add_duration(self, buff_name: str, duration: int) -> None:
+		if buff_name == 'Might':
+			self.duration_Might += duration
+		else:
+			self.duration_Stability += duration
+
+	def to_dict(self) -> dict:
+		data = {
+			"account": self.account,
+			"name": self.name,
+			"profession": self.profession,
+			"duration_Might": self.duration_Might,
+			"duration_Stability": self.duration_Stability,
+			"Might": self.Might,
+			"Stability": self.Stability,
+		}
+		for boon_name, damage in self.damage_with.items():
+			data["damage_with_"+boon_name] = damage
+		return data
+
+
+class DeathOnTagRecord(Record):
+	"""Per-player deaths classified by distance to the commander tag."""
+
+	__slots__ = ("name", "profession", "account", "distToTag", "On_Tag", "Off_Tag", "Run_Back", "After_Tag_Death", "Total", "Ranges")
+
+	def __init__(self, name: str, profession: str, account: str) -> None:
+		self.name = name
+		self.profession = profession
+		self.account = account
+		self.distToTag = []
+		self.On_Tag = 0
+		self.Off_Tag = 0
+		self.Run_Back = 0
+		self.After_Tag_Death = 0
+		self.Total = 0
+		self.Ranges = []
+
+
+class FirebrandPagesRecord(Record):
+	"""Per-player tome page casts of a Firebrand, keyed by skill id."""
+
+	__slots__ = ("account", "name", "fightTime", "firebrand_pages")
+
+	def __init__(self, account: str, name: str) -> None:
+		self.account = account
+		self.name = name
+		self.fightTime = 0
+		self.firebrand_pages = {}
+
+
+class IllusionOfLifeRecord(Record):
+	"""Illusion of Life casts of a Mesmer and the revive hits generated by a caster.
+
+	Fields never set stay None and are left out of `to_dict()`, matching the
+	partial entries of players seen only casting or only generating.
+	"""
+
+	__slots__ = ("prof", "casts", "hits", "generated", "wasted", "gen_plus_wasted")
+
+	def __init__(self, prof: str = None, casts: int = None) -> None:
+		self.prof = prof
+		self.casts = casts
+		self.hits = None
+		self.generated = None
+		self.wasted = None
+		self.gen_plus_wasted = None
+
+	def add_casts(self, prof: str, casts: int) -> None:
+		self.casts = (self.casts or 0) + casts
+		self.prof = prof
+
+	def add_generation(self, hits: int, generated: float, wasted: float, gen_plus_wasted: float) -> None:
+		self.hits = (self.hits or 0) + hits
+		self.generated = (self.generated or 0) + generated
+		self.wasted = (self.wasted or 0) + wasted
+		self.gen_plus_wasted = (self.gen_plus_wasted or 0) + gen_plus_wasted
+
+	def to_dict(self) -> dict:
+		return {field: getattr(self, field) for field in self.__slots__ if getattr(self, field) is not None}
+
+
+class DamageMitigationRecord(Record):
+	"""Incoming hits of one enemy skill a player avoided, and the damage that avoided."""
+
+	__slots__ = (
+		"blocked", "blocked_dmg", "evaded", "evaded_dmg", "glanced", "glanced_dmg",
+		"missed", "missed_dmg", "invulned", "invulned_dmg", "interrupted", "interrupted_dmg",
+		"total_dmg", "skill_hits", "total_hits", "avg_dmg", "min_dmg", "avoided_damage", "min_avoided_damage",
+	)
+
+	def __init__(self) -> None:
+		for field in self.__slots__:
+			setattr(self, field, 0)
+
+
+class CommanderHealRecord(Record):
+	"""Healing and barrier one player gave a commander."""
+
+	__slots__ = ("outgoing_healing", "downed_healing", "outgoing_barrier")
+
+	def __init__(self) -> None:
+		self.outgoing_healing = 0
+		self.downed_healing = 0
+		self.outgoing_barrier = 0
+
+
+class ProtectionModRecord(Record):
+	"""Totals of the Protection damage modifier on a commander."""
+
+	__slots__ = ("hitCount", "totalHitCount", "damageGain", "totalDamage")
+
+	def __init__(self) -> None:
+		self.hitCount = 0
+		self.totalHitCount = 0
+		self.damageGain = 0
+		self.totalDamage = 0
+
+
+class CommanderSummaryRecord(Record):
+	"""Stats of one commander for the tag summary.
+
+	`heal_stats` maps healer name|profession|account to a CommanderHealRecord;
+	the stat categories hold the same stat (or skill id to stats) dicts as
+	top_stats.
+	"""
+
+	__slots__ = ("heal_stats", "support", "statsAll", "defenses", "totalDamageTaken", "prot_mods")
+
+	def __init__(self) -> None:
+		self.heal_stats = {}
+		self.support = {}
+		self.statsAll = {}
+		self.defenses = {}
+		self.totalDamageTaken = {}
+		self.prot_mods = ProtectionModRecord()
+
+	def category(self, stat_category: str) -> dict:
+		"""Return the stats of a category collected for the summary."""
+		return getattr(self, stat_category)
+
+	def heal_from(self, name_prof: str) -> CommanderHealRecord:
+		"""Return the heal record of a healer, creating it on first sight."""
+		record = self.heal_stats.get(name_prof)
+		if record is None:
+			record = self.heal_stats[name_prof] = CommanderHealRecord()
+		return record
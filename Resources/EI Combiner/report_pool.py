@@ -0,0 +1,155 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import output_functions
+
+
+POOL_TYPES = ("thread", "process")
+
+# Shared arguments of the worker process, set once by _init_worker
+_shared = {}
+
+
+class SharedArg:
+	"""Stands in for a large argument, e.g. top_stats, sent to each worker process once."""
+
+	__slots__ = ("name",)
+
+	def __init__(self, name: str) -> None:
+		self.name = name
+
+
+def _init_worker(shared: dict) -> None:
+	_shared.clear()
+	_shared.update(shared)
+
+
+def _resolve(value):
+	return _shared[value.name] if isinstance(value, SharedArg) else value
+
+
+def render_report(builder, args: tuple = (), kwargs: dict = None) -> list:
+	"""
+	Run a report builder and return the tiddlers it created.
+
+	The tiddlers are captured instead of being appended to tid_list, so
+	builders can run side by side and be merged afterwards.
+
+	Args:
+		builder (callable): A build_* function of output_functions.
+		args (tuple): Its positional arguments.
+		kwargs (dict): Its keyword arguments.
+
+	Returns:
+		list: The tiddlers in the order the builder created them.
+	"""
+	args = [_resolve(arg) for arg in args]
+	kwargs = {key: _resolve(value) for key, value in (kwargs or {}).items()}
+	with output_functions.capture_tids() as tiddlers:
+		builder(*args, **kwargs)
+	return tiddlers
+
+
+class ReportPlan:
+	"""
+	Ordered list of report builder calls, rendered serially or in a pool.
+
+	Each call renders into its own list of tiddlers and the lists are merged
+	in the order the calls were added, so the drag and drop json is the same
+	whichever way the plan is run. Builders only read their arguments.
+
+	Args:
+		shared (dict): Large arguments by name. Worker processes receive them
+			once when started instead of with every call that uses them.
+		profile (ReportProfile): Only add the builders it enables. Defaults to every builder.
+	"""
+
+	def __init__(self, shared: dict = None, profile=None) -> None:
+		self.shared = dict(shared or {})
+		self.profile = profile
+		self.tasks = []
+
+	def __len__(self) -> int:
+		return len(self.tasks)
+
+	def add(self, builder, *args, **kwargs) -> None:
+		"""Add a builder call to the plan, unless the profile skips the report."""
+		if self.profile is not None and not self.profile.enabled(builder):
+			return
+		self.tasks.append((builder, args, kwargs))
+
+	def _by_reference(self, args: tuple, kwargs: dict, tid_list) -> tuple:
+		"""Replace the shared arguments of a call with SharedArg references.
+
+		tid_list, which may be a writer holding an open file, is replaced by an
+		empty list; the workers capture their tiddlers instead.
+		"""
+		names = {id(value): name for name, value in self.shared.items()}
+
+		def reference(value):
+			if tid_list is not None and value is tid_list:
+				return []
+			name = names.get(id(value))
+			return value if name is None else SharedArg(name)
+
+		return tuple(map(reference, args)), {key: reference(value) for key, value in kwargs.items()}
+
+	def render(self, workers: int = 0, pool: str = "thread", tid_list=None) -> list:
+		"""
+		Render every builder call.
+
+		Args:
+			workers (int): Number of pool workers, 0 renders serially.
+			pool (str): "thread" or "process". Threads share the arguments but
+				hold the GIL while building; processes build in parallel.
+			tid_list: The tid_list passed to the builders, not sent to processes.
+
+		Returns:
+			list: The tiddlers of each call, in the order the calls were added.
+		"""
+		if pool not in POOL_TYPES:
+			raise ValueError(f"Unknown report pool {pool!r}, expected one of {POOL_TYPES}")
+		if workers <= 0 or len(self.tasks) < 2:
+			return [render_report(builder, args, kwargs) for builder, args, kwargs in self.tasks]
+
+		tasks = self.tasks
+		if pool == "process":
+			executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(self.shared,))
+			tasks = [(builder, *self._by_reference(args, kwargs, tid_list)) for builder, args, kwargs in tasks]
+		else:
+			executor = ThreadPoolExecutor(workers)
+		with executor:
+			futures = [executor.submit(render_report, builder, args, kwargs) for builder, args, kwargs in tasks]
+			return [future.result() for future in futures]
+
+	def run(self, tid_list: list, workers: int = 0, pool: str = "thread") -> None:
+		"""
+		Render the plan and append the tiddlers to tid_list in plan order.
+
+		Run serially, the builders append to tid_list themselves, one tiddler
+		at a time, so a streaming tid_list never holds a builder's output.
+		"""
+		if workers <= 0:
+			for builder, args, kwargs in self.tasks:
+				builder(*args, **kwargs)
+			return
+		for tiddlers in self.render(workers, pool, tid_list):
+			for tiddler in tiddlers:
+				output_functions.append_tid_for_output(tiddler, tid_list)
@@ -0,0 +1,181 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+# Section of top_stats_config.ini listing the profiles, as name = build_a, build_b, ...
+PROFILE_SECTION = "ReportProfiles"
+DEFAULT_PROFILE = "full"
+ALL_REPORTS = "*"
+
+# Profiles available without a [ReportProfiles] section, which overrides them by name
+BUILTIN_PROFILES = {
+	"full": ALL_REPORTS,
+	"quick": ", ".join((
+		"build_main_tid", "output_tag_summary", "build_menu_tid", "build_stylesheet_tids",
+		"build_general_stats_tid", "build_buffs_stats_tid", "build_boon_stats_tid", "build_other_boon_stats_tid",
+		"build_category_summary_report", "build_uptime_summary", "build_boon_report", "build_debuff_uptime_summary",
+		"build_boon_summary", "build_squad_composition", "build_healing_summary", "build_fight_summary",
+		"build_high_scores_tid", "build_damage_summary_table", "build_attendance_table",
+		"build_leaderboard_tids", "build_leaderboard_menu_tid", "build_high_scores_leaderboard_tids",
+	)),
+	"db_only": "",
+}
+
+# Writer of the json of every collected data, listed in a profile like a report and turned on by write_all_data_to_json
+ALL_DATA_JSON = "output_top_stats_json"
+
+# [TopStatsCfg] options turning on the outputs written besides the reports
+OUTPUT_OPTIONS = {
+	"write_all_data_to_json": (ALL_DATA_JSON,),
+	"write_excel": ("write_data_to_excel",),
+	"db_update": ("write_data_to_db", "write_high_scores_to_db"),
+}
+
+# parse_file() collectors whose data only feeds these reports and outputs, skipped when none of them is built
+COLLECTOR_REPORTS = {
+	"firebrand_pages": ("build_fb_pages_tid",),
+	"mechanics": ("build_mechanics_tid",),
+	"damage_mitigation": ("build_defense_damage_mitigation",),
+	"illusion_of_life": ("build_combat_resurrection_stats_tid",),
+	"minions": ("build_minions_tid",),
+	"clone_usage": ("build_mesmer_clone_usage",),
+	"death_on_tag": ("build_on_tag_review",),
+	"dps_stats": ("build_dps_stats_tids", "build_stacking_buffs", "build_damage_with_buffs"),
+}
+
+# Stat categories of the parse_file() stat loop and the reports and outputs they feed. Categories
+# not listed, e.g. statsAll or squadBuffs, feed most reports and the database and are always collected.
+STAT_CATEGORY_REPORTS = {
+	"targetDamageDist": (
+		"build_fight_summary", "build_high_scores_tid", "build_top_damage_by_skill", "build_damage_outgoing_by_player_skill_tids",
+		"build_gear_skill_summary", "build_pull_stats_tid", "write_high_scores_to_db",
+	),
+	"totalDamageTaken": (
+		"build_high_scores_tid", "build_top_damage_by_skill", "build_pull_stats_tid", "build_commander_summary",
+		"write_high_scores_to_db",
+	),
+	"buffUptimes": (
+		"build_uptime_summary", "build_boon_summary", "build_personal_buff_summary", "build_gear_buff_summary",
+		"build_damage_with_buffs",
+	),
+	"buffUptimesActive": ("build_damage_with_buffs",),
+	"rotation": ("build_skill_cast_summary", "build_skill_usage_stats_tid"),
+	"targetBuffs": ("build_debuff_uptime_summary", "build_condition_generation_bar_chart", "build_utility_bubble_chart"),
+	"damageModifiers": (
+		"build_personal_damage_modifier_summary", "build_shared_damage_modifier_summary", "build_commander_summary",
+	),
+}
+
+
+class ReportProfile:
+	"""A named selection of the build_* reports of a run.
+
+	ReportPlan skips the builders a profile does not enable, and parse_file()
+	skips the collectors of COLLECTOR_REPORTS and the stat categories of
+	STAT_CATEGORY_REPORTS that only feed skipped reports and outputs. The json
+	of every collected data is written only by profiles listing ALL_DATA_JSON,
+	and then every collector runs.
+
+	Args:
+		name (str): The profile name.
+		reports: Iterable of enabled builder names, or None to enable every report.
+		outputs: Iterable of the output writers of the run, e.g. write_data_to_db.
+	"""
+
+	__slots__ = ("name", "reports", "outputs")
+
+	def __init__(self, name: str, reports=None, outputs=()) -> None:
+		self.name = name
+		self.reports = None if reports is None else frozenset(reports)
+		self.outputs = frozenset(outputs)
+
+	@classmethod
+	def parse(cls, name: str, value: str, outputs=()) -> "ReportProfile":
+		"""Build a profile from its config value, a comma separated list of builder names or "*"."""
+		names = [report.strip() for report in value.split(",") if report.strip()]
+		if ALL_REPORTS in names:
+			return cls(name, outputs=outputs)
+		return cls(name, names, outputs)
+
+	@classmethod
+	def from_config(cls, config_ini, name: str = None) -> "ReportProfile":
+		"""
+		Return the profile selected by report_profile in [TopStatsCfg], with the outputs turned on there.
+
+		Args:
+			config_ini (configparser.ConfigParser): The loaded top_stats_config.ini.
+			name (str, optional): Profile to use instead of report_profile.
+
+		Raises:
+			ValueError: If the profile is not defined.
+		"""
+		name = name or config_ini.get('TopStatsCfg', 'report_profile', fallback=DEFAULT_PROFILE)
+		if config_ini.has_option(PROFILE_SECTION, name):
+			profile = cls.parse(name, config_ini.get(PROFILE_SECTION, name))
+		elif name in BUILTIN_PROFILES:
+			profile = cls.parse(name, BUILTIN_PROFILES[name])
+		else:
+			raise ValueError(f"Report profile '{name}' is not defined in [{PROFILE_SECTION}]")
+
+		outputs = set()
+		for option, writers in OUTPUT_OPTIONS.items():
+			if config_ini.getboolean('TopStatsCfg', option, fallback=False):
+				outputs.update(writers)
+		# write_all_data_to_json only turns the json on for the profiles listing it
+		if not profile.enabled(ALL_DATA_JSON):
+			outputs.discard(ALL_DATA_JSON)
+		profile.outputs = frozenset(outputs)
+		return profile
+
+	@property
+	def builds_all(self) -> bool:
+		return self.reports is None
+
+	def enabled(self, builder) -> bool:
+		"""Return True if a report is built, given its builder or builder name."""
+		if self.reports is None:
+			return True
+		return getattr(builder, "__name__", builder) in self.reports
+
+	def writes(self, writer) -> bool:
+		"""Return True if an output is written, given its writer or writer name, e.g. output_top_stats_json."""
+		return getattr(writer, "__name__", writer) in self.outputs
+
+	def collects(self, collector: str) -> bool:
+		"""Return True if a collector of COLLECTOR_REPORTS runs."""
+		return self._feeds(COLLECTOR_REPORTS[collector])
+
+	def collects_category(self, stat_category: str) -> bool:
+		"""Return True if the stat loop collects a category, always for those not in STAT_CATEGORY_REPORTS."""
+		consumers = STAT_CATEGORY_REPORTS.get(stat_category)
+		return consumers is None or self._feeds(consumers)
+
+	def _feeds(self, consumers) -> bool:
+		"""Return True if one of the reports or outputs is built, or the json of every collected data is written."""
+		if ALL_DATA_JSON in self.outputs:
+			return True
+		return any(consumer in self.outputs or self.enabled(consumer) for consumer in consumers)
+
+	def unknown(self, available) -> list:
+		"""Return the enabled report names not found in available, e.g. to warn about typos."""
+		if self.reports is None:
+			return []
+		return sorted(report for report in self.reports if report not in available)
+
+
+# Profile of runs that do not select one
+FULL_PROFILE = ReportProfile(DEFAULT_PROFILE)
@@ -0,0 +1,146 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+import copy
+import threading
+from contextlib import contextmanager
+
+import config
+import output_functions
+import parser_functions
+from fact_store import FactStore
+from player_registry import PlayerRegistry
+from records import to_plain
+from report_profile import FULL_PROFILE, ReportProfile
+from top_k import HighScoreTracker
+
+
+# Collectors and builders read their state from module globals, so only one
+# session can have its state bound at a time: runs in one process never overlap
+_active_lock = threading.RLock()
+
+
+def new_run_state() -> dict:
+	"""Return fresh copies of every accumulator parse_file() writes to, keyed by its parser_functions global."""
+	return {
+		"top_stats": copy.deepcopy(config.top_stats),
+		"team_code_missing": [],
+		"mesmer_clone_usage": {},
+		"enemy_avg_damage_per_skill": {},
+		"player_damage_mitigation": {},
+		"player_minion_damage_mitigation": {},
+		"buff_data": {},
+		"buff_stacking": {},
+		"skill_data": {},
+		"damage_mod_data": {},
+		"high_scores": HighScoreTracker(),
+		"fact_store": FactStore(),
+		"player_registry": PlayerRegistry(),
+		"fb_pages": {},
+		"mechanics": {},
+		"minions": {},
+		"personal_damage_mod_data": {"total": []},
+		"personal_buff_data": {"total": []},
+		"players_running_healing_addon": [],
+		"death_on_tag": {},
+		"commander_tag_positions": {},
+		"commander_summary_data": {},
+		"DPSStats": {},
+		"stacking_uptime_Table": {},
+		"IOL_revive": {},
+		"debuff_damage": {},
+		"fight_data": {},
+		"killing_blow_rallies": {"total": 0, 'kb_players': {}},
+	}
+
+
+class CombinerSession:
+	"""The state of one summary run.
+
+	A session owns its own top_stats, high scores, per player accumulators
+	and tid_list, so a long lived process can build summaries for several
+	guilds or nights one after another without reloading modules or leaking
+	data between runs. The accumulators are available as attributes, e.g.
+	``session.top_stats``.
+
+	The parser and output functions keep reading module globals; `active()`
+	binds the session's state to them for the duration of a block and
+	restores the previous state afterwards. Sessions therefore run one at a
+	time: a session started from another thread waits for the active one to
+	finish. Summaries built concurrently need separate processes.
+	"""
+
+	def __init__(self) -> None:
+		self.state = new_run_state()
+		self.tid_list = []
+
+	def __getattr__(self, name: str):
+		try:
+			return self.__dict__['state'][name]
+		except KeyError:
+			raise AttributeError(name) from None
+
+	@contextmanager
+	def active(self):
+		"""Bind this session's state to the parser and output module globals."""
+		with _active_lock:
+			saved = {name: getattr(parser_functions, name) for name in self.state}
+			saved_tid_list = output_functions.tid_list
+			for name, value in self.state.items():
+				setattr(parser_functions, name, value)
+			output_functions.tid_list = self.tid_list
+			try:
+				yield self
+			finally:
+				for name, value in saved.items():
+					setattr(parser_functions, name, value)
+				output_functions.tid_list = saved_tid_list
+
+	def stream_tids(self, writer):
+		"""Send the tids created from now on to a writer, e.g. a TiddlerJsonWriter, in place of tid_list.
+
+		Call while the session is active. Returns the writer.
+		"""
+		self.tid_list = output_functions.tid_list = writer
+		return writer
+
+	def parse_file(self, file_path: str, fight_num: int, guild_data, fight_data_charts: bool, blacklist: list, profile: ReportProfile = FULL_PROFILE) -> None:
+		"""Parse one log into this session; see parser_functions.parse_file."""
+		with self.active():
+			parser_functions.parse_file(file_path, fight_num, guild_data, fight_data_charts, blacklist, profile)
+
+	def finish_parsing(self) -> None:
+		"""Swap the registry ids and slotted records of the collectors for the output string keys and plain dicts.
+
+		The accumulators are updated in place, so they stay bound while the session is active.
+		"""
+		state = self.state
+		registry = state["player_registry"]
+
+		def replace(name, plain):
+			state[name].clear()
+			state[name].update(plain)
+
+		replace("DPSStats", to_plain(registry.materialize(state["DPSStats"], registry.dps_key)))
+		replace("stacking_uptime_Table", to_plain(registry.materialize(state["stacking_uptime_Table"], registry.name_prof)))
+		replace("death_on_tag", to_plain(registry.materialize(state["death_on_tag"], registry.name_prof)))
+		for name in ("fb_pages", "IOL_revive", "player_damage_mitigation", "commander_summary_data"):
+			replace(name, to_plain(state[name]))
+		replace("mesmer_clone_usage", registry.materialize(state["mesmer_clone_usage"], registry.clone_key))
+		for fight in state["fight_data"].values():
+			fight["players"] = registry.materialize(fight["players"], registry.chart_key)
@@ -0,0 +1,211 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+import heapq
+from collections.abc import Mapping
+
+
+DEFAULT_HIGH_SCORE_LIMIT = 5
+# Config section setting the entries kept per high score category
+HIGH_SCORE_SECTION = "HighScoreLimits"
+
+
+def select_top(items, limit: int = None, key=None) -> list:
+	"""Return the `limit` largest items, largest first.
+
+	Same result as ``sorted(items, key=key, reverse=True)[:limit]``, equal
+	keys keeping their input order, but only a heap of `limit` items is kept
+	while scanning, so selecting a few entries of a large table costs
+	O(n log limit) instead of a full sort.
+
+	Args:
+		items (iterable): The items to select from, e.g. ``dict.items()``.
+		limit (int): Number of items to return. None returns every item sorted.
+		key (callable): Gives the value to rank an item by. Defaults to the item.
+
+	Returns:
+		list: The selected items, in descending order of their key.
+	"""
+	if limit is None:
+		return sorted(items, key=key, reverse=True)
+	if limit <= 0:
+		return []
+	# nlargest breaks ties on the input position, so it is stable like sorted()
+	return heapq.nlargest(limit, items, key=key)
+
+
+class TopK:
+	"""Keep the K largest values seen for distinct keys.
+
+	Each key holds the highest value offered for it. Entries live in a
+	min-heap ordered by (value, insertion sequence) so the lowest entry is
+	found in O(1) and replaced in O(log K). Entries superseded by a higher
+	value for the same key, or evicted, are left in the heap and skipped
+	when they surface (lazy deletion).
+
+	Ties on the lowest value evict the entry inserted first, and `values`
+	keeps insertion order, so the result matches the previous dict based
+	implementation exactly.
+	"""
+
+	__slots__ = ("limit", "values", "_seq", "_heap", "_counter")
+
+	def __init__(self, limit: int = DEFAULT_HIGH_SCORE_LIMIT) -> None:
+		self.limit = limit
+		self.values = {}
+		self._seq = {}
+		self._heap = []
+		self._counter = 0
+
+	def __len__(self) -> int:
+		return len(self.values)
+
+	def _lowest(self) -> tuple:
+		"""Return the live (value, seq, key) entry with the lowest value."""
+		heap = self._heap
+		seqs = self._seq
+		while True:
+			value, seq, key = heap[0]
+			if seqs.get(key) == seq and self.values[key] == value:
+				return heap[0]
+			heapq.heappop(heap)
+
+	def _push(self, key: str, value: float, seq: int) -> None:
+		heapq.heappush(self._heap, (value, seq, key))
+		# Drop stale entries once they outnumber the live ones
+		if len(self._heap) > 2 * self.limit + 8:
+			self._heap = [(self.values[k], s, k) for k, s in self._seq.items()]
+			heapq.heapify(self._heap)
+
+	def offer(self, key: str, value: float) -> bool:
+		"""Offer a value for a key.
+
+		Args:
+			key (str): The key to store the value under.
+			value (float): The value to store.
+
+		Returns:
+			bool: True if the value was kept.
+		"""
+		values = self.values
+		if key in values:
+			if value > values[key]:
+				values[key] = value
+				self._push(key, value, self._seq[key])
+				return True
+			return False
+
+		if len(values) >= self.limit:
+			if self.limit <= 0:
+				return False
+			lowest_value, _, lowest_key = self._lowest()
+			if not value > lowest_value:
+				return False
+			heapq.heappop(self._heap)
+			del values[lowest_key]
+			del self._seq[lowest_key]
+
+		self._counter += 1
+		values[key] = value
+		self._seq[key] = self._counter
+		self._push(key, value, self._counter)
+		return True
+
+	def merge(self, other: "TopK") -> None:
+		"""Offer every entry of another tracker to this one."""
+		for key, value in other.values.items():
+			self.offer(key, value)
+
+
+class HighScoreTracker(Mapping):
+	"""High score categories, each a bounded TopK of player-fight keys.
+
+	Reads behave like the plain ``{category: {key: value}}`` dict the
+	builders and database writers expect. Category limits are matched
+	case insensitively, as configparser lowercases the keys of the
+	[HighScoreLimits] section.
+
+	Args:
+		default_limit (int): Entries kept per category unless overridden.
+		limits (dict): Optional per category entry limits.
+	"""
+
+	def __init__(self, default_limit: int = DEFAULT_HIGH_SCORE_LIMIT, limits: dict = None) -> None:
+		self.default_limit = default_limit
+		self.limits = {category.lower(): limit for category, limit in (limits or {}).items()}
+		self._categories = {}
+
+	def __getitem__(self, category: str) -> dict:
+		return self._categories[category].values
+
+	def __iter__(self):
+		return iter(self._categories)
+
+	def __len__(self) -> int:
+		return len(self._categories)
+
+	def limit(self, category: str) -> int:
+		"""Return the number of entries kept for a category."""
+		return self.limits.get(category.lower(), self.default_limit)
+
+	def set_limit(self, category: str, limit: int) -> None:
+		"""Set the number of entries kept for a category."""
+		self.limits[category.lower()] = limit
+		for name, tracker in self._categories.items():
+			if name.lower() == category.lower():
+				retained = TopK(limit)
+				retained.merge(tracker)
+				self._categories[name] = retained
+
+	def load_limits(self, config_ini) -> None:
+		"""
+		Read the entry limits from the [HighScoreLimits] section of a config.
+
+		``default`` sets the limit of every category not listed, other keys
+		set the limit of one category, e.g. ``fight_dps = 10``.
+
+		Args:
+			config_ini (configparser.ConfigParser): The parsed config file.
+		"""
+		if not config_ini.has_section(HIGH_SCORE_SECTION):
+			return
+		for category, limit in config_ini.items(HIGH_SCORE_SECTION):
+			if category == "default":
+				self.default_limit = int(limit)
+			else:
+				self.set_limit(category, int(limit))
+
+	def offer(self, category: str, key: str, value: float) -> bool:
+		"""Offer a value for a key in a category, creating the category if needed."""
+		tracker = self._categories.get(category)
+		if tracker is None:
+			tracker = TopK(self.limit(category))
+			self._categories[category] = tracker
+		return tracker.offer(key, value)
+
+	def merge(self, other: "HighScoreTracker") -> None:
+		"""Combine the high scores of another tracker, e.g. one per parsed fight."""
+		for category, tracker in other._categories.items():
+			for key, value in tracker.values.items():
+				self.offer(category, key, value)
+
+	def clear(self) -> None:
+		self._categories.clear()
+
+	def to_dict(self) -> dict:
+		"""Return a plain ``{category: {key: value}}`` copy."""
+		return {category: dict(tracker.values) for category, tracker in self._categories.items()}
@@ -20,27 +20,38 @@ import configparser
 import sys
 import os
 import datetime
+import multiprocessing
 
 from collections import OrderedDict
 
 import config_output
 from parser_functions import *
 from output_functions import *
+from report_pool import ReportPlan
+from report_profile import ReportProfile
+from tw_html import write_html
+from session import CombinerSession
 
 
-if __name__ == '__main__':
-	parser = argparse.ArgumentParser(
-		description='This reads a set of arcdps reports in xml format and generates top stats.'
-	)
-	parser.add_argument('-i', '--input', dest='input_directory', help='Directory containing .json files from Elite Insights')
-	parser.add_argument('-o', '--output', dest="output_filename", help="Override json file name to write the computed summary")
-	parser.add_argument('-x', '--xls_output', dest="xls_output_filename", help="Override .xls file to write the computed summary")
-	parser.add_argument('-j', '--json_output', dest="json_output_filename", help="Override .json file to write the computed stats data")
-	parser.add_argument('-c', '--config_file', dest="config_file", help="Select a specific config file. Defaults to top_stats_config.ini")
-	parser.add_argument('-d', '--description_append', dest="description_append", help="Appended to the description of the summary caption.")
+def run_top_stats(args, session: CombinerSession = None) -> CombinerSession:
+	"""
+	Parse the logs in the input directory and write the summary outputs.
 
-	args = parser.parse_args()
+	Args:
+		args (argparse.Namespace): The command line arguments.
+		session (CombinerSession, optional): The session to collect the run into. Defaults to a new session.
+
+	Returns:
+		CombinerSession: The session holding the run's data.
+	"""
+	session = session or CombinerSession()
+	with session.active():
+		write_top_stats(args, session)
+	return session
 
+
+def write_top_stats(args, session: CombinerSession) -> None:
+	"""Body of run_top_stats(), run with the session active."""
 	parse_date = datetime.datetime.now()
 	tid_date_time = parse_date.strftime("%Y%m%d%H%M")
 
@@ -92,6 +103,9 @@ if __name__ == '__main__':
 
 	print("Blacklisted accounts:", blacklist)
 
+	# Entries kept per high score category
+	session.high_scores.load_limits(config_ini)
+
 	# Output filenames
 	if not args.xls_output_filename:
 		args.xls_output_filename = os.path.join(input_directory, f"TW5_top_stats_{tid_date_time}.xls")
@@ -111,11 +125,12 @@ if __name__ == '__main__':
 	defenses_detailed = config_ini.getboolean('TopStatsCfg', 'Defenses_Detailed', fallback=False)
 	support_detailed = config_ini.getboolean('TopStatsCfg', 'Support_Detailed', fallback=False)
 	sort_mode = config_ini.get('TopStatsCfg', 'Sort_Mode', fallback='Total')
-	write_all_data_to_json = config_ini.getboolean('TopStatsCfg', 'write_all_data_to_json', fallback=False)
 	fight_data_charts = config_ini.getboolean('TopStatsCfg', 'fight_data_charts', fallback=False)
+	fight_chart_points = config_ini.getint('TopStatsCfg', 'fight_chart_points', fallback=500)
 	db_update = config_ini.getboolean('TopStatsCfg', 'db_update', fallback=False)
 	db_output_filename = config_ini.get('TopStatsCfg', 'db_output_filename', fallback='Top_Stats.db')
 	db_path = config_ini.get('TopStatsCfg', 'db_path', fallback='.')
+	glicko_full_rebuild = args.glicko_full_rebuild or config_ini.getboolean('TopStatsCfg', 'glicko_full_rebuild', fallback=False)
 
 	write_excel = config_ini.getboolean('TopStatsCfg', 'write_excel', fallback=False)
 	excel_output_filename = config_ini.get('TopStatsCfg', 'excel_output_filename', fallback='Top_Stats.xlsx')
@@ -123,6 +138,18 @@ if __name__ == '__main__':
 
 	skill_casts_by_role_limit = config_ini.getint('TopStatsCfg', 'skill_casts_by_role_limit', fallback=40)
 	enable_hide_columns = config_ini.getboolean('TopStatsCfg', 'hide_columns', fallback=False)
+	report_workers = config_ini.getint('TopStatsCfg', 'report_workers', fallback=0)
+	report_pool = config_ini.get('TopStatsCfg', 'report_pool', fallback='thread')
+	compact_json = config_ini.getboolean('TopStatsCfg', 'compact_json', fallback=False)
+	player_shards = config_ini.getboolean('TopStatsCfg', 'player_shards', fallback=False)
+	report_profile = ReportProfile.from_config(config_ini, args.report_profile)
+	# Written when write_all_data_to_json is on and the profile lists it, it then needs every collector
+	write_all_data_to_json = report_profile.writes(output_top_stats_json)
+	unknown_reports = report_profile.unknown(globals())
+	if unknown_reports:
+		print(f"Report profile '{report_profile.name}' lists unknown reports: {', '.join(unknown_reports)}")
+	html_shell = args.html_shell or config_ini.get('TopStatsCfg', 'html_shell', fallback='')
+	html_output = args.html_output or config_ini.get('TopStatsCfg', 'html_output', fallback='')
 
 	webhook_url = config_ini.get('DiscordCfg', 'webhook_url', fallback=False)
 
@@ -161,242 +188,251 @@ if __name__ == '__main__':
 
 		fight_num += 1
 		
-		parse_file(file_path, fight_num, guild_data, fight_data_charts, blacklist)
+		parse_file(file_path, fight_num, guild_data, fight_data_charts, blacklist, report_profile)
 
 	print("Parsing Complete")
 
-	tag_data, tag_list = build_tag_summary(top_stats)
-	tid_date_time = top_stats['overall']['last_fight']
+	# Collectors key players by registry id and hold slotted records, swap in the output string keys and plain dicts
+	session.finish_parsing()
+
+	top_stats = session.top_stats
+	buff_data = session.buff_data
+	skill_data = session.skill_data
+	damage_mod_data = session.damage_mod_data
+	high_scores = session.high_scores
+	personal_damage_mod_data = session.personal_damage_mod_data
+	personal_buff_data = session.personal_buff_data
+	fb_pages = session.fb_pages
+	mechanics = session.mechanics
+	minions = session.minions
+	mesmer_clone_usage = session.mesmer_clone_usage
+	death_on_tag = session.death_on_tag
+	DPSStats = session.DPSStats
+	commander_summary_data = session.commander_summary_data
+	enemy_avg_damage_per_skill = session.enemy_avg_damage_per_skill
+	player_damage_mitigation = session.player_damage_mitigation
+	player_minion_damage_mitigation = session.player_minion_damage_mitigation
+	stacking_uptime_Table = session.stacking_uptime_Table
+	IOL_revive = session.IOL_revive
+	killing_blow_rallies = session.killing_blow_rallies
+	fight_data = session.fight_data
+	team_code_missing = session.team_code_missing
+	# Tids are written to the drag and drop json as the builders create them, a failed run removes the partial file
+	with TiddlerJsonWriter(args.output_filename, compact=compact_json) as tid_list:
+		session.stream_tids(tid_list)
+
+		tag_data, tag_list = build_tag_summary(top_stats)
+		tid_date_time = top_stats['overall']['last_fight']
+
+		# Boon generation, wasted and uptime of every player, computed on first use and shared by the boon reports and charts
+		boon_metrics = BoonMetrics(buff_data)
+		# Player rows and buff cells shared by the uptime and debuff summaries
+		buff_matrix = BuffMatrix(top_stats['player'])
+
+		# The report builders only read the parsed data; collect them in output order and render them together
+		plan = ReportPlan(shared={
+			"top_stats": top_stats, "skill_data": skill_data, "buff_data": buff_data, "DPSStats": DPSStats,
+			"stacking_uptime_Table": stacking_uptime_Table, "fight_data": fight_data, "boon_metrics": boon_metrics,
+			"buff_matrix": buff_matrix,
+		}, profile=report_profile)
 	
-	#create the main tiddler and append to tid_list
-	build_main_tid(tid_date_time, tag_list, guild_name, args.description_append)
+		#create the main tiddler and append to tid_list
+		plan.add(build_main_tid, tid_date_time, tag_list, guild_name, args.description_append)
 
-	output_tag_summary(tag_data, tid_date_time)
+		plan.add(output_tag_summary, tag_data, tid_date_time)
 
-	#create the menu tiddler and append to tid_list
-	build_menu_tid(tid_date_time, db_update)
+		#create the menu tiddler and append to tid_list
+		plan.add(build_menu_tid, tid_date_time, db_update, profile=report_profile)
 
-	build_dashboard_menu_tid(tid_date_time)
+		plan.add(build_dashboard_menu_tid, tid_date_time, profile=report_profile)
+
+		plan.add(build_stylesheet_tids, tid_list)
 	
-	build_general_stats_tid(tid_date_time, offensive_detailed, defenses_detailed, support_detailed)
+		plan.add(build_general_stats_tid, tid_date_time, offensive_detailed, defenses_detailed, support_detailed, profile=report_profile)
 
-	build_buffs_stats_tid(tid_date_time, boons_detailed)
+		plan.add(build_buffs_stats_tid, tid_date_time, boons_detailed, profile=report_profile)
 
-	build_boon_stats_tid(tid_date_time)
-	for boon_other in ["Defensive", "Offensive", "Support"]:
-		build_other_boon_stats_tid(tid_date_time, boon_other)
+		plan.add(build_boon_stats_tid, tid_date_time)
+		for boon_other in ["Defensive", "Offensive", "Support"]:
+			plan.add(build_other_boon_stats_tid, tid_date_time, boon_other)
 
-	build_damage_modifiers_menu_tid(tid_date_time)
+		plan.add(build_damage_modifiers_menu_tid, tid_date_time)
 
-	build_healer_menu_tabs(top_stats, "Healers", tid_date_time)
-	build_healer_outgoing_tids(top_stats, skill_data, buff_data, "Healers", tid_date_time)
+		plan.add(build_healer_menu_tabs, top_stats, "Healers", tid_date_time, shards=player_shards)
+		plan.add(build_healer_outgoing_tids, top_stats, skill_data, buff_data, "Healers", tid_date_time, shards=player_shards)
 
-	build_profession_damage_modifier_stats_tid(personal_damage_mod_data, "Damage Modifiers", tid_date_time)
+		plan.add(build_profession_damage_modifier_stats_tid, personal_damage_mod_data, "Damage Modifiers", tid_date_time)
 
-	build_shared_damage_modifier_summary(top_stats, damage_mod_data, "Shared Damage Mods", tid_date_time)
+		plan.add(build_shared_damage_modifier_summary, top_stats, damage_mod_data, "Shared Damage Mods", tid_date_time)
 		
-	defense_stats = config_output.defenses_table
-	build_category_summary_report(top_stats, defense_stats, enable_hide_columns, "Defenses", tid_date_time, tid_list, layout="summary", sort_mode=sort_mode)
-	if defenses_detailed:
-		build_category_summary_report(top_stats, defense_stats, enable_hide_columns, "Defenses", tid_date_time, tid_list, layout="detailed", sort_mode=sort_mode)
-
-	support_stats = config_output.support_table
-	build_category_summary_report(top_stats, support_stats, enable_hide_columns, "Support", tid_date_time, tid_list, layout="summary", sort_mode=sort_mode)
-	if support_detailed:
-		build_category_summary_report(top_stats, support_stats, enable_hide_columns, "Support", tid_date_time, tid_list, layout="detailed", sort_mode=sort_mode)
-
-	offensive_stats = config_output.offensive_table
-	build_category_summary_report(top_stats, offensive_stats, enable_hide_columns, "Offensive", tid_date_time, tid_list, layout="summary", sort_mode=sort_mode)
-	if offensive_detailed:
-		build_category_summary_report(top_stats, offensive_stats, enable_hide_columns, "Offensive", tid_date_time, tid_list, layout="detailed", sort_mode=sort_mode)
-
-	boons = config_output.boons
-	build_uptime_summary(top_stats, boons, buff_data, "Uptimes", tid_date_time)
-	if boons_detailed:
-		build_boon_report(top_stats, boons, buff_data, tid_date_time, tid_list)
-
-	boon_categories = {"selfBuffs", "groupBuffs", "squadBuffs"}
-	for boon_category in boon_categories:
-		#build_boon_summary(top_stats, boons, boon_category, buff_data, tid_date_time)
-		build_boon_report(top_stats, boons, buff_data, tid_date_time, tid_list, layout="summary", category=boon_category)
-
-	#get incoming condition uptimes on Squad Players
-	conditions = config_output.buffs_conditions
-	condition_list = {}
-	for condition in conditions:
-		if condition in top_stats["overall"]["buffUptimes"]:
-			if top_stats["overall"]["buffUptimes"][condition]["uptime_ms"] > 0:
-				condition_list[condition] = conditions[condition]
-	build_uptime_summary(top_stats, condition_list, buff_data, "Conditions-In", tid_date_time)
-
-	#get outgoing debuff uptimes on Enemy Players
-	debuffs = config_output.buffs_debuff
-	debuff_list = {}
-	for debuff in debuffs:
-		if debuff in top_stats["overall"]["targetBuffs"]:
-			if top_stats["overall"]["targetBuffs"][debuff]["uptime_ms"] > 0:
-				debuff_list[debuff] = debuffs[debuff]
-	build_debuff_uptime_summary(top_stats, debuff_list, buff_data, "Debuffs-Out", tid_date_time)
-
-	#get outgoing condition uptimes on Enemy Players
-	conditions = config_output.buffs_conditions
-	condition_list = {}
-	for condition in conditions:
-		if condition in top_stats["overall"]["targetBuffs"]:
-			if top_stats["overall"]["targetBuffs"][condition]["uptime_ms"] > 0:
-				condition_list[condition] = conditions[condition]
-	build_debuff_uptime_summary(top_stats, condition_list, buff_data, "Conditions-Out", tid_date_time)
-
-	#get support buffs found and output table
-	support_buffs = config_output.buffs_support
-	support_buff_list = {}
-	for buff in support_buffs:
-		if buff in top_stats["overall"]["buffUptimes"]:
-			if top_stats["overall"]["buffUptimes"][buff]["uptime_ms"] > 0:
-				support_buff_list[buff] = support_buffs[buff]
-	build_uptime_summary(top_stats, support_buff_list, buff_data, "Support Uptimes", tid_date_time)
-	boon_categories = {"selfBuffs", "groupBuffs", "squadBuffs"}
-	for boon_category in boon_categories:
-		build_boon_summary(top_stats, support_buff_list, boon_category, buff_data, tid_date_time, boon_type="Support")
-
-
-	#get defensive buffs found and output table
-	defensive_buffs = config_output.buffs_defensive
-	defensive_buff_list = {}
-	for buff in defensive_buffs:
-		if buff in top_stats["overall"]["buffUptimes"]:
-			if top_stats["overall"]["buffUptimes"][buff]["uptime_ms"] > 0:
-				defensive_buff_list[buff] = defensive_buffs[buff]
-	build_uptime_summary(top_stats, defensive_buff_list, buff_data, "Defensive Uptimes", tid_date_time)
-	boon_categories = {"selfBuffs", "groupBuffs", "squadBuffs"}
-	for boon_category in boon_categories:
-		build_boon_summary(top_stats, defensive_buff_list, boon_category, buff_data, tid_date_time, boon_type="Defensive")
-
-	#get offensive buffs found and output table
-	offensive_buffs = config_output.buffs_offensive
-	offensive_buff_list = {}
-	for buff in offensive_buffs:
-		if buff in top_stats["overall"]["buffUptimes"]:
-			if top_stats["overall"]["buffUptimes"][buff]["uptime_ms"] > 0:
-				offensive_buff_list[buff] = offensive_buffs[buff]
-	build_uptime_summary(top_stats, offensive_buff_list, buff_data, "Offensive Uptimes", tid_date_time)
-	boon_categories = {"selfBuffs", "groupBuffs", "squadBuffs"}
-	for boon_category in boon_categories:
-		build_boon_summary(top_stats, offensive_buff_list, boon_category, buff_data, tid_date_time, boon_type="Offensive")
-
-
-	#get offensive debuffs found and output table
-	debuffs_buffs = config_output.buffs_debuff
-	debuff_list = {}
-	for buff in debuffs_buffs:
-		if buff in top_stats["overall"]["buffUptimes"]:
-			if top_stats["overall"]["buffUptimes"][buff]["uptime_ms"] > 0:
-				debuff_list[buff] = debuffs_buffs[buff]
-	build_uptime_summary(top_stats, debuff_list, buff_data, "Debuffs-In", tid_date_time)
-
-	#get squad comp and output table
-	build_squad_composition(top_stats, tid_date_time, tid_list)
-
-
-	#get heal stats found and output table
-	build_healing_summary(top_stats, "Heal Stats", tid_date_time)
-
-	#get personal buffs found and output table
-	build_personal_buff_summary(top_stats, buff_data, personal_buff_data, "Personal Buffs", tid_date_time)
-
-	#get profession damage modifiers found and output table
-	build_personal_damage_modifier_summary(top_stats, personal_damage_mod_data, damage_mod_data, "Damage Modifiers", tid_date_time)
-
-	#get skill casts by profession and role and output table
-	build_skill_cast_summary(top_stats["skill_casts_by_role"], skill_data, "Skill Usage", skill_casts_by_role_limit, tid_date_time)
-
-	build_skill_usage_stats_tid(top_stats["skill_casts_by_role"], "Skill Usage", tid_date_time)
-
-	#get overview stats found and output table
-	#overview_stats = config_output.overview_stats
-	build_fight_summary(top_stats, fight_data_charts, "Overview", tid_date_time)
-
-	#get combat resurrection stats found and output table
-	build_combat_resurrection_stats_tid(top_stats, skill_data, buff_data, IOL_revive, killing_blow_rallies, "Combat Resurrect", tid_date_time)
-
-	#get FB Pages and output table
-	build_fb_pages_tid(fb_pages, "FB Pages", tid_date_time)
+		defense_stats = config_output.defenses_table
+		plan.add(build_category_summary_report, top_stats, defense_stats, enable_hide_columns, "Defenses", tid_date_time, tid_list, layout="summary", sort_mode=sort_mode)
+		if defenses_detailed:
+			plan.add(build_category_summary_report, top_stats, defense_stats, enable_hide_columns, "Defenses", tid_date_time, tid_list, layout="detailed", sort_mode=sort_mode)
+
+		support_stats = config_output.support_table
+		plan.add(build_category_summary_report, top_stats, support_stats, enable_hide_columns, "Support", tid_date_time, tid_list, layout="summary", sort_mode=sort_mode)
+		if support_detailed:
+			plan.add(build_category_summary_report, top_stats, support_stats, enable_hide_columns, "Support", tid_date_time, tid_list, layout="detailed", sort_mode=sort_mode)
+
+		offensive_stats = config_output.offensive_table
+		plan.add(build_category_summary_report, top_stats, offensive_stats, enable_hide_columns, "Offensive", tid_date_time, tid_list, layout="summary", sort_mode=sort_mode)
+		if offensive_detailed:
+			plan.add(build_category_summary_report, top_stats, offensive_stats, enable_hide_columns, "Offensive", tid_date_time, tid_list, layout="detailed", sort_mode=sort_mode)
+
+		boons = config_output.boons
+		plan.add(build_uptime_summary, top_stats, boons, buff_data, "Uptimes", tid_date_time, buff_matrix=buff_matrix)
+		if boons_detailed:
+			plan.add(build_boon_report, top_stats, boons, buff_data, tid_date_time, tid_list, boon_metrics=boon_metrics)
+
+		boon_categories = {"selfBuffs", "groupBuffs", "squadBuffs"}
+		for boon_category in boon_categories:
+			#build_boon_summary(top_stats, boons, boon_category, buff_data, tid_date_time)
+			plan.add(build_boon_report, top_stats, boons, buff_data, tid_date_time, tid_list, layout="summary", category=boon_category, boon_metrics=boon_metrics)
+
+		#classify the observed buffs into their report groups in one pass
+		report_buffs = classify_buffs(top_stats["overall"], {
+			"Conditions-In": ("buffUptimes", config_output.buffs_conditions),
+			"Debuffs-Out": ("targetBuffs", config_output.buffs_debuff),
+			"Conditions-Out": ("targetBuffs", config_output.buffs_conditions),
+			"Support": ("buffUptimes", config_output.buffs_support),
+			"Defensive": ("buffUptimes", config_output.buffs_defensive),
+			"Offensive": ("buffUptimes", config_output.buffs_offensive),
+			"Debuffs-In": ("buffUptimes", config_output.buffs_debuff),
+		})
+
+		#get incoming condition uptimes on Squad Players
+		plan.add(build_uptime_summary, top_stats, report_buffs["Conditions-In"], buff_data, "Conditions-In", tid_date_time, buff_matrix=buff_matrix)
+
+		#get outgoing debuff and condition uptimes on Enemy Players
+		plan.add(build_debuff_uptime_summary, top_stats, report_buffs["Debuffs-Out"], buff_data, "Debuffs-Out", tid_date_time, buff_matrix=buff_matrix)
+		plan.add(build_debuff_uptime_summary, top_stats, report_buffs["Conditions-Out"], buff_data, "Conditions-Out", tid_date_time, buff_matrix=buff_matrix)
+
+		#get support, defensive and offensive buffs found and output tables
+		for boon_type in ("Support", "Defensive", "Offensive"):
+			plan.add(build_uptime_summary, top_stats, report_buffs[boon_type], buff_data, f"{boon_type} Uptimes", tid_date_time, buff_matrix=buff_matrix)
+			boon_categories = {"selfBuffs", "groupBuffs", "squadBuffs"}
+			for boon_category in boon_categories:
+				plan.add(build_boon_summary, top_stats, report_buffs[boon_type], boon_category, buff_data, tid_date_time, boon_type=boon_type, boon_metrics=boon_metrics)
+
+		#get offensive debuffs found and output table
+		plan.add(build_uptime_summary, top_stats, report_buffs["Debuffs-In"], buff_data, "Debuffs-In", tid_date_time, buff_matrix=buff_matrix)
+
+		#get squad comp and output table
+		plan.add(build_squad_composition, top_stats, tid_date_time, tid_list)
+
+
+		#get heal stats found and output table
+		plan.add(build_healing_summary, top_stats, "Heal Stats", tid_date_time)
+
+		#get personal buffs found and output table
+		plan.add(build_personal_buff_summary, top_stats, buff_data, personal_buff_data, "Personal Buffs", tid_date_time)
+
+		#get profession damage modifiers found and output table
+		plan.add(build_personal_damage_modifier_summary, top_stats, personal_damage_mod_data, damage_mod_data, "Damage Modifiers", tid_date_time)
+
+		#get skill casts by profession and role and output table
+		plan.add(build_skill_cast_summary, top_stats["skill_casts_by_role"], skill_data, "Skill Usage", skill_casts_by_role_limit, tid_date_time)
+
+		plan.add(build_skill_usage_stats_tid, top_stats["skill_casts_by_role"], "Skill Usage", tid_date_time)
+
+		#get overview stats found and output table
+		#overview_stats = config_output.overview_stats
+		plan.add(build_fight_summary, top_stats, fight_data_charts, "Overview", tid_date_time)
+
+		#get combat resurrection stats found and output table
+		plan.add(build_combat_resurrection_stats_tid, top_stats, skill_data, buff_data, IOL_revive, killing_blow_rallies, "Combat Resurrect", tid_date_time)
+
+		#get FB Pages and output table
+		plan.add(build_fb_pages_tid, fb_pages, "FB Pages", tid_date_time)
  
-	build_high_scores_tid(high_scores, skill_data, buff_data, "High Scores", tid_date_time)
+		plan.add(build_high_scores_tid, high_scores, skill_data, buff_data, "High Scores", tid_date_time)
 
-	build_mechanics_tid(mechanics, top_stats['player'], "Mechanics", tid_date_time)
+		plan.add(build_mechanics_tid, mechanics, top_stats['player'], "Mechanics", tid_date_time)
 
-	build_minions_tid(minions, top_stats['player'], skill_data, "Minions", tid_date_time)
+		plan.add(build_minions_tid, minions, top_stats['player'], skill_data, "Minions", tid_date_time)
 
-	build_top_damage_by_skill(top_stats['overall']['totalDamageTaken'], top_stats['overall']['targetDamageDist'], skill_data, buff_data, "Top Damage By Skill", tid_date_time)
+		plan.add(build_top_damage_by_skill, top_stats['overall']['totalDamageTaken'], top_stats['overall']['targetDamageDist'], skill_data, buff_data, "Top Damage By Skill", tid_date_time)
 
 
-	#build_damage_outgoing_by_player_skill_tids
-	build_damage_outgoing_by_skill_tid(tid_date_time, tid_list)
-	build_damage_outgoing_by_player_skill_tids(top_stats, skill_data, buff_data, tid_date_time, tid_list)
+		#build_damage_outgoing_by_player_skill_tids
+		plan.add(build_damage_outgoing_by_skill_tid, tid_date_time, tid_list, shards=player_shards)
+		plan.add(build_damage_outgoing_by_player_skill_tids, top_stats, skill_data, buff_data, tid_date_time, tid_list, shards=player_shards)
 
-	#build_gear_buff_summary
-	gear_buff_ids, gear_skill_ids = extract_gear_buffs_and_skills(buff_data, skill_data)
-	build_gear_buff_summary(top_stats, gear_buff_ids, buff_data, tid_date_time)
-	build_gear_skill_summary(top_stats, gear_skill_ids, skill_data, tid_date_time)
+		#build_gear_buff_summary
+		gear_buff_ids, gear_skill_ids = extract_gear_buffs_and_skills(buff_data, skill_data)
+		plan.add(build_gear_buff_summary, top_stats, gear_buff_ids, buff_data, tid_date_time)
+		plan.add(build_gear_skill_summary, top_stats, gear_skill_ids, skill_data, tid_date_time)
 
-	build_damage_summary_table(top_stats, "Damage", tid_date_time)
+		plan.add(build_damage_summary_table, top_stats, "Damage", tid_date_time)
 
-	build_on_tag_review(death_on_tag, tid_date_time)
+		plan.add(build_on_tag_review, death_on_tag, tid_date_time)
 
-	build_mesmer_clone_usage(mesmer_clone_usage, tid_date_time, tid_list)
+		plan.add(build_mesmer_clone_usage, mesmer_clone_usage, tid_date_time, tid_list)
 
-	profession_color = config_output.profession_color
-	build_support_bubble_chart(top_stats, buff_data, weights, tid_date_time, tid_list, profession_color)
-	build_DPS_bubble_chart(top_stats, tid_date_time, tid_list, profession_color)
-	build_utility_bubble_chart(top_stats, buff_data, weights, tid_date_time, tid_list, profession_color)
-	boons = config_output.boons
-	build_boon_generation_bar_chart(top_stats, boons, weights, tid_date_time, tid_list)
-	conditions = config_output.buffs_conditions
-	build_condition_generation_bar_chart(top_stats, conditions, weights, tid_date_time, tid_list)
+		profession_color = config_output.profession_color
+		plan.add(build_support_bubble_chart, top_stats, buff_data, weights, tid_date_time, tid_list, profession_color)
+		plan.add(build_DPS_bubble_chart, top_stats, tid_date_time, tid_list, profession_color)
+		plan.add(build_utility_bubble_chart, top_stats, buff_data, weights, tid_date_time, tid_list, profession_color)
+		boons = config_output.boons
+		plan.add(build_boon_generation_bar_chart, top_stats, boons, weights, tid_date_time, tid_list, boon_metrics=boon_metrics)
+		conditions = config_output.buffs_conditions
+		plan.add(build_condition_generation_bar_chart, top_stats, conditions, weights, tid_date_time, tid_list)
 
-	build_dps_stats_tids(DPSStats, tid_date_time, tid_list)
-	build_dps_stats_menu(tid_date_time)
+		plan.add(build_dps_stats_tids, DPSStats, tid_date_time, tid_list)
+		plan.add(build_dps_stats_menu, tid_date_time)
 
-	#attendance
-	build_attendance_table(top_stats,tid_date_time, tid_list)
+		#attendance
+		plan.add(build_attendance_table, top_stats,tid_date_time, tid_list)
 
-	build_defense_damage_mitigation(player_damage_mitigation, player_minion_damage_mitigation, top_stats, tid_date_time, tid_list)
+		plan.add(build_defense_damage_mitigation, player_damage_mitigation, player_minion_damage_mitigation, top_stats, tid_date_time, tid_list)
 	
-	build_stacking_buffs(stacking_uptime_Table, top_stats, tid_date_time, tid_list, blacklist)
+		plan.add(build_stacking_buffs, stacking_uptime_Table, top_stats, tid_date_time, tid_list, blacklist)
 
-	build_damage_with_buffs(stacking_uptime_Table, DPSStats, top_stats, tid_date_time, tid_list)
+		plan.add(build_damage_with_buffs, stacking_uptime_Table, DPSStats, top_stats, tid_date_time, tid_list)
 
-	build_pull_stats_tid(tid_date_time, top_stats, skill_data, tid_list)
+		plan.add(build_pull_stats_tid, tid_date_time, top_stats, skill_data, tid_list)
 	
-	#Fight Data line charts
-	if fight_data_charts:
-		build_fight_line_chart(fight_data, tid_date_time, tid_list)
+		#Fight Data line charts
+		if fight_data_charts:
+			plan.add(build_fight_line_chart, fight_data, tid_date_time, tid_list, max_points=fight_chart_points)
+
+		#commander Tag summary
+		if build_commander_summary_menu:
+			plan.add(build_commander_summary, commander_summary_data, skill_data, buff_data, tid_date_time, tid_list)
+			plan.add(build_commander_summary_menu, commander_summary_data, tid_date_time, tid_list)
 
-	#commander Tag summary
-	if build_commander_summary_menu:
-		build_commander_summary(commander_summary_data, skill_data, buff_data, tid_date_time, tid_list)
-		build_commander_summary_menu(commander_summary_data, tid_date_time, tid_list)
+		if report_workers > 0:
+			# Sum the deferred overall stats now rather than on first read from several workers
+			top_stats['overall'].roll_up()
+		plan.run(tid_list, workers=report_workers, pool=report_pool)
 
-	if write_all_data_to_json:
-		output_top_stats_json(top_stats, buff_data, skill_data, damage_mod_data, high_scores, personal_damage_mod_data, personal_buff_data, fb_pages, mechanics, minions, mesmer_clone_usage, death_on_tag, DPSStats, commander_summary_data, enemy_avg_damage_per_skill, player_damage_mitigation, player_minion_damage_mitigation, stacking_uptime_Table, IOL_revive, fight_data, args.json_output_filename)
+		if write_all_data_to_json:
+			output_top_stats_json(top_stats, buff_data, skill_data, damage_mod_data, high_scores, personal_damage_mod_data, personal_buff_data, fb_pages, mechanics, minions, mesmer_clone_usage, death_on_tag, DPSStats, commander_summary_data, enemy_avg_damage_per_skill, player_damage_mitigation, player_minion_damage_mitigation, stacking_uptime_Table, IOL_revive, fight_data, args.json_output_filename)
 
-	if write_excel:
-		write_data_to_excel(top_stats, top_stats['overall']['last_fight'], excel_output_full_path)
+		if write_excel:
+			write_data_to_excel(top_stats, top_stats['overall']['last_fight'], excel_output_full_path)
 		
-	if db_update:
-		write_data_to_db(top_stats, top_stats['overall']['last_fight'], db_output_full_path)
+		if db_update:
+			write_data_to_db(top_stats, top_stats['overall']['last_fight'], db_output_full_path)
 
-		update_glicko_ratings(db_output_full_path)
+			update_glicko_ratings(db_output_full_path, full_rebuild=glicko_full_rebuild)
 
-		leaderboard_stats = config_output.leaderboard_stats
-		build_leaderboard_tids(tid_date_time, leaderboard_stats , tid_list, db_output_full_path)
-		build_leaderboard_menu_tid(tid_date_time, leaderboard_stats, tid_list)
+			write_high_scores_to_db(high_scores, top_stats['fight'], skill_data, db_output_full_path)
 
-		write_high_scores_to_db(high_scores, top_stats['fight'], skill_data, db_output_full_path)
-		build_high_scores_leaderboard_tids(tid_date_time, db_output_full_path)
+			# The leaderboards read the updated database, so they are planned after it is written
+			leaderboard_stats = config_output.leaderboard_stats
+			leaderboard_plan = ReportPlan(profile=report_profile)
+			leaderboard_plan.add(build_leaderboard_tids, tid_date_time, leaderboard_stats , tid_list, db_output_full_path)
+			leaderboard_plan.add(build_leaderboard_menu_tid, tid_date_time, leaderboard_stats, tid_list)
+			leaderboard_plan.add(build_high_scores_leaderboard_tids, tid_date_time, db_output_full_path)
+			leaderboard_plan.run(tid_list)
 
-	write_tid_list_to_json(tid_list, args.output_filename)
+	if html_shell:
+		if not html_output:
+			html_output = os.path.splitext(args.output_filename)[0] + ".html"
+		write_html(html_shell, args.output_filename, html_output)
+		print(f"Wrote single file summary to {html_output}")
 
 	if team_code_missing:
 		print("Missing team codes: " + str(team_code_missing))
@@ -406,7 +442,7 @@ if __name__ == '__main__':
 
 	if webhook_url != "false" and support_profs:
 		discord_colors = config_output.profession_discord_color
-		boon_support_data = build_boon_support_data(top_stats, support_profs, config_output.boons)
+		boon_support_data = build_boon_support_data(top_stats, support_profs, config_output.boons, boon_metrics)
 		profession_icons = config_output.profession_icons
 
 		for profession, support_data in boon_support_data.items():
@@ -416,4 +452,27 @@ if __name__ == '__main__':
 		if not support_profs: 
 			print("No support professions found")
 		if not webhook_url:
-			print("No webhook URL found")
\ No newline at end of file
+			print("No webhook URL found")
+
+
+if __name__ == '__main__':
+	# Lets the frozen executable start the report_pool = process workers
+	multiprocessing.freeze_support()
+
+	parser = argparse.ArgumentParser(
+		description='This reads a set of arcdps reports in xml format and generates top stats.'
+	)
+	parser.add_argument('-i', '--input', dest='input_directory', help='Directory containing .json files from Elite Insights')
+	parser.add_argument('-o', '--output', dest="output_filename", help="Override json file name to write the computed summary")
+	parser.add_argument('-x', '--xls_output', dest="xls_output_filename", help="Override .xls file to write the computed summary")
+	parser.add_argument('-j', '--json_output', dest="json_output_filename", help="Override .json file to write the computed stats data")
+	parser.add_argument('-c', '--config_file', dest="config_file", help="Select a specific config file. Defaults to top_stats_config.ini")
+	parser.add_argument('-d', '--description_append', dest="description_append", help="Appended to the description of the summary caption.")
+	parser.add_argument('-p', '--profile', dest="report_profile", help="Report profile from [ReportProfiles] to build, overrides report_profile of the config file")
+	parser.add_argument('--html_shell', dest="html_shell", help="Top_Stats_Index.html shell to build the summary into a single html file")
+	parser.add_argument('--html_output', dest="html_output", help="Override the single html file name, defaults to the json file name with .html")
+	parser.add_argument('--glicko_full_rebuild', dest="glicko_full_rebuild", action="store_true", help="Recompute the Glicko ratings from the first raid date instead of continuing from the saved rating state")
+
+	args = parser.parse_args()
+
+	run_top_stats(args)
@@ -0,0 +1,79 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+import json
+
+
+# Tiddler type of the dataset tiddlers, read back with $tw.wiki.getTiddlerData()
+DATA_TYPE = "application/json"
+
+
+class ChartDataset:
+	"""Chart data written once as a json data tiddler and shared by the charts plotting it.
+
+	Charts load the dataset in their $echarts option code through
+	`reference()` instead of embedding the rows, so a dataset plotted by
+	several charts, e.g. one per stat or boon, is only output once. Rows are
+	ECharts dataset source rows, with `dimensions` naming their columns, or
+	the rows the chart's own code expects.
+
+	Args:
+		title (str): Title of the data tiddler.
+		caption (str): Caption of the data tiddler.
+		dimensions (list): Names of the row columns, or None when the first
+			row or column of the source holds them.
+	"""
+
+	__slots__ = ("title", "caption", "dimensions", "source")
+
+	def __init__(self, title: str, caption: str, dimensions: list = None) -> None:
+		self.title = title
+		self.caption = caption
+		self.dimensions = list(dimensions) if dimensions is not None else None
+		self.source = []
+
+	def __len__(self) -> int:
+		return len(self.source)
+
+	def append(self, row: list) -> None:
+		self.source.append(row)
+
+	def reference(self) -> str:
+		"""Return the JavaScript expression loading the dataset, {dimensions, source}."""
+		return f"$tw.wiki.getTiddlerData({json.dumps(self.title)})"
+
+	def tiddler(self) -> dict:
+		"""Return the data tiddler holding the dataset as compact json."""
+		data = {}
+		if self.dimensions is not None:
+			data["dimensions"] = self.dimensions
+		data["source"] = self.source
+		return {
+			"title": self.title,
+			"caption": self.caption,
+			"type": DATA_TYPE,
+			"text": json.dumps(data, separators=(",", ":")),
+		}
+
+
+def sort_transform(dimension: str, order: str = "desc") -> str:
+	"""Return an ECharts dataset entry sorting the first dataset by a dimension.
+
+	ECharts sorts stably, so rows with equal values keep their source order.
+	"""
+	return f"{{ transform: {{ type: 'sort', config: {{ dimension: {json.dumps(dimension)}, order: '{order}' }} }} }}"
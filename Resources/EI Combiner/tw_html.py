@@ -0,0 +1,108 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+import argparse
+import json
+import os
+import re
+
+
+# TiddlyWiki 5.2+ keeps its tiddlers in one or more of these json blocks and loads them in order
+STORE_PATTERN = re.compile(r'<script\s+class="tiddlywiki-tiddler-store"[^>]*>.*?</script>', re.DOTALL)
+STORE_OPEN = '<script class="tiddlywiki-tiddler-store" type="application/json">'
+STORE_CLOSE = '</script>'
+LANDING_TITLE = "$:/gw2/landing"
+DEFAULT_LANDING = "Top_Stats_Index"
+
+
+def script_safe(json_text: str) -> str:
+	"""
+	Escape json text for a <script> block.
+
+	"<" can only occur inside json strings, where \\u003C decodes to the same
+	character, so "</script>" in a tiddler can not end the block early.
+	"""
+	return json_text.replace("<", "\\u003C")
+
+def landing_tiddler(title: str) -> dict:
+	"""
+	Return a startup action opening a tiddler, as auto-import.tid did after its import.
+
+	Args:
+		title (str): The tiddler to open.
+	"""
+	return {
+		"title": LANDING_TITLE,
+		"tags": "$:/tags/StartupAction",
+		"type": "text/vnd.tiddlywiki",
+		"text": f'<$action-navigate $to={json.dumps(title)}/>',
+	}
+
+def write_html(shell_filename: str, tiddler_json_filename: str, output_filename: str, landing: str = DEFAULT_LANDING) -> None:
+	"""
+	Write a single file TiddlyWiki of the shell with the drag and drop tiddlers built in.
+
+	The tiddlers are added as a tiddler store after the last store of the
+	shell, so they replace shell tiddlers of the same title just as an import
+	would. The drag and drop json is copied as is, without parsing it again.
+	This replaces the tiddlywiki --load/--import/--build steps of
+	process_logs.bat. The file is written under a temporary name and moved
+	into place once complete.
+
+	Args:
+		shell_filename (str): The Top_Stats_Index.html shell, TiddlyWiki 5.2 or later.
+		tiddler_json_filename (str): The drag and drop json written by tw5_top_stats.
+		output_filename (str): The name of the html file to write.
+		landing (str, optional): Tiddler opened on load, or None to keep the shell's default tiddlers.
+
+	Raises:
+		ValueError: If the shell has no tiddler store.
+	"""
+	with open(shell_filename, encoding="utf-8", newline="") as shell_file:
+		shell = shell_file.read()
+	stores = list(STORE_PATTERN.finditer(shell))
+	if not stores:
+		raise ValueError(f"No tiddler store found in {shell_filename}, the shell must be saved by TiddlyWiki 5.2 or later")
+	insert_at = stores[-1].end()
+
+	with open(tiddler_json_filename, encoding="utf-8") as json_file:
+		tiddler_json = json_file.read()
+
+	partial_filename = output_filename + ".part"
+	with open(partial_filename, "w", encoding="utf-8", newline="") as html_file:
+		html_file.write(shell[:insert_at])
+		html_file.write("\n" + STORE_OPEN + script_safe(tiddler_json) + STORE_CLOSE)
+		if landing:
+			landing_json = json.dumps([landing_tiddler(landing)], sort_keys=True)
+			html_file.write("\n" + STORE_OPEN + script_safe(landing_json) + STORE_CLOSE)
+		html_file.write(shell[insert_at:])
+	os.replace(partial_filename, output_filename)
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(
+		description='Build a single file TiddlyWiki from the Top_Stats_Index.html shell and a drag and drop json.'
+	)
+	parser.add_argument('shell', help='The Top_Stats_Index.html shell')
+	parser.add_argument('tiddlers', help='The drag and drop json written by tw5_top_stats.py')
+	parser.add_argument('output', help='The html file to write')
+	parser.add_argument('-l', '--landing', dest='landing', default=DEFAULT_LANDING, help='Tiddler opened on load. Defaults to Top_Stats_Index, pass "" to keep the shell default')
+
+	args = parser.parse_args()
+
+	write_html(args.shell, args.tiddlers, args.output, args.landing)
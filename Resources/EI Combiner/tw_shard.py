@@ -0,0 +1,121 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+import json
+
+from tw_chart import DATA_TYPE
+
+
+# Macro the player texts use for skill entries, defined by the template
+SKILL_MACRO = "skill"
+
+
+class PlayerShards:
+	"""Per player report texts packed into one json data tiddler per profession.
+
+	Reports with a table per player, e.g. damage by skill, add each player's
+	wikitext with `add()` instead of outputting a tiddler per player. The
+	texts are written as ``{player: text}`` shards titled
+	``{title_prefix}-Data-{profession}``, and a single template tiddler lists
+	them with `select()` and transcludes only the selected players, so the
+	wiki does not parse every player's tables at startup.
+
+	Skill entries, the same image and name for every player using the skill,
+	are written once to ``{title_prefix}-Skills`` and referenced from the
+	texts with the `skill()` macro call.
+
+	Args:
+		title_prefix (str): Leading part of the shard titles, e.g. "{tid_date_time}-Damage-By-Skill".
+	"""
+
+	__slots__ = ("title_prefix", "skills", "shards")
+
+	def __init__(self, title_prefix: str) -> None:
+		self.title_prefix = title_prefix
+		self.skills = {}
+		self.shards = {}
+
+	def __len__(self) -> int:
+		return sum(len(players) for players in self.shards.values())
+
+	@property
+	def skills_title(self) -> str:
+		return f"{self.title_prefix}-Skills"
+
+	def shard_title(self, profession: str) -> str:
+		return f"{self.title_prefix}-Data-{profession}"
+
+	def skill(self, skill_key: str, entry: str) -> str:
+		"""Record a skill's entry and return the macro call rendering it.
+
+		Args:
+			skill_key (str): The skill id, e.g. "s12345".
+			entry (str): The wikitext of the entry, e.g. its image and name.
+		"""
+		self.skills.setdefault(skill_key, entry)
+		return f"<<{SKILL_MACRO} {skill_key}>>"
+
+	def add(self, profession: str, player: str, text: str) -> None:
+		"""Add a player's report text to the shard of their profession."""
+		self.shards.setdefault(profession, {})[player] = text
+
+	def macros(self) -> str:
+		"""Return the macro definitions the template needs, placed at the top of its text."""
+		return f"\\define {SKILL_MACRO}(id) {{{{{self.skills_title}##$id$}}}}\n"
+
+	def select(self, state: str = "$:/temp/selectedPlayer") -> list:
+		"""Return the template rows listing the players and rendering the selected ones.
+
+		Args:
+			state (str): Tiddler qualified to hold the selection.
+		"""
+		return [
+			'\n!!!Select players(ctrl+click):',
+			f'<$let state=<<qualify {state}>>>',
+			'<$select tiddler=<<state>> multiple>',
+			f'   <$list filter="[prefix[{self.title_prefix}-Data-]]" variable="shard">',
+			'   <$list filter="[<shard>indexes[]]" variable="player">',
+			'      <option value={{{ [<shard>addsuffix[##]addsuffix<player>] }}}><$text text={{{ [<shard>get[caption]addsuffix[ - ]addsuffix<player>] }}}/></option>',
+			'   </$list>',
+			'   </$list>',
+			'</$select>',
+			'\n<<vspace height:"55px">>\n',
+			'<div class="flex-row">',
+			'   <$list filter="[<state>get[text]enlist-input[]]">',
+			'    <div class="flex-col">',
+			'      <$transclude tiddler={{{ [<currentTiddler>split[##]first[]] }}} index={{{ [<currentTiddler>split[##]last[]] }}} mode="block"/>',
+			'</div>',
+			'   </$list>',
+			'\n\n</div>',
+		]
+
+	def tiddlers(self) -> list:
+		"""Return the skills data tiddler followed by a shard per profession, as compact json."""
+		tiddlers = [{
+			"title": self.skills_title,
+			"type": DATA_TYPE,
+			"text": json.dumps(self.skills, separators=(",", ":")),
+		}]
+		for profession, players in self.shards.items():
+			tiddlers.append({
+				"title": self.shard_title(profession),
+				"caption": profession,
+				"type": DATA_TYPE,
+				"text": json.dumps(players, separators=(",", ":")),
+			})
+		return tiddlers
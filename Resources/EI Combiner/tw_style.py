@@ -0,0 +1,105 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+# Tag making TiddlyWiki apply a tiddler's CSS to the whole wiki
+STYLESHEET_TAG = "$:/tags/Stylesheet"
+
+# CSS shared by the report tiddlers, by name. Each block is output once as a
+# stylesheet tiddler rather than as a <style> block in every report using it.
+STYLES = {
+	# Radio buttons selecting the stat or boon of the detailed reports
+	"buttons": """.btn {
+  display: inline-block;
+  font-weight: 400;
+  text-align: center;
+  white-space: nowrap;
+  vertical-align: middle;
+  -webkit-user-select: none;
+  -moz-user-select: none;
+  -ms-user-select: none;
+  user-select: none;
+  border: 1px solid transparent;
+  padding: 0.375rem 0.75rem;
+  font-size: 1rem;
+  line-height: 1.5;
+  border-radius: 0.25rem;
+  margin: 1px;
+  transition: color 0.15s ease-in-out, background-color 0.15s ease-in-out, border-color 0.15s ease-in-out, box-shadow 0.15s ease-in-out;
+}
+
+.btn-dark {
+  color: #fff;
+  background-color: #343a40;
+  border-color: #343a40;
+}
+
+.btn-dark:hover {
+  color: #fff;
+  background-color: #23272b;
+  border-color: #1d2124;
+}
+
+.btn-dark:focus, .btn-dark.focus {
+  box-shadow: 0 0 0 0.2rem rgba(52, 58, 64, 0.5);
+}
+
+.btn-dark.disabled, .btn-dark:disabled {
+  color: #fff;
+  background-color: #343a40;
+  border-color: #343a40;
+}
+.btn-sm{
+  padding: 0.2rem 0.4rem;
+  font-size: 0.75rem;
+  line-height: 1.5;
+  border-radius: 0.2rem;
+}
+""",
+	# Column toggles of the summary tables, enabled by hide_columns
+	"col-controls": """.col-controls {
+  display:flex;flex-wrap:wrap;gap:0.3em 0.5em;align-items:center;
+  background:#343a40;color:#eee;border-radius:0.5em;
+  padding:0.6em 1em;margin-bottom:0.8em;font-size:0.9em;
+}
+.col-controls label {
+  display:flex;align-items:center;gap:0.2em;
+  background:#333;padding:0.2em 0.5em;border-radius:0.3em;cursor:pointer;
+  transition:background 0.2s;
+}
+.col-controls label:hover{background:#444;}
+.col-controls input[type="checkbox"]{accent-color:#6cf;}
+""",
+	# Clone state dots of the Mesmer clone usage table
+	"clone-dots": """.dot {height: 10px; width: 10px; background-color: magenta; border-radius: 50%; border: 1px solid darkmagenta; display: inline-block;}
+.cols_3 {column-count: 3;}
+.dot1 {height: 10px; width: 10px; background-color: white; border-radius: 50%; border: 1px solid darkmagenta; display: inline-block;}
+""",
+}
+
+
+def stylesheet_title(name: str) -> str:
+	"""Title of a shared style block's tiddler. It is the same every night, so importing another night replaces it."""
+	return f"$:/gw2/styles/{name}"
+
+
+def stylesheet_tiddlers() -> list:
+	"""Return a stylesheet tiddler for each block of STYLES."""
+	return [
+		{"title": stylesheet_title(name), "tags": STYLESHEET_TAG, "type": "text/css", "text": css}
+		for name, css in STYLES.items()
+	]
@@ -0,0 +1,113 @@
+#    This file contains the configuration for computing the detailed top stats in arcdps logs as parsed by Elite Insights.
+#    Copyright (C) 2024 John Long (Drevarr)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+from operator import itemgetter
+
+
+# Class line opening every sortable TiddlyWiki table
+TABLE_CLASS = "|thead-dark table-caption-top table-hover sortable|k"
+
+TOOLTIP = '<span data-tooltip="{tooltip}">{text}</span>'
+
+
+def _getter(value):
+	"""Return a callable reading a value from a row, from a key or a callable."""
+	if callable(value):
+		return value
+	return itemgetter(value)
+
+
+class Column:
+	"""A column of a TWTable.
+
+	Cell text is written as str.format fields, e.g. "{:,.2f}", with literal
+	braces doubled as in an f-string. A column may read several values, one
+	per field, by passing a tuple of keys or callables.
+
+	Args:
+		header (str): The header cell with its separators, e.g. " !{{Healing}} |".
+		value: Key, callable, or tuple of them, giving the cell values of a row.
+		text (str): Format of the values. Defaults to "{}".
+		cell (str): The cell around the text, "{}" marking where it goes. Defaults to " {}|".
+		tooltip: Optional key or callable giving the tooltip value.
+		tooltip_text (str): Format of the tooltip value. Defaults to "{}".
+		sort_key: Optional key or callable to sort rows by this column. Defaults to the value.
+		name (str): Name to sort by in `TWTable.rows()`. Defaults to the value key.
+	"""
+
+	__slots__ = ("header", "getters", "template", "sort_key", "name")
+
+	def __init__(self, header: str, value, text: str = "{}", cell: str = " {}|", tooltip=None, tooltip_text: str = "{}", sort_key=None, name: str = None) -> None:
+		values = value if isinstance(value, tuple) else (value,)
+		self.header = header
+		self.getters = [_getter(item) for item in values]
+		if tooltip is not None:
+			text = TOOLTIP.format(tooltip=tooltip_text, text=text)
+			self.getters.insert(0, _getter(tooltip))
+		self.template = cell.replace("{}", text, 1)
+		self.sort_key = _getter(sort_key if sort_key is not None else values[0])
+		self.name = name if name is not None else (values[0] if isinstance(values[0], str) else None)
+
+
+class TWTable:
+	"""A TiddlyWiki table whose columns are compiled into one row template.
+
+	The cell formats of all the columns are joined into a single format
+	string when the table is built, so each row is one `str.format()` call
+	over the values read by the column getters instead of a chain of f-string
+	concatenations.
+
+	Args:
+		columns (list): The Column specs, in order.
+		row_start (str): Text opening each row and the header. Defaults to "|".
+	"""
+
+	__slots__ = ("columns", "row_start", "_template", "_getters")
+
+	def __init__(self, columns: list, row_start: str = "|") -> None:
+		self.columns = list(columns)
+		self.row_start = row_start
+		self._template = (row_start + "".join(column.template for column in self.columns)).format
+		self._getters = [getter for column in self.columns for getter in column.getters]
+
+	def header(self, end: str = "h") -> str:
+		"""Return the header row."""
+		return self.row_start + "".join(column.header for column in self.columns) + end
+
+	def row(self, record) -> str:
+		"""Return the row of one record."""
+		return self._template(*[getter(record) for getter in self._getters])
+
+	def rows(self, records, sort_by: str = None, reverse: bool = True) -> list:
+		"""
+		Return the rows of several records.
+
+		Args:
+			records (iterable): The records, one per row.
+			sort_by (str): Name of the column to sort by. Defaults to the given order.
+			reverse (bool): Sort in descending order.
+
+		Returns:
+			list: The rows, ready to be joined with the rest of the tiddler text.
+		"""
+		if sort_by is not None:
+			sort_key = next(column.sort_key for column in self.columns if column.name == sort_by)
+			records = sorted(records, key=sort_key, reverse=reverse)
+		template = self._template
+		getters = self._getters
+		return [template(*[getter(record) for getter in getters]) for record in records]
@@ -2,7 +2,7 @@
 setlocal EnableExtensions EnableDelayedExpansion
 
 rem ==========================================
-rem Process arcDPS logs -> EI JSON -> Drag_and_Drop JSON -> TW5 Auto-Imported HTML
+rem Process arcDPS logs -> EI JSON -> Drag_and_Drop JSON -> TW5 single-file HTML
 rem ==========================================
 
 rem --- Resolve repo root (this script must live at repo root) ---
@@ -163,23 +163,17 @@ if errorlevel 1 (
 )
 
 rem ==========================================================
-rem [4] Auto-import into TiddlyWiki and build single-file HTML
+rem [4] Build single-file HTML from the UI shell and latest JSON
 rem ==========================================================
 
-rem --- Inputs for TiddlyWiki stage ---
-set "TW_BUILD_DIR=%ROOT%Top_Stats_Html"
+rem --- Inputs for the HTML stage ---
 set "TW_SHELL=%ROOT%Resources\EI Combiner\Example_Output\Top_Stats_Index.html"
-set "AUTO_TID=%ROOT%auto-import.tid"
+set "TW_HTML_PY=%ROOT%Resources\EI Combiner\tw_html.py"
 
 rem --- Sanity checks ---
-where tiddlywiki >nul 2>&1
-if errorlevel 1 (
-  echo [ERROR] "tiddlywiki" not found on PATH. Did you run: npm install -g tiddlywiki ?
-  goto :_fail
-)
-
-if not exist "%AUTO_TID%" (
-  echo [ERROR] auto-import.tid not found at: %AUTO_TID%
+if not exist "%TW_SHELL%" (
+  echo [ERROR] UI shell not found:
+  echo         %TW_SHELL%
   goto :_fail
 )
 
@@ -193,70 +187,34 @@ if not exist "%LATEST_DROP_JSON%" (
   goto :_fail
 )
 
-rem --- One-time init of the build wiki (first run only) ---
-if not exist "%TW_BUILD_DIR%" (
-  echo [INFO] Initializing build wiki at: %TW_BUILD_DIR%
-  call tiddlywiki "%TW_BUILD_DIR%" --init server || goto :_fail
-
-  if not exist "%TW_SHELL%" (
-    echo [ERROR] UI shell not found:
-    echo         %TW_SHELL%
-    goto :_fail
-  )
-
-  echo [INFO] Loading UI shell...
-  call tiddlywiki "%TW_BUILD_DIR%" --load "%TW_SHELL%" || goto :_fail
-)
-
-rem --- Always (re)import the startup auto-import action (safe & idempotent)
-echo [INFO] Refreshing startup auto-import action...
-call tiddlywiki "%TW_BUILD_DIR%" --import "%AUTO_TID%" text/plain || goto :_fail
+rem --- Compute date tag robustly ---
+call :compute_date_tag
+echo [INFO] Using date tag: !DATE_TAG!
 
-echo [INFO] Injecting latest JSON into $:/data/dragdrop...
-call tiddlywiki "%TW_BUILD_DIR%" --import "%LATEST_DROP_JSON%" application/json "$:/data/dragdrop" || goto :_fail
+rem --- Final path in Raids_Summaries ---
+set "TW_OUT=%DROP_DIR%\INC_!DATE_TAG!.html"
 
-echo [INFO] Building single-file HTML (target: index)...
-call tiddlywiki "%TW_BUILD_DIR%" --build index || goto :_fail
+rem --- Inject the tiddlers into the shell's tiddler store and write the HTML in one pass ---
+echo [INFO] Building single-file HTML...
+"%PYTHON_EXE%" "%TW_HTML_PY%" "%TW_SHELL%" "%LATEST_DROP_JSON%" "!TW_OUT!" || goto :_fail
 
-set "TW_OUT=%TW_BUILD_DIR%\output\index.html"
-if exist "%TW_OUT%" (
-  echo [OK] Build complete:
-  echo      %TW_OUT%
+if exist "!TW_OUT!" (
+  set "TW_FINAL=!TW_OUT!"
+  echo [OK] Final HTML written to:
+  echo      !TW_FINAL!
 
-  rem --- Compute date tag robustly ---
-  call :compute_date_tag
-  echo [INFO] Using date tag: !DATE_TAG!
-
-  rem --- Final path in Raids_Summaries ---
-  set "TW_FINAL=%DROP_DIR%\INC_!DATE_TAG!.html"
-
-  rem --- Copy then delete original (safer than MOVE if anything goes wrong) ---
-  copy /y "%TW_OUT%" "!TW_FINAL!" >nul
-  if errorlevel 1 (
-    echo [WARN] Copy failed; leaving original at:
-    echo       %TW_OUT%
+  rem --- Discord notify (webhook) ---
+  if exist "%DISCORD_WEBHOOKS_FILE%" (
+    call :notify_discord "!TW_FINAL!" "%DISCORD_WEBHOOKS_FILE%"
   ) else (
-    del /q "%TW_OUT%" >nul 2>&1
-    if exist "!TW_FINAL!" (
-      echo [OK] Final HTML written to:
-      echo      !TW_FINAL!
-
-      rem --- Discord notify (webhook) ---
-      if exist "%DISCORD_WEBHOOKS_FILE%" (
-        call :notify_discord "!TW_FINAL!" "%DISCORD_WEBHOOKS_FILE%"
-      ) else (
-        echo [INFO] Discord webhook file not found at %DISCORD_WEBHOOKS_FILE%; skipping notification.
-        set "DISCORD_POSTED=0"
-        set "DISCORD_REASON=No webhook URL set"
-        for %%F in ("!TW_FINAL!") do set "DISCORD_POSTED_NAME=%%~nxF"
-      )
-    ) else (
-      echo [WARN] Unexpected: final file missing after copy. Check permissions/paths.
-    )
+    echo [INFO] Discord webhook file not found at %DISCORD_WEBHOOKS_FILE%; skipping notification.
+    set "DISCORD_POSTED=0"
+    set "DISCORD_REASON=No webhook URL set"
+    for %%F in ("!TW_FINAL!") do set "DISCORD_POSTED_NAME=%%~nxF"
   )
 ) else (
-  echo [WARN] Build finished but index.html not found where expected:
-  echo       %TW_OUT%
+  echo [WARN] Build finished but the HTML was not found where expected:
+  echo       !TW_OUT!
 )
 
 :_post_cleanup_success